@@ -0,0 +1,65 @@
+"""
+Compare pickling dict classes with their default state to pickling them
+with ``getstate_setstate=True``.
+
+Run it using ``python bench/pickle_dict_classes.py`` from a checkout.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import pickle
+import timeit
+
+import attr
+
+
+N = 100000
+PROTOCOL = min(4, pickle.HIGHEST_PROTOCOL)
+LINE = "  {name}: {mb:.2f} MB, dumps {dumps:.3f}s, loads {loads:.3f}s"
+
+
+@attr.s
+class Default(object):
+    a = attr.ib()
+    b = attr.ib()
+    c = attr.ib()
+    d = attr.ib()
+    e = attr.ib()
+
+
+@attr.s(getstate_setstate=True)
+class Compact(object):
+    a = attr.ib()
+    b = attr.ib()
+    c = attr.ib()
+    d = attr.ib()
+    e = attr.ib()
+
+
+def bench(cls):
+    """
+    Return the size of a pickled list of *N* instances of *cls* and the
+    best times of dumping and loading it.
+    """
+    insts = [cls(i, float(i), str(i), None, True) for i in range(N)]
+    data = pickle.dumps(insts, PROTOCOL)
+    dumps = min(timeit.repeat(lambda: pickle.dumps(insts, PROTOCOL), number=1))
+    loads = min(timeit.repeat(lambda: pickle.loads(data), number=1))
+
+    return len(data), dumps, loads
+
+
+def main():
+    print(
+        "{n} instances with five fields, protocol {p}:".format(n=N, p=PROTOCOL)
+    )
+    for name, cls in (
+        ("default __dict__ state", Default),
+        ("getstate_setstate=True", Compact),
+    ):
+        size, dumps, loads = bench(cls)
+        print(LINE.format(name=name, mb=size / 1e6, dumps=dumps, loads=loads))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ if sys.version_info[:2] < (3, 6):
     collect_ignore.extend(
         [
             "tests/test_annotations.py",
+            "tests/test_async.py",
             "tests/test_hooks.py",
             "tests/test_init_subclass.py",
             "tests/test_next_gen.py",
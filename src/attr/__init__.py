@@ -4,9 +4,20 @@ import sys
 
 from functools import partial
 
-from . import converters, exceptions, filters, setters, validators
+from . import converters, exceptions, filters, serializers, setters, validators
 from ._config import get_run_validators, set_run_validators
-from ._funcs import asdict, assoc, astuple, evolve, has, resolve_types
+from ._funcs import (
+    TaggedUnion,
+    asdict,
+    assoc,
+    astuple,
+    diff,
+    evolve,
+    from_dict,
+    has,
+    patch,
+    resolve_types,
+)
 from ._make import (
     NOTHING,
     Attribute,
@@ -45,6 +56,8 @@ __all__ = [
     "Attribute",
     "Factory",
     "NOTHING",
+    "TaggedUnion",
+    "Table",
     "asdict",
     "assoc",
     "astuple",
@@ -53,24 +66,73 @@ __all__ = [
     "attributes",
     "attrs",
     "converters",
+    "diff",
     "evolve",
     "exceptions",
     "fields",
     "fields_dict",
     "filters",
+    "from_dict",
     "get_run_validators",
     "has",
     "ib",
     "make_class",
+    "pack_many",
+    "patch",
     "resolve_types",
     "s",
+    "serializers",
     "set_run_validators",
     "setters",
+    "to_columns",
+    "unpack_many",
     "validate",
     "validators",
+    "view",
 ]
 
 if sys.version_info[:2] >= (3, 6):
+    from ._async import asdict_async, from_dict_async
     from ._next_gen import define, field, frozen, mutable
 
-    __all__.extend((define, field, frozen, mutable))
+    __all__ += [
+        "asdict_async",
+        "define",
+        "field",
+        "from_dict_async",
+        "frozen",
+        "mutable",
+    ]
+
+if sys.version_info[:2] >= (3, 7):
+    # Rarely used parts of the API are imported when they're first accessed.
+    _lazy = {
+        "Table": "_columns",
+        "pack_many": "_columns",
+        "to_columns": "_columns",
+        "unpack_many": "_columns",
+        "view": "_views",
+    }
+
+    def __getattr__(name):
+        try:
+            module = _lazy[name]
+        except KeyError:
+            raise AttributeError(
+                "module {mod!r} has no attribute {name!r}".format(
+                    mod=__name__, name=name
+                )
+            )
+
+        from importlib import import_module
+
+        rv = globals()[name] = getattr(
+            import_module("." + module, __name__), name
+        )
+
+        return rv
+
+
+else:
+    from ._columns import Table, pack_many, to_columns, unpack_many
+    from ._views import view
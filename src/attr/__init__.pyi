@@ -3,6 +3,8 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -17,6 +19,7 @@ from typing import (
 # `import X as X` is required to make these public
 from . import exceptions as exceptions
 from . import filters as filters
+from . import serializers as serializers
 from . import converters as converters
 from . import setters as setters
 from . import validators as validators
@@ -46,6 +49,7 @@ _OnSetAttrType = Callable[[Any, Attribute[Any], Any], Any]
 _OnSetAttrArgType = Union[
     _OnSetAttrType, List[_OnSetAttrType], setters._NoOpType
 ]
+_ValueSerializerType = Callable[[Any, Optional[Attribute[Any]], Any], Any]
 _FieldTransformer = Callable[[type, List[Attribute]], List[Attribute]]
 # FIXME: in reality, if multiple validators are passed they must be in a list
 # or tuple, but those are invariant and so would prevent subtypes of
@@ -277,6 +281,8 @@ def attrs(
     getstate_setstate: Optional[bool] = ...,
     on_setattr: Optional[_OnSetAttrArgType] = ...,
     field_transformer: Optional[_FieldTransformer] = ...,
+    copy_deepcopy: Optional[bool] = ...,
+    cache_asdict: bool = ...,
 ) -> _C: ...
 @overload
 def attrs(
@@ -302,6 +308,8 @@ def attrs(
     getstate_setstate: Optional[bool] = ...,
     on_setattr: Optional[_OnSetAttrArgType] = ...,
     field_transformer: Optional[_FieldTransformer] = ...,
+    copy_deepcopy: Optional[bool] = ...,
+    cache_asdict: bool = ...,
 ) -> Callable[[_C], _C]: ...
 @overload
 def define(
@@ -325,6 +333,8 @@ def define(
     getstate_setstate: Optional[bool] = ...,
     on_setattr: Optional[_OnSetAttrArgType] = ...,
     field_transformer: Optional[_FieldTransformer] = ...,
+    copy_deepcopy: Optional[bool] = ...,
+    cache_asdict: bool = ...,
 ) -> _C: ...
 @overload
 def define(
@@ -348,6 +358,8 @@ def define(
     getstate_setstate: Optional[bool] = ...,
     on_setattr: Optional[_OnSetAttrArgType] = ...,
     field_transformer: Optional[_FieldTransformer] = ...,
+    copy_deepcopy: Optional[bool] = ...,
+    cache_asdict: bool = ...,
 ) -> Callable[[_C], _C]: ...
 
 mutable = define
@@ -373,6 +385,7 @@ def make_class(
     name: str,
     attrs: Union[List[str], Tuple[str, ...], Dict[str, Any]],
     bases: Tuple[type, ...] = ...,
+    picklable: bool = ...,
     repr_ns: Optional[str] = ...,
     repr: bool = ...,
     cmp: Optional[bool] = ...,
@@ -391,6 +404,8 @@ def make_class(
     collect_by_mro: bool = ...,
     on_setattr: Optional[_OnSetAttrArgType] = ...,
     field_transformer: Optional[_FieldTransformer] = ...,
+    copy_deepcopy: Optional[bool] = ...,
+    cache_asdict: bool = ...,
 ) -> type: ...
 
 # _funcs --
@@ -406,7 +421,9 @@ def asdict(
     filter: Optional[_FilterType[Any]] = ...,
     dict_factory: Type[Mapping[Any, Any]] = ...,
     retain_collection_types: bool = ...,
-    value_serializer: Optional[Callable[[type, Attribute, Any], Any]] = ...,
+    value_serializer: Optional[_ValueSerializerType] = ...,
+    memoize: bool = ...,
+    omit_defaults: bool = ...,
 ) -> Dict[str, Any]: ...
 
 # TODO: add support for returning NamedTuple from the mypy plugin
@@ -416,10 +433,86 @@ def astuple(
     filter: Optional[_FilterType[Any]] = ...,
     tuple_factory: Type[Sequence[Any]] = ...,
     retain_collection_types: bool = ...,
+    omit_defaults: bool = ...,
 ) -> Tuple[Any, ...]: ...
 def has(cls: type) -> bool: ...
 def assoc(inst: _T, **changes: Any) -> _T: ...
 def evolve(inst: _T, **changes: Any) -> _T: ...
+def diff(a: _T, b: _T, recurse: bool = ...) -> Dict[str, Any]: ...
+def patch(inst: _T, changes: Mapping[str, Any]) -> _T: ...
+@overload
+def from_dict(cls: Type[_T], d: Mapping[str, Any]) -> _T: ...
+@overload
+def from_dict(cls: TaggedUnion, d: Mapping[str, Any]) -> Any: ...
+
+class TaggedUnion:
+    key: str
+    def __init__(self, key: str, classes: Iterable[type] = ...) -> None: ...
+    def register(self, cls: _C, tag: Any = ...) -> _C: ...
+    def structure(self, d: Mapping[str, Any]) -> Any: ...
+    def asdict(self, inst: Any, *args: Any, **kw: Any) -> Dict[str, Any]: ...
+
+# _views --
+
+def view(
+    cls: Type[_T],
+    mapping: Mapping[str, Any],
+    convert: bool = ...,
+    validate: bool = ...,
+) -> _T: ...
+
+# _async --
+
+async def asdict_async(
+    inst: Any,
+    filter: Optional[_FilterType[Any]] = ...,
+    dict_factory: Type[Mapping[Any, Any]] = ...,
+    retain_collection_types: bool = ...,
+    value_serializer: Optional[_ValueSerializerType] = ...,
+    omit_defaults: bool = ...,
+    chunk_size: int = ...,
+    time_slice: Optional[float] = ...,
+) -> Dict[str, Any]: ...
+@overload
+async def from_dict_async(
+    cls: Type[_T],
+    d: Mapping[str, Any],
+    chunk_size: int = ...,
+    time_slice: Optional[float] = ...,
+) -> _T: ...
+@overload
+async def from_dict_async(
+    cls: TaggedUnion,
+    d: Mapping[str, Any],
+    chunk_size: int = ...,
+    time_slice: Optional[float] = ...,
+) -> Any: ...
+
+# _columns --
+
+def to_columns(instances: Iterable[Any], cls: type) -> Dict[str, Any]: ...
+
+class Table(Generic[_T]):
+    cls: Type[_T]
+    def __init__(
+        self, cls: Type[_T], instances: Iterable[_T] = ...
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def append(self, inst: _T) -> None: ...
+    def extend(self, instances: Iterable[_T]) -> None: ...
+    def column(self, name: str) -> Any: ...
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+    @overload
+    def __getitem__(self, index: slice) -> Table[_T]: ...
+    def __iter__(self) -> Iterator[Any]: ...
+
+def pack_many(
+    instances: Iterable[_T], cls: Optional[Type[_T]] = ...
+) -> Tuple[Optional[Type[_T]], int, Tuple[Any, ...]]: ...
+def unpack_many(
+    data: Tuple[Optional[Type[_T]], int, Tuple[Any, ...]]
+) -> List[_T]: ...
 
 # _config --
 
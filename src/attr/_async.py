@@ -0,0 +1,297 @@
+"""
+This is a Python 3.6 and later-only API that serializes and structures big
+object graphs without blocking an `asyncio` event loop.
+
+The graph is walked iteratively: every instance and container is a
+generator -- a *frame* -- that yields the frames of its children and
+receives their results.  The driver keeps the frames on an explicit stack
+and yields to the event loop between steps.
+"""
+
+from time import perf_counter
+
+from ._compat import iteritems
+from ._funcs import TaggedUnion, _asdict_config, _from_dict_function, has
+from ._make import NOTHING, _class_cache, _serialized_name, fields
+
+
+async def _run(frame, chunk_size, time_slice):
+    """
+    Run *frame* to completion and return its result.
+
+    Control is handed back to the event loop after every *chunk_size* steps
+    and, if *time_slice* is not ``None``, whenever a step ends more than
+    *time_slice* seconds after the last time it was.
+    """
+    # Importing asyncio is expensive and this module is imported by attr.
+    import asyncio
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+
+    stack = [frame]
+    value = None
+    budget = chunk_size
+    deadline = perf_counter() + time_slice if time_slice is not None else None
+    while True:
+        try:
+            child = stack[-1].send(value)
+        except StopIteration as e:
+            stack.pop()
+            if not stack:
+                return e.value
+            value = e.value
+            continue
+
+        value = None
+        if child is not None:
+            stack.append(child)
+
+        budget -= 1
+        if budget == 0 or (deadline is not None and perf_counter() > deadline):
+            await asyncio.sleep(0)
+            budget = chunk_size
+            if deadline is not None:
+                deadline = perf_counter() + time_slice
+
+
+def _frame(val, config, node, active):
+    """
+    Return the frame that serializes *val* or ``None`` if *val* is a leaf.
+
+    *active* is the set of the ``id()``\\ s of all instances and containers
+    that are being serialized.  Finding *val* in there means that we've run
+    into a reference cycle.
+    """
+    if has(val.__class__):
+        frame = _instance_frame
+    elif isinstance(val, (tuple, list, set, frozenset)):
+        frame = _collection_frame
+    elif isinstance(val, dict):
+        frame = _dict_frame
+    else:
+        return None
+
+    if id(val) in active:
+        raise ValueError(
+            "Circular reference detected while serializing "
+            "{cls!r}.".format(cls=val.__class__)
+        )
+
+    return frame(val, config, node, active)
+
+
+def _leaf(val, config):
+    """
+    Serialize a leaf within a container like `attr._funcs._asdict_anything`.
+    """
+    if config.value_serializer is not None:
+        return config.value_serializer(None, None, val)
+    if config.registry is not None:
+        hook = config.registry._cache.get(val.__class__, NOTHING)
+        if hook is NOTHING:
+            hook = config.registry.dispatch(val.__class__)
+        if hook is not None:
+            return hook(None, None, val)
+
+    return val
+
+
+def _instance_frame(inst, config, node, active):
+    """
+    Serialize the fields of *inst* like `attr._funcs._asdict`.
+    """
+    active.add(id(inst))
+    filter = config.filter
+    value_serializer = config.value_serializer
+    registry = config.registry
+    if registry is not None:
+        hooks = registry._cache
+        unhooked = registry._unhooked_fields(inst.__class__)
+    rv = config.dict_factory()
+    for a, name, check, child in config.plan(inst.__class__, node):
+        v = getattr(inst, a.name)
+        if check is not None and not check(v):
+            continue
+        if filter is not None and not filter(a, v):
+            continue
+
+        if value_serializer is not None:
+            v = value_serializer(inst, a, v)
+        elif registry is not None and a.name not in unhooked:
+            hook = hooks.get(v.__class__, NOTHING)
+            if hook is NOTHING:
+                hook = registry.dispatch(v.__class__)
+            if hook is not None:
+                v = hook(inst, a, v)
+
+        frame = _frame(v, config, child, active)
+        if frame is not None:
+            v = yield frame
+        rv[name] = v
+
+    active.remove(id(inst))
+
+    return rv
+
+
+def _collection_frame(val, config, node, active):
+    """
+    Serialize the items of the collection *val*.
+    """
+    active.add(id(val))
+    cf = val.__class__ if config.retain_collection_types is True else list
+    items = []
+    for i in val:
+        frame = _frame(i, config, node, active)
+        if frame is not None:
+            items.append((yield frame))
+        else:
+            items.append(_leaf(i, config))
+            yield
+
+    active.remove(id(val))
+
+    return cf(items)
+
+
+def _dict_frame(val, config, node, active):
+    """
+    Serialize the keys and values of the dict *val*.
+    """
+    active.add(id(val))
+    items = []
+    for kk, vv in iteritems(val):
+        frame = _frame(kk, config, node, active)
+        kk = (yield frame) if frame is not None else _leaf(kk, config)
+        frame = _frame(vv, config, node, active)
+        vv = (yield frame) if frame is not None else _leaf(vv, config)
+        items.append((kk, vv))
+        yield
+
+    active.remove(id(val))
+
+    return config.dict_factory(items)
+
+
+async def asdict_async(
+    inst,
+    filter=None,
+    dict_factory=dict,
+    retain_collection_types=False,
+    value_serializer=None,
+    omit_defaults=False,
+    chunk_size=1000,
+    time_slice=None,
+):
+    """
+    Return the same dict as `attr.asdict` without blocking the event loop
+    for long.
+
+    The object graph is walked iteratively and control is handed back to
+    the event loop after every *chunk_size* steps.  A step serializes an
+    ``attrs`` instance or an item of a collection.  Pass *time_slice* to
+    additionally yield whenever *time_slice* seconds have passed.
+
+    Walking a graph this way is slower than `attr.asdict`, so only use it
+    for results that are big enough to delay other requests.  The graph
+    must not be changed until the result is complete.
+
+    Instances are always serialized recursively and results of classes with
+    *cache_asdict* are not cached.
+
+    :param filter: See `attr.asdict`.
+    :param dict_factory: See `attr.asdict`.
+    :param retain_collection_types: See `attr.asdict`.
+    :param value_serializer: See `attr.asdict`.
+    :param omit_defaults: See `attr.asdict`.
+    :param int chunk_size: The number of steps between yields.
+    :param float time_slice: The number of seconds between yields.
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *inst* is not an
+        ``attrs`` instance.
+    :raise ValueError: If *inst* contains a reference cycle.
+
+    ..  versionadded:: 21.1.0
+    """
+    config, root = _asdict_config(
+        True,
+        filter,
+        dict_factory,
+        retain_collection_types,
+        value_serializer,
+        False,
+        omit_defaults,
+    )
+    fields(inst.__class__)
+
+    return await _run(
+        _instance_frame(inst, config, root, set()), chunk_size, time_slice
+    )
+
+
+def _nested_fields(cls):
+    """
+    Return a tuple of ``(key, type)`` for every field of *cls* that
+    `attr.from_dict` structures recursively.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["nested_fields"]
+    except KeyError:
+        pass
+
+    nested = tuple(
+        (_serialized_name(a), a.type)
+        for a in fields(cls)
+        if a.init is not False
+        and a.type is not None
+        and (isinstance(a.type, TaggedUnion) or has(a.type))
+    )
+    _class_cache(cls)["nested_fields"] = nested
+
+    return nested
+
+
+def _structure_frame(cls, d):
+    """
+    Structure the nested dicts of *d* first, then *d* itself.
+    """
+    if isinstance(cls, TaggedUnion):
+        cls = cls._class_of(d)
+
+    updates = {}
+    for key, type_ in _nested_fields(cls):
+        if key in d:
+            v = d[key]
+            if isinstance(v, dict):
+                updates[key] = yield _structure_frame(type_, v)
+
+    if updates:
+        d = dict(d)
+        d.update(updates)
+
+    return _from_dict_function(cls)(d)
+
+
+async def from_dict_async(cls, d, chunk_size=1000, time_slice=None):
+    """
+    Return the same instance as `attr.from_dict` without blocking the event
+    loop for long.
+
+    Nested dicts are structured iteratively, innermost first, and control
+    is handed back to the event loop after every *chunk_size* of them.  Pass
+    *time_slice* to additionally yield whenever *time_slice* seconds have
+    passed.
+
+    :param cls: See `attr.from_dict`.
+    :param dict d: See `attr.from_dict`.
+    :param int chunk_size: The number of dicts between yields.
+    :param float time_slice: The number of seconds between yields.
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an
+        ``attrs`` class.
+    :raise KeyError: If a dict lacks the key of a field without a default.
+
+    ..  versionadded:: 21.1.0
+    """
+    return await _run(_structure_frame(cls, d), chunk_size, time_slice)
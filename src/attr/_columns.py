@@ -0,0 +1,346 @@
+"""
+Column-oriented views on collections of ``attrs`` instances.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from array import array
+from operator import attrgetter
+
+from . import _records
+from ._compat import ordered_dict
+from ._make import _class_cache, _obj_setattr, _trusted_constructor, fields
+
+
+try:
+    array("q")
+    _INT_TYPECODE = "q"
+except ValueError:  # pragma: no cover
+    # Python 2 has no long long arrays.
+    _INT_TYPECODE = "l"
+
+_TYPECODES = {int: _INT_TYPECODE, float: "d"}
+_ARRAY_TYPES = {_INT_TYPECODE: int, "d": float}
+
+
+def _typecode(a):
+    """
+    Return the `array.array` typecode for values of *a* or ``None`` if they
+    can't be stored in one.
+    """
+    return _TYPECODES.get(a.type)
+
+
+def _column_plan(cls):
+    """
+    Return a tuple of ``(name, getter, typecode)`` for every field of *cls*.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["column_plan"]
+    except KeyError:
+        plan = tuple(
+            (a.name, attrgetter(a.name), _typecode(a)) for a in fields(cls)
+        )
+        _class_cache(cls)["column_plan"] = plan
+
+        return plan
+
+
+def _to_array(typecode, values):
+    """
+    Pack *values* into an `array.array` of *typecode* if they fit and they
+    are all exactly of its type.
+
+    Arrays would silently turn `bool`\\ s into `int`\\ s and `int`\\ s into
+    `float`\\ s.
+    """
+    if not set(map(type, values)) <= {_ARRAY_TYPES[typecode]}:
+        return values
+
+    try:
+        return array(typecode, values)
+    except OverflowError:
+        return values
+
+
+def to_columns(instances, cls):
+    """
+    Return the attribute values of *instances* as columns.
+
+    :param instances: An iterable of instances of *cls*.
+    :param type cls: An ``attrs``-decorated class.
+
+    :return: A dict of field names to their values in the order of
+        *instances*.  Fields whose type is `int` or `float` are returned as
+        `array.array`\\ s (unless a value doesn't fit or is of another
+        type, like a `bool`), which ``numpy.frombuffer`` can wrap without
+        copying.  All other fields are returned as lists.
+    :rtype: `dict` (`collections.OrderedDict` on Python < 3.6)
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+
+    ..  versionadded:: 21.1.0
+    """
+    plan = _column_plan(cls)
+    if not isinstance(instances, (list, tuple)):
+        instances = list(instances)
+
+    rv = ordered_dict()
+    for name, getter, typecode in plan:
+        column = list(map(getter, instances))
+        if typecode is not None:
+            column = _to_array(typecode, column)
+        rv[name] = column
+
+    return rv
+
+
+def pack_many(instances, cls=None):
+    """
+    Pack *instances* of a single ``attrs`` class into a compact, picklable
+    tuple that `unpack_many` turns back into instances.
+
+    Pickling a list of instances stores a reference to their class and calls
+    ``__reduce_ex__`` for every single instance.  The packed form stores the
+    class once and the field values as columns like `to_columns`, so `int`
+    and `float` fields are pickled as the raw bytes of an `array.array`.
+    That makes it much faster to send big batches of instances to other
+    processes, for example using `multiprocessing`.
+
+    :param instances: An iterable of instances of *cls*.
+    :param type cls: An ``attrs``-decorated class.  Defaults to the class of
+        the first instance.
+
+    :return: A tuple of *cls*, the number of instances, and the columns.
+
+    :raise TypeError: If an item of *instances* is not an instance of
+        exactly *cls*.
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+
+    ..  versionadded:: 21.1.0
+    """
+    if not isinstance(instances, (list, tuple)):
+        instances = list(instances)
+    if cls is None:
+        if not instances:
+            return (None, 0, ())
+        cls = instances[0].__class__
+
+    # Subclasses may have more fields, so they'd be silently truncated.
+    classes = set(map(type, instances))
+    if classes and classes != set((cls,)):
+        raise TypeError(
+            "Only instances of {cls!r} can be packed together, got "
+            "{classes}.".format(
+                cls=cls,
+                classes=", ".join(sorted(repr(c) for c in classes)),
+            )
+        )
+
+    columns = []
+    for _, getter, typecode in _column_plan(cls):
+        column = list(map(getter, instances))
+        if typecode is not None:
+            column = _to_array(typecode, column)
+        columns.append(column)
+
+    return (cls, len(instances), tuple(columns))
+
+
+def unpack_many(data):
+    """
+    Return the list of instances that `pack_many` packed into *data*.
+
+    Like unpickling, the instances are created without calling
+    ``__init__``, so neither converters nor validators nor
+    ``__attrs_post_init__`` run.
+
+    :param tuple data: The result of `pack_many`.
+
+    :rtype: list
+
+    ..  versionadded:: 21.1.0
+    """
+    cls, n, columns = data
+    if not n:
+        return []
+
+    constructor = _trusted_constructor(cls)
+    if not columns:
+        return [constructor() for _ in range(n)]
+
+    return list(map(constructor, *columns))
+
+
+def _row_class(cls):
+    """
+    Return the class of the row views of a `Table` of *cls* instances.
+    """
+    return _records._record_class(cls, _Row, "row_class", _row_properties)
+
+
+def _row_properties(cls):
+    """
+    Return the properties of the row views of *cls*, which look up the
+    values of the fields in their columns.
+    """
+    return dict((a.name, _row_property(i)) for i, a in enumerate(fields(cls)))
+
+
+def _row_property(i):
+    """
+    Return a read-only property for the *i*-th column.
+    """
+
+    def get(self):
+        return self._attrs_columns[i][self._attrs_index]
+
+    return property(get)
+
+
+class _Row(_records._Record):
+    """
+    Base class of the row views of a `Table`.
+    """
+
+    __slots__ = ("_attrs_columns", "_attrs_index")
+
+    def __init__(self, columns, index):
+        _obj_setattr(self, "_attrs_columns", columns)
+        _obj_setattr(self, "_attrs_index", index)
+
+
+class Table(object):
+    """
+    A sequence of instances of an ``attrs`` class *cls* that is stored as one
+    column per field.
+
+    Fields whose type is `int` or `float` are stored in `array.array`\\ s,
+    which need a fraction of the memory of separate objects.  If a value
+    doesn't fit into its array or is of another type, like a `bool`, the
+    column falls back to a list.
+
+    Indexing and iterating return read-only row views that have the fields
+    of *cls* as attributes and compare equal to instances and record views,
+    like the ones of `attr.recordfile.RecordFile`, with the same values.
+    Slicing returns a new `Table`.
+
+    :param type cls: An ``attrs``-decorated class.
+    :param instances: An optional iterable of instances of *cls* to start
+        with.
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+
+    ..  versionadded:: 21.1.0
+    """
+
+    __slots__ = ("cls", "_columns", "_names", "_getter", "_len")
+
+    def __init__(self, cls, instances=()):
+        plan = _column_plan(cls)
+
+        self.cls = cls
+        self._columns = [
+            array(typecode) if typecode is not None else []
+            for _, _, typecode in plan
+        ]
+        self._names = tuple(name for name, _, _ in plan)
+        self._getter = attrgetter(*self._names) if self._names else None
+        self._len = 0
+
+        self.extend(instances)
+
+    def __len__(self):
+        return self._len
+
+    def __repr__(self):
+        return "<attr.Table of {n} {cls} rows>".format(
+            n=self._len, cls=self.cls.__name__
+        )
+
+    def _append_values(self, values):
+        """
+        Append *values* in field order, falling back to lists if necessary.
+        """
+        columns = self._columns
+        for i, v in enumerate(values):
+            col = columns[i]
+            if col.__class__ is array:
+                if v.__class__ is _ARRAY_TYPES[col.typecode]:
+                    try:
+                        col.append(v)
+                        continue
+                    except OverflowError:
+                        pass
+                columns[i] = col = col.tolist()
+            col.append(v)
+
+        self._len += 1
+
+    def append(self, inst):
+        """
+        Append the field values of *inst*.
+        """
+        if self._getter is None:
+            self._len += 1
+        elif len(self._names) == 1:
+            self._append_values((self._getter(inst),))
+        else:
+            self._append_values(self._getter(inst))
+
+    def extend(self, instances):
+        """
+        Append the field values of all *instances*.
+        """
+        if not isinstance(instances, (list, tuple)):
+            instances = list(instances)
+
+        plan = _column_plan(self.cls)
+        new = [list(map(getter, instances)) for _, getter, _ in plan]
+        for i, values in enumerate(new):
+            col = self._columns[i]
+            if isinstance(col, array):
+                values = _to_array(col.typecode, values)
+                if not isinstance(values, array):
+                    self._columns[i] = col = col.tolist()
+            col.extend(values)
+
+        self._len += len(instances)
+
+    def column(self, name):
+        """
+        Return the column of the field *name*.
+
+        The column is either an `array.array` or a `list` and must not be
+        resized.
+
+        :raise KeyError: If *cls* has no field called *name*.
+        """
+        try:
+            return self._columns[self._names.index(name)]
+        except ValueError:
+            raise KeyError(name)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            rv = Table(self.cls)
+            rv._columns = [col[index] for col in self._columns]
+            rv._len = len(range(*index.indices(self._len)))
+
+            return rv
+
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("Table index out of range")
+
+        return _row_class(self.cls)(self._columns, index)
+
+    def __iter__(self):
+        row_class = _row_class(self.cls)
+        columns = self._columns
+        for i in range(self._len):
+            yield row_class(columns, i)
@@ -10,6 +10,12 @@ PY2 = sys.version_info[0] == 2
 PYPY = platform.python_implementation() == "PyPy"
 
 
+try:
+    from pickle import PickleBuffer
+except ImportError:  # Python < 3.8
+    PickleBuffer = None
+
+
 if PYPY or sys.version_info[:2] >= (3, 6):
     ordered_dict = dict
 else:
@@ -20,6 +26,7 @@ else:
 
 if PY2:
     from collections import Mapping, Sequence
+    from itertools import imap
 
     from UserDict import IterableUserDict
 
@@ -31,6 +38,8 @@ if PY2:
     # TYPE is used in exceptions, repr(int) is different on Python 2 and 3.
     TYPE = "type"
 
+    string_types = (str, unicode)  # noqa: F821
+
     def iteritems(d):
         return d.iteritems()
 
@@ -101,6 +110,8 @@ if PY2:
 else:  # Python 3 and later.
     from collections.abc import Mapping, Sequence  # noqa
 
+    imap = map
+
     def just_warn(*args, **kw):
         """
         We only warn on Python 3 because we are not aware of any concrete
@@ -119,6 +130,8 @@ else:  # Python 3 and later.
 
     TYPE = "class"
 
+    string_types = (str,)
+
     def iteritems(d):
         return d.items()
 
@@ -2,9 +2,27 @@ from __future__ import absolute_import, division, print_function
 
 import copy
 
+from . import _config
 from ._compat import iteritems
-from ._make import NOTHING, _obj_setattr, fields
+from ._make import (
+    _ATOMIC_TYPES,
+    NOTHING,
+    Factory,
+    _asdict_cache_field,
+    _AsDictCache,
+    _class_cache,
+    _default_checks,
+    _generate_unique_filename,
+    _make_methods,
+    _obj_setattr,
+    _omit_defaults,
+    _serialized_name,
+    _trusted_constructor,
+    fields,
+)
 from .exceptions import AttrsAttributeNotFoundError
+from .filters import _Filter
+from .serializers import Registry
 
 
 def asdict(
@@ -14,19 +32,28 @@ def asdict(
     dict_factory=dict,
     retain_collection_types=False,
     value_serializer=None,
+    memoize=False,
+    omit_defaults=False,
 ):
     """
     Return the ``attrs`` attribute values of *inst* as a dict.
 
     Optionally recurse into other ``attrs``-decorated classes.
 
+    The keys are the names of the attributes unless a field has an
+    ``alias`` in its *metadata*, like ``attr.ib(metadata={"alias":
+    "firstName"})``.  The keys are computed once per class.  `from_dict`
+    is the counterpart that reads them.
+
     :param inst: Instance of an ``attrs``-decorated class.
     :param bool recurse: Recurse into classes that are also
         ``attrs``-decorated.
     :param callable filter: A callable whose return code determines whether an
         attribute or element is included (``True``) or dropped (``False``).  Is
         called with the `attr.Attribute` as the first argument and the
-        value as the second argument.
+        value as the second argument.  The filters from `attr.filters` are
+        evaluated only once per class wherever the decision doesn't depend
+        on the value.
     :param callable dict_factory: A callable to produce dictionaries from.  For
         example, to produce ordered dictionaries instead of normal Python
         dictionaries, pass in ``collections.OrderedDict``.
@@ -36,140 +63,612 @@ def asdict(
     :param Optional[callable] value_serializer: A hook that is called for every
         attribute or dict key/value.  It receives the current instance, field
         and value and must return the (updated) value.  The hook is run *after*
-        the optional *filter* has been applied.
+        the optional *filter* has been applied.  If it's an
+        `attr.serializers.Registry`, values whose type has no hook are
+        passed through without any call.
+    :param bool memoize: Serialize every ``attrs`` instance only once, no
+        matter how often it is referenced within *inst*.  All references to
+        the same instance share the *same* produced dict, so object graphs
+        with shared subtrees are serialized in time and memory proportional
+        to the number of distinct instances.  Only meaningful if ``recurse``
+        is ``True``.
+    :param bool omit_defaults: Leave out fields whose value equals their
+        default.  Values are compared using ``is`` if the default is ``None``
+        or a `bool`, using ``==`` if it's an immutable builtin of the same
+        class, and using ``is`` otherwise.  Empty collections are left out
+        if the field's default is a factory like `list` or `dict`.  Fields
+        with other factories are always kept.  How to compare is decided
+        once per field.
 
     :rtype: return type of *dict_factory*
 
     :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
         class.
+    :raise ValueError: If *memoize* is ``True`` and *inst* contains a
+        reference cycle.
 
     ..  versionadded:: 16.0.0 *dict_factory*
     ..  versionadded:: 16.1.0 *retain_collection_types*
     ..  versionadded:: 20.3.0 *value_serializer*
+    ..  versionadded:: 21.1.0 *memoize*
+    ..  versionadded:: 21.1.0 *omit_defaults*
+    ..  versionchanged:: 21.1.0
+       *value_serializer* can be an `attr.serializers.Registry`.
+    ..  versionchanged:: 21.1.0
+       Static decisions of filters from `attr.filters` are cached per class.
+    ..  versionchanged:: 21.1.0
+       Results for instances of classes with *cache_asdict* are cached.
+    ..  versionchanged:: 21.1.0
+       Fields with an ``alias`` in their *metadata* are stored under it.
     """
-    attrs = fields(inst.__class__)
-    rv = dict_factory()
-    for a in attrs:
+    config, root = _asdict_config(
+        recurse,
+        filter,
+        dict_factory,
+        retain_collection_types,
+        value_serializer,
+        memoize,
+        omit_defaults,
+    )
+    rv = _asdict(inst, config, root)
+    if config.cache_key:
+        # Results from caches must never be handed out themselves.
+        rv = _copy_result(rv)
+
+    return rv
+
+
+def _asdict_config(
+    recurse,
+    filter,
+    dict_factory,
+    retain_collection_types,
+    value_serializer,
+    memoize,
+    omit_defaults,
+):
+    """
+    Return the `_AsDictConfig` for the arguments of `asdict` and the root
+    node of the filter paths.
+    """
+    if isinstance(filter, _Filter):
+        if omit_defaults is True:
+            plan = filter._plan_omitting_defaults
+        else:
+            plan = filter._plan
+        root, filter = filter._paths, None
+    elif omit_defaults is True:
+        plan, root = _plain_plan_omitting_defaults, None
+    else:
+        plan, root = _plain_plan, None
+
+    if isinstance(value_serializer, Registry):
+        registry, value_serializer = value_serializer, None
+    else:
+        registry = None
+
+    config = _AsDictConfig(
+        recurse,
+        filter,
+        plan,
+        dict_factory,
+        retain_collection_types,
+        value_serializer,
+        registry,
+        {} if memoize is True else None,
+    )
+
+    return config, root
+
+
+def _plain_plan(cls, node):
+    """
+    The plan of *cls* for unfiltered serialization.
+
+    Compatible with `attr.filters._Filter._plan`.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["plain_plan"]
+    except KeyError:
+        plan = tuple((a, _serialized_name(a), None, None) for a in fields(cls))
+        _class_cache(cls)["plain_plan"] = plan
+
+        return plan
+
+
+def _plain_plan_omitting_defaults(cls, node):
+    """
+    `_plain_plan` with checks that drop values that equal the default.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["plain_plan_omitting_defaults"]
+    except KeyError:
+        plan = _omit_defaults(cls, _plain_plan(cls, node))
+        _class_cache(cls)["plain_plan_omitting_defaults"] = plan
+
+        return plan
+
+
+class _AsDictConfig(object):
+    """
+    The options of one `asdict` call.
+
+    *filter* is only set for filters that have to be called for every value,
+    the static parts of filters from `attr.filters` are part of *plan*.
+    Similarly, *value_serializer* is ``None`` if it's an
+    `attr.serializers.Registry` which is stored as *registry* instead.
+
+    If *memo* is not ``None``, it's a dict mapping the ``id()`` of every
+    instance seen so far and its position within the paths of the filter to
+    a tuple of the instance and its result.  The
+    instance is kept in there to make sure its ``id()`` can't be reused while
+    we're still serializing.  A result of ``None`` marks an instance that is
+    currently being serialized and therefore a cycle.
+
+    *cache_key* is ``None`` until a class with *cache_asdict* is serialized.
+    Then it's the key of this configuration in the instance caches, or
+    `False` if the configuration can't be cached.
+    """
+
+    __slots__ = (
+        "recurse",
+        "filter",
+        "plan",
+        "dict_factory",
+        "retain_collection_types",
+        "value_serializer",
+        "registry",
+        "memo",
+        "cache_key",
+    )
+
+    def __init__(
+        self,
+        recurse,
+        filter,
+        plan,
+        dict_factory,
+        retain_collection_types,
+        value_serializer,
+        registry,
+        memo,
+    ):
+        self.recurse = recurse
+        self.filter = filter
+        self.plan = plan
+        self.dict_factory = dict_factory
+        self.retain_collection_types = retain_collection_types
+        self.value_serializer = value_serializer
+        self.registry = registry
+        self.memo = memo
+        self.cache_key = None
+
+    def _make_cache_key(self):
+        """
+        Return a hashable key for the options or `False`.
+
+        Arbitrary filters and value serializers are never cached because
+        they're often created for each call.
+        """
+        if (
+            self.memo is not None
+            or self.filter is not None
+            or self.value_serializer is not None
+        ):
+            return False
+
+        key = (
+            self.recurse,
+            self.filter,
+            self.plan,
+            self.dict_factory,
+            self.retain_collection_types,
+            self.value_serializer,
+            self.registry,
+            self.registry._version if self.registry is not None else None,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return False
+
+        return key
+
+
+def _asdict(inst, config, node, use_cache=True):
+    """
+    Worker for `asdict`.
+
+    *node* is the position of *inst* within the paths of the filter.
+    """
+    if use_cache and getattr(inst.__class__, "__attrs_cache_asdict__", False):
+        cache_key = config.cache_key
+        if cache_key is None:
+            cache_key = config.cache_key = config._make_cache_key()
+        if cache_key is not False:
+            return _cached_asdict(inst, config, node, cache_key)
+
+    memo = config.memo
+    if memo is not None:
+        # The same instance is serialized differently at other positions.
+        key = (id(inst), node)
+        seen = memo.get(key)
+        if seen is not None:
+            if seen[1] is None:
+                raise ValueError(
+                    "Circular reference detected while serializing "
+                    "{cls!r}.".format(cls=inst.__class__)
+                )
+            return seen[1]
+        memo[key] = (inst, None)
+
+    filter = config.filter
+    value_serializer = config.value_serializer
+    registry = config.registry
+    if registry is not None:
+        hooks = registry._cache
+        unhooked = registry._unhooked_fields(inst.__class__)
+    recurse = config.recurse
+    rv = config.dict_factory()
+    for a, name, check, child in config.plan(inst.__class__, node):
         v = getattr(inst, a.name)
+        if check is not None and not check(v):
+            continue
         if filter is not None and not filter(a, v):
             continue
 
         if value_serializer is not None:
             v = value_serializer(inst, a, v)
+        elif registry is not None and a.name not in unhooked:
+            hook = hooks.get(v.__class__, NOTHING)
+            if hook is NOTHING:
+                hook = registry.dispatch(v.__class__)
+            if hook is not None:
+                v = hook(inst, a, v)
 
         if recurse is True:
             if has(v.__class__):
-                rv[a.name] = asdict(
-                    v,
-                    True,
-                    filter,
-                    dict_factory,
-                    retain_collection_types,
-                    value_serializer,
-                )
+                rv[name] = _asdict(v, config, child)
             elif isinstance(v, (tuple, list, set, frozenset)):
-                cf = v.__class__ if retain_collection_types is True else list
-                rv[a.name] = cf(
-                    [
-                        _asdict_anything(
-                            i,
-                            filter,
-                            dict_factory,
-                            retain_collection_types,
-                            value_serializer,
-                        )
-                        for i in v
-                    ]
+                cf = (
+                    v.__class__
+                    if config.retain_collection_types is True
+                    else list
                 )
+                rv[name] = cf([_asdict_anything(i, config, child) for i in v])
             elif isinstance(v, dict):
-                df = dict_factory
-                rv[a.name] = df(
+                rv[name] = config.dict_factory(
                     (
-                        _asdict_anything(
-                            kk,
-                            filter,
-                            df,
-                            retain_collection_types,
-                            value_serializer,
-                        ),
-                        _asdict_anything(
-                            vv,
-                            filter,
-                            df,
-                            retain_collection_types,
-                            value_serializer,
-                        ),
+                        _asdict_anything(kk, config, child),
+                        _asdict_anything(vv, config, child),
                     )
                     for kk, vv in iteritems(v)
                 )
             else:
-                rv[a.name] = v
+                rv[name] = v
         else:
-            rv[a.name] = v
+            rv[name] = v
+
+    if memo is not None:
+        memo[key] = (inst, rv)
+
     return rv
 
 
-def _asdict_anything(
-    val,
-    filter,
-    dict_factory,
-    retain_collection_types,
-    value_serializer,
-):
+# The number of results cached per instance.
+_ASDICT_CACHE_SIZE = 8
+
+
+def _cached_asdict(inst, config, node, cache_key):
+    """
+    Serialize *inst* using the cache of its results.
+    """
+    try:
+        cache = getattr(inst, _asdict_cache_field)
+    except AttributeError:
+        cache = _AsDictCache()
+        _obj_setattr(inst, _asdict_cache_field, cache)
+
+    key = (cache_key, node)
+    try:
+        return cache[key]
+    except KeyError:
+        if len(cache) >= _ASDICT_CACHE_SIZE:
+            # Filters from attr.filters are usually created once, but
+            # nothing prevents callers from creating one for each call.
+            cache.clear()
+        rv = cache[key] = _asdict(inst, config, node, False)
+
+        return rv
+
+
+def _copy_result(val):
+    """
+    Copy the containers in an `asdict` result.
+
+    The values themselves aren't copied, just like `asdict` doesn't copy
+    them.
+    """
+    cls = val.__class__
+    if cls is dict or (cls not in _ATOMIC_TYPES and isinstance(val, dict)):
+        rv = val.copy() if cls is dict else copy.copy(val)
+        for k, v in iteritems(val):
+            if v.__class__ not in _ATOMIC_TYPES:
+                rv[k] = _copy_result(v)
+        return rv
+
+    if cls is list or isinstance(val, (list, tuple, set, frozenset)):
+        return cls(
+            [
+                v if v.__class__ in _ATOMIC_TYPES else _copy_result(v)
+                for v in val
+            ]
+        )
+
+    return val
+
+
+def _asdict_anything(val, config, node):
     """
     ``asdict`` only works on attrs instances, this works on anything.
     """
     if getattr(val.__class__, "__attrs_attrs__", None) is not None:
         # Attrs class.
-        rv = asdict(
-            val,
-            True,
-            filter,
-            dict_factory,
-            retain_collection_types,
-            value_serializer,
-        )
+        rv = _asdict(val, config, node)
     elif isinstance(val, (tuple, list, set, frozenset)):
-        cf = val.__class__ if retain_collection_types is True else list
-        rv = cf(
-            [
-                _asdict_anything(
-                    i,
-                    filter,
-                    dict_factory,
-                    retain_collection_types,
-                    value_serializer,
-                )
-                for i in val
-            ]
-        )
+        cf = val.__class__ if config.retain_collection_types is True else list
+        rv = cf([_asdict_anything(i, config, node) for i in val])
     elif isinstance(val, dict):
-        df = dict_factory
-        rv = df(
+        rv = config.dict_factory(
             (
-                _asdict_anything(
-                    kk, filter, df, retain_collection_types, value_serializer
-                ),
-                _asdict_anything(
-                    vv, filter, df, retain_collection_types, value_serializer
-                ),
+                _asdict_anything(kk, config, node),
+                _asdict_anything(vv, config, node),
             )
             for kk, vv in iteritems(val)
         )
     else:
         rv = val
-        if value_serializer is not None:
-            rv = value_serializer(None, None, rv)
+        if config.value_serializer is not None:
+            rv = config.value_serializer(None, None, rv)
+        elif config.registry is not None:
+            hook = config.registry._cache.get(val.__class__, NOTHING)
+            if hook is NOTHING:
+                hook = config.registry.dispatch(val.__class__)
+            if hook is not None:
+                rv = hook(None, None, rv)
 
     return rv
 
 
+def from_dict(cls, d):
+    """
+    Create an instance of *cls* from the dict *d*.
+
+    The counterpart of `asdict`: the value of each field that is part of
+    ``__init__`` is looked up under the same key that `asdict` uses --
+    the ``alias`` in the field's *metadata* if there is one, its name
+    otherwise.  Values of fields whose type is an ``attrs`` class or an
+    `attr.TaggedUnion` are structured recursively if they are dicts, all
+    other values are passed to ``__init__`` as they are.  Keys that don't
+    belong to a field are ignored.
+
+    The lookups are compiled once per class.
+
+    :param cls: An ``attrs``-decorated class or an `attr.TaggedUnion` to
+        pick the class from.
+    :param dict d: The dict to structure.
+
+    :rtype: *cls*
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+    :raise KeyError: If *d* lacks the key of a field without a default.
+
+    ..  versionadded:: 21.1.0
+    """
+    if isinstance(cls, TaggedUnion):
+        return cls.structure(d)
+
+    return _from_dict_function(cls)(d)
+
+
+def _structure(cls, value):
+    """
+    Structure *value* into an instance of *cls* if it's a dict.
+    """
+    if isinstance(value, dict):
+        return from_dict(cls, value)
+
+    return value
+
+
+def _from_dict_function(cls):
+    """
+    Return the compiled `from_dict` of *cls*.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["from_dict"]
+    except KeyError:
+        pass
+
+    globs = {"_attrs_cls": cls, "_attrs_structure": _structure}
+    args = []
+    optional = []
+    for a in fields(cls):
+        if a.init is False:
+            continue
+
+        arg_name = a.name.lstrip("_")
+        key = _serialized_name(a)
+        if a.type is not None and (
+            isinstance(a.type, TaggedUnion) or has(a.type)
+        ):
+            type_name = "_attrs_type_" + arg_name
+            globs[type_name] = a.type
+            value = "_attrs_structure(%s, d[%r])" % (type_name, key)
+        else:
+            value = "d[%r]" % (key,)
+
+        if a.default is NOTHING:
+            args.append("%s=%s" % (arg_name, value))
+        else:
+            optional.extend(
+                [
+                    "    if %r in d:" % (key,),
+                    "        kw[%r] = %s" % (arg_name, value),
+                ]
+            )
+
+    if optional:
+        lines = ["    kw = {}"] + optional
+        args.append("**kw")
+    else:
+        lines = []
+
+    script = "\n".join(
+        ["def from_dict(d):"]
+        + lines
+        + ["    return _attrs_cls(%s)" % (", ".join(args),)]
+    )
+    filename = _generate_unique_filename(cls, "from_dict")
+    fn = _make_methods(script, filename, globs)["from_dict"]
+    _class_cache(cls)["from_dict"] = fn
+
+    return fn
+
+
+class TaggedUnion(object):
+    """
+    A set of ``attrs`` classes whose dicts are told apart by the value of
+    the key *key*, their tag.
+
+    The tag of a class is the default of its field that has ``tag`` set to
+    ``True`` in its *metadata* and is stored under *key* by `asdict`.  Such
+    a field is usually not part of ``__init__``::
+
+        kind = attr.ib(default="circle", init=False, metadata={"tag": True})
+
+    Classes without such a field can be registered with an explicit tag
+    that `TaggedUnion.asdict` adds to their dicts.
+
+    Structuring looks the class up by the tag in a dict and uses the
+    compiled `from_dict` of the class, so it takes the same time no matter
+    how many classes are registered.  Pass a `TaggedUnion` to `from_dict`
+    or use it as the ``type`` of a field to structure nested values.
+
+    :param str key: The key of the tag in the dicts.
+    :param classes: ``attrs`` classes with tag fields to register.
+
+    ..  versionadded:: 21.1.0
+    """
+
+    __slots__ = ("key", "_classes", "_explicit_tags")
+
+    def __init__(self, key, classes=()):
+        self.key = key
+        self._classes = {}
+        self._explicit_tags = {}
+        for cls in classes:
+            self.register(cls)
+
+    def __repr__(self):
+        return "<attr.TaggedUnion on {key!r} with {n} classes>".format(
+            key=self.key, n=len(self._classes)
+        )
+
+    def register(self, cls, tag=NOTHING):
+        """
+        Register *cls* under *tag*.
+
+        :param type cls: An ``attrs``-decorated class.
+        :param tag: The tag of *cls*.  Must only be passed if *cls* has no
+            tag field.
+
+        :return: *cls*, so `register` can be used as a class decorator.
+
+        :raise ValueError: If *cls* has no tag field and no *tag* is passed,
+            if its tag field has no default or a key other than *key*, or if
+            the tag is taken.
+        """
+        tag_fields = [a for a in fields(cls) if a.metadata.get("tag") is True]
+        if tag_fields:
+            a = tag_fields[0]
+            if tag is not NOTHING:
+                raise ValueError(
+                    "{cls!r} has a tag field, don't pass a tag.".format(
+                        cls=cls
+                    )
+                )
+            if _serialized_name(a) != self.key:
+                raise ValueError(
+                    "The tag field {name!r} of {cls!r} is not stored under "
+                    "{key!r}.".format(name=a.name, cls=cls, key=self.key)
+                )
+            tag = a.default
+            if tag is NOTHING or isinstance(tag, Factory):
+                raise ValueError(
+                    "The tag field {name!r} of {cls!r} needs a default "
+                    "value.".format(name=a.name, cls=cls)
+                )
+        elif tag is NOTHING:
+            raise ValueError(
+                "{cls!r} has no tag field, pass a tag.".format(cls=cls)
+            )
+        else:
+            self._explicit_tags[cls] = tag
+
+        if tag in self._classes:
+            raise ValueError(
+                "The tag {tag!r} is already taken by {cls!r}.".format(
+                    tag=tag, cls=self._classes[tag]
+                )
+            )
+        self._classes[tag] = cls
+
+        return cls
+
+    def structure(self, d):
+        """
+        Create an instance of the class whose tag is stored under *key* in
+        the dict *d*.
+
+        :raise ValueError: If *d* has no or an unknown tag.
+        """
+        return _from_dict_function(self._class_of(d))(d)
+
+    def _class_of(self, d):
+        """
+        Return the class whose tag is stored in *d*.
+        """
+        try:
+            return self._classes[d[self.key]]
+        except KeyError:
+            raise ValueError(
+                "Unknown or missing tag {key!r} in {d!r}.".format(
+                    key=self.key, d=d
+                )
+            )
+
+    def asdict(self, inst, *args, **kw):
+        """
+        Like `attr.asdict` but adds the tag if the class of *inst* has no
+        tag field.
+        """
+        rv = asdict(inst, *args, **kw)
+        tag = self._explicit_tags.get(inst.__class__, NOTHING)
+        if tag is not NOTHING:
+            rv[self.key] = tag
+
+        return rv
+
+
 def astuple(
     inst,
     recurse=True,
     filter=None,
     tuple_factory=tuple,
     retain_collection_types=False,
+    omit_defaults=False,
 ):
     """
     Return the ``attrs`` attribute values of *inst* as a tuple.
@@ -182,13 +681,18 @@ def astuple(
     :param callable filter: A callable whose return code determines whether an
         attribute or element is included (``True``) or dropped (``False``).  Is
         called with the `attr.Attribute` as the first argument and the
-        value as the second argument.
+        value as the second argument.  The filters from `attr.filters` are
+        evaluated only once per class wherever the decision doesn't depend
+        on the value.
     :param callable tuple_factory: A callable to produce tuples from.  For
         example, to produce lists instead of tuples.
     :param bool retain_collection_types: Do not convert to ``list``
         or ``dict`` when encountering an attribute which type is
         ``tuple``, ``dict`` or ``set``.  Only meaningful if ``recurse`` is
         ``True``.
+    :param bool omit_defaults: Leave out trailing fields whose value equals
+        their default, like `asdict` does.  Fields in the middle are always
+        kept so the positions stay intact.
 
     :rtype: return type of *tuple_factory*
 
@@ -196,23 +700,65 @@ def astuple(
         class.
 
     ..  versionadded:: 16.2.0
+    ..  versionadded:: 21.1.0 *omit_defaults*
+    ..  versionchanged:: 21.1.0
+       Static decisions of filters from `attr.filters` are cached per class.
     """
-    attrs = fields(inst.__class__)
+    if isinstance(filter, _Filter):
+        plan, root, filter = filter._plan, filter._paths, None
+    else:
+        plan, root = _plain_plan, None
+
+    return _astuple(
+        inst,
+        recurse,
+        filter,
+        plan,
+        tuple_factory,
+        retain_collection_types,
+        root,
+        omit_defaults,
+    )
+
+
+def _astuple(
+    inst,
+    recurse,
+    filter,
+    plan,
+    tuple_factory,
+    retain,
+    node=None,
+    omit_defaults=False,
+):
+    """
+    Worker for `astuple`.
+
+    *filter* and *plan* have the same meaning as in `_AsDictConfig`.
+    """
+    rows = plan(inst.__class__, node)
+    if omit_defaults is True:
+        rows = _without_trailing_defaults(inst, filter, rows)
+
     rv = []
-    retain = retain_collection_types  # Very long. :/
-    for a in attrs:
+    for a, _, check, child in rows:
         v = getattr(inst, a.name)
+        if check is not None and not check(v):
+            continue
         if filter is not None and not filter(a, v):
             continue
         if recurse is True:
             if has(v.__class__):
                 rv.append(
-                    astuple(
+                    _astuple(
                         v,
-                        recurse=True,
-                        filter=filter,
-                        tuple_factory=tuple_factory,
-                        retain_collection_types=retain,
+                        True,
+                        filter,
+                        plan,
+                        tuple_factory,
+                        retain,
+                        child,
+                        omit_defaults,
                     )
                 )
             elif isinstance(v, (tuple, list, set, frozenset)):
@@ -220,12 +766,15 @@ def astuple(
                 rv.append(
                     cf(
                         [
-                            astuple(
+                            _astuple(
                                 j,
-                                recurse=True,
-                                filter=filter,
-                                tuple_factory=tuple_factory,
-                                retain_collection_types=retain,
+                                True,
+                                filter,
+                                plan,
+                                tuple_factory,
+                                retain,
+                                child,
+                                omit_defaults,
                             )
                             if has(j.__class__)
                             else j
@@ -242,6 +791,7 @@ def astuple(
                                 kk,
                                 tuple_factory=tuple_factory,
                                 retain_collection_types=retain,
+                                omit_defaults=omit_defaults,
                             )
                             if has(kk.__class__)
                             else kk,
@@ -249,6 +799,7 @@ def astuple(
                                 vv,
                                 tuple_factory=tuple_factory,
                                 retain_collection_types=retain,
+                                omit_defaults=omit_defaults,
                             )
                             if has(vv.__class__)
                             else vv,
@@ -264,6 +815,25 @@ def astuple(
     return rv if tuple_factory is list else tuple_factory(rv)
 
 
+def _without_trailing_defaults(inst, filter, plan):
+    """
+    Return the rows of *plan* without the trailing ones whose values of
+    *inst* are either dropped or equal their defaults.
+    """
+    checks = _default_checks(inst.__class__)
+    end = len(plan)
+    while end:
+        a, _, check, _ = plan[end - 1]
+        v = getattr(inst, a.name)
+        if (check is None or check(v)) and (filter is None or filter(a, v)):
+            keep = checks[a.name]
+            if keep is None or keep(v):
+                break
+        end -= 1
+
+    return plan[:end]
+
+
 def has(cls):
     """
     Check whether *cls* is a class with ``attrs`` attributes.
@@ -343,6 +913,184 @@ def evolve(inst, **changes):
     return cls(**changes)
 
 
+def _diff_patch(cls):
+    """
+    Return a tuple of functions that diff and patch instances of *cls*.
+
+    They are generated once per class.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["diff_patch"]
+    except KeyError:
+        pass
+
+    attrs = fields(cls)
+    lines = ["def diff(a, b, recurse):", "    rv = {}"]
+    for a in attrs:
+        if not a.eq:
+            continue
+        lines.extend(
+            [
+                "    o = a.%s" % (a.name,),
+                "    n = b.%s" % (a.name,),
+                "    if o is not n and o != n:",
+                "        if (",
+                "            recurse",
+                "            and o.__class__ is n.__class__",
+                "            and _attrs_has(n.__class__)",
+                "        ):",
+                "            for k, v in _attrs_diff(o, n, True).items():",
+                "                rv['%s.' + k] = v" % (a.name,),
+                "        else:",
+                "            rv['%s'] = n" % (a.name,),
+            ]
+        )
+    lines.append("    return rv")
+
+    globs = {
+        "_attrs_has": has,
+        "_attrs_diff": _diff,
+        "_attrs_names": frozenset(a.name for a in attrs),
+        "_attrs_new": _trusted_constructor(cls),
+        "_attrs_patch_paths": _patch_paths,
+        "_config": _config,
+    }
+    lines.extend(
+        [
+            "def patch(inst, changes):",
+            "    if not _attrs_names.issuperset(changes):",
+            "        return _attrs_patch_paths(inst, changes)",
+            "    get = changes.get",
+            "    new = _attrs_new(%s)"
+            % (
+                ", ".join(
+                    "get('%s', inst.%s)" % (a.name, a.name) for a in attrs
+                ),
+            ),
+        ]
+    )
+    validated = [(i, a) for i, a in enumerate(attrs) if a.validator]
+    if validated:
+        lines.append("    if _config._run_validators is True:")
+    for i, a in validated:
+        globs["_attrs_validator_%d" % (i,)] = a.validator
+        globs["_attrs_attr_%d" % (i,)] = a
+        lines.extend(
+            [
+                "        if '%s' in changes:" % (a.name,),
+                "            _attrs_validator_%d(new, _attrs_attr_%d, new.%s)"
+                % (i, i, a.name),
+            ]
+        )
+    lines.append("    return new")
+
+    methods = _make_methods(
+        "\n".join(lines), _generate_unique_filename(cls, "diff patch"), globs
+    )
+    rv = (methods["diff"], methods["patch"])
+    _class_cache(cls)["diff_patch"] = rv
+
+    return rv
+
+
+def _diff(a, b, recurse):
+    """
+    Diff *a* and *b* which are instances of the same class.
+    """
+    return _diff_patch(a.__class__)[0](a, b, recurse)
+
+
+def _patch_paths(inst, changes):
+    """
+    Apply *changes* that contain dotted paths or unknown names.
+    """
+    cls = inst.__class__
+    names = frozenset(a.name for a in fields(cls))
+    flat = {}
+    nested = {}
+    for name, value in iteritems(changes):
+        head, dot, rest = name.partition(".")
+        if head not in names:
+            raise AttrsAttributeNotFoundError(
+                "{k} is not an attrs attribute on {cl}.".format(k=head, cl=cls)
+            )
+        if dot:
+            nested.setdefault(head, {})[rest] = value
+        else:
+            flat[name] = value
+
+    for head, sub in iteritems(nested):
+        if head in flat:
+            raise ValueError(
+                "Both {head!r} and paths below it have been changed.".format(
+                    head=head
+                )
+            )
+        flat[head] = patch(getattr(inst, head), sub)
+
+    return _diff_patch(cls)[1](inst, flat)
+
+
+def diff(a, b, recurse=False):
+    """
+    Return the fields whose values differ between *a* and *b*.
+
+    Only fields that take part in equality checks (i.e. whose *eq* is `True`)
+    are compared.  Values that are identical are never compared using
+    ``!=``.
+
+    :param a: Instance of an ``attrs``-decorated class.
+    :param b: Instance of the same class as *a*.
+    :param bool recurse: Compare values that are instances of the same
+        ``attrs`` class field by field and report their differences using
+        dotted paths like ``"position.x"``.
+
+    :return: A dict of field names -- or dotted paths -- to their values in
+        *b*.  It's empty if *a* and *b* are equal.  Use `patch` to apply it.
+    :rtype: dict
+
+    :raise TypeError: If *a* and *b* are not instances of the same class.
+    :raise attr.exceptions.NotAnAttrsClassError: If *a* is not an ``attrs``
+        instance.
+
+    ..  versionadded:: 21.1.0
+    """
+    if a.__class__ is not b.__class__:
+        raise TypeError(
+            "Can only diff instances of the same class, not {a!r} and "
+            "{b!r}.".format(a=a.__class__, b=b.__class__)
+        )
+
+    return _diff_patch(a.__class__)[0](a, b, recurse)
+
+
+def patch(inst, changes):
+    """
+    Create a new instance, based on *inst* with *changes* applied.
+
+    Unlike `evolve`, *changes* are keyed by field names -- including the
+    leading underscore of private attributes -- or dotted paths as returned
+    by `diff`.  Values at dotted paths are patched recursively.
+
+    Since the values are expected to come from another instance, the new
+    instance is created without calling ``__init__``.  Therefore neither
+    converters nor ``__attrs_post_init__`` run.  The validators of changed
+    fields *do* run.
+
+    :param inst: Instance of an ``attrs``-decorated class.
+    :param dict changes: Field names or dotted paths to their new values.
+
+    :return: A copy of *inst* with *changes* incorporated.
+
+    :raise attr.exceptions.AttrsAttributeNotFoundError: If a name in
+        *changes* is not a field.
+    :raise ValueError: If *changes* contain both a name and paths below it.
+
+    ..  versionadded:: 21.1.0
+    """
+    return _diff_patch(inst.__class__)[1](inst, changes)
+
+
 def resolve_types(cls, globalns=None, localns=None):
     """
     Resolve any strings and forward annotations in type annotations.
@@ -385,6 +1133,8 @@ def resolve_types(cls, globalns=None, localns=None):
                 # Since fields have been frozen we must work around it.
                 _obj_setattr(field, "type", hints[field.name])
         cls.__attrs_types_resolved__ = True
+        # Plans may have been derived from the unresolved types.
+        _class_cache(cls).clear()
 
     # Return the class so you can use it as a decorator too.
     return cls
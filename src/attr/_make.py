@@ -8,12 +8,13 @@ import threading
 import uuid
 import warnings
 
-from operator import itemgetter
+from operator import attrgetter, itemgetter
 
 from . import _config, setters
 from ._compat import (
     PY2,
     PYPY,
+    PickleBuffer,
     isclass,
     iteritems,
     metadata_proxy,
@@ -45,6 +46,7 @@ _classvar_prefixes = ("typing.ClassVar", "t.ClassVar", "ClassVar")
 # name mangling when trying to create a slot for the field
 # (when slots=True)
 _hash_cache_field = "_attrs_cached_hash"
+_asdict_cache_field = "_attrs_cached_asdict"
 
 _empty_metadata_singleton = metadata_proxy({})
 
@@ -84,6 +86,20 @@ Sentinel to indicate the lack of a value when ``None`` is ambiguous.
 """
 
 
+class _AsDictCache(dict):
+    """
+    The cached `attr.asdict` results of an instance.
+
+    Like `_CacheHashWrapper`, it pickles and copies as empty so the keys,
+    which may contain arbitrary callables, never have to be serialized.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        return _AsDictCache, ()
+
+
 class _CacheHashWrapper(int):
     """
     An integer subclass that pickles / copies as None
@@ -573,6 +589,75 @@ def _frozen_delattrs(self, name):
     raise FrozenInstanceError()
 
 
+# Fields of these types are pickled out-of-band using protocol 5.
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+# Smaller values are pickled in-band even if they are buffers.
+_PICKLE_BUFFER_THRESHOLD = 4096
+
+
+def _setstate_by_name(self, names, state):
+    """
+    Restore *state* that doesn't match the current fields.
+
+    This happens when unpickling data that has been pickled before fields
+    have been added or removed.
+    """
+    for name, value in zip(names, state):
+        _obj_setattr(self, name, value)
+
+    if getattr(self.__class__, "__attrs_cache_hash__", False):
+        _obj_setattr(self, _hash_cache_field, None)
+
+
+class _OutOfBand(object):
+    """
+    Pickle a buffer as a `pickle.PickleBuffer` that is restored to its
+    original type.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __reduce__(self):
+        return _from_buffer, (self.value.__class__, PickleBuffer(self.value))
+
+
+def _from_buffer(buffer_type, buffer):
+    """
+    Restore a buffer that has been pickled by `_OutOfBand`.
+
+    Out-of-band buffers arrive as whatever has been passed to `pickle.loads`.
+    """
+    if buffer.__class__ is buffer_type:
+        return buffer
+
+    return buffer_type(buffer)
+
+
+def _out_of_band(value):
+    """
+    Wrap *value* for pickling if it's a buffer that is large enough to travel
+    out-of-band.
+    """
+    if value.__class__ is memoryview or (
+        value.__class__ in _BUFFER_TYPES
+        and len(value) >= _PICKLE_BUFFER_THRESHOLD
+    ):
+        return _OutOfBand(value)
+
+    return value
+
+
+def _restore(cls, state):
+    """
+    Unpickle an instance of *cls* from its field values.
+    """
+    return _trusted_constructor(cls)(*state)
+
+
 class _ClassBuilder(object):
     """
     Iteratively build *one* class.
@@ -584,6 +669,7 @@ class _ClassBuilder(object):
         "_base_attr_map",
         "_base_names",
         "_cache_hash",
+        "_cache_asdict",
         "_cls",
         "_cls_dict",
         "_delete_attribs",
@@ -613,6 +699,7 @@ class _ClassBuilder(object):
         on_setattr,
         has_custom_setattr,
         field_transformer,
+        cache_asdict=False,
     ):
         attrs, base_attrs, base_map = _transform_attrs(
             cls,
@@ -633,6 +720,7 @@ class _ClassBuilder(object):
         self._frozen = frozen
         self._weakref_slot = weakref_slot
         self._cache_hash = cache_hash
+        self._cache_asdict = cache_asdict
         self._has_post_init = bool(getattr(cls, "__attrs_post_init__", False))
         self._delete_attribs = not bool(these)
         self._is_exc = is_exc
@@ -642,6 +730,11 @@ class _ClassBuilder(object):
         self._has_own_setattr = False
 
         self._cls_dict["__attrs_attrs__"] = self._attrs
+        if cache_hash:
+            # Helpers that create instances without __init__ need to know.
+            self._cls_dict["__attrs_cache_hash__"] = True
+        if cache_asdict:
+            self._cls_dict["__attrs_cache_asdict__"] = True
 
         if frozen:
             self._cls_dict["__setattr__"] = _frozen_setattrs
@@ -653,7 +746,10 @@ class _ClassBuilder(object):
             (
                 self._cls_dict["__getstate__"],
                 self._cls_dict["__setstate__"],
+                reduce_ex,
             ) = self._make_getstate_setstate()
+            if reduce_ex is not None:
+                self._cls_dict["__reduce_ex__"] = reduce_ex
 
     def __repr__(self):
         return "<_ClassBuilder(cls={cls})>".format(cls=self._cls.__name__)
@@ -775,6 +871,8 @@ class _ClassBuilder(object):
         cd.update(reused_slots)
         if self._cache_hash:
             slot_names.append(_hash_cache_field)
+        if self._cache_asdict:
+            slot_names.append(_asdict_cache_field)
         cd["__slots__"] = tuple(slot_names)
 
         qualname = getattr(self._cls, "__qualname__", None)
@@ -837,36 +935,118 @@ class _ClassBuilder(object):
     def _make_getstate_setstate(self):
         """
         Create custom __setstate__ and __getstate__ methods.
+
+        If pickle protocol 5 is available and any fields are annotated as
+        buffers, a __reduce_ex__ that hands them out as PickleBuffers is
+        created too; otherwise it's None.
         """
         # __weakref__ is not writable.
         state_attr_names = tuple(
             an for an in self._attr_names if an != "__weakref__"
         )
+        values = tuple("v%d" % (i,) for i in range(len(state_attr_names)))
+
+        lines = [
+            "def __getstate__(self):",
+            "    return (%s)"
+            % ("".join("self.%s, " % (name,) for name in state_attr_names),),
+            "def __setstate__(self, state):",
+        ]
+        if values:
+            lines.extend(
+                [
+                    "    try:",
+                    "        %s, = state" % (", ".join(values),),
+                    "    except ValueError:",
+                    "        return _attrs_setstate_by_name(",
+                    "            self, _attrs_state_names, state",
+                    "        )",
+                ]
+            )
+        if self._slots or any(
+            base.__dict__.get("__slots__") for base in self._cls.__mro__[1:]
+        ):
+            assign = "    _attrs_setattr(self, '%s', %s)"
+        else:
+            # Like default unpickling, write straight into the instance dict
+            # which is considerably faster than calling __setattr__.
+            lines.append("    _attrs_dict = self.__dict__")
+            assign = "    _attrs_dict['%s'] = %s"
+        lines.extend(
+            assign % (name, v) for name, v in zip(state_attr_names, values)
+        )
+        # The hash code cache is not included when the object is serialized,
+        # but it still needs to be initialized to None to indicate that the
+        # first call to __hash__ should be a cache miss.
+        if self._cache_hash:
+            lines.append(assign % (_hash_cache_field, "None"))
+        lines.append("    pass")
 
-        def slots_getstate(self):
-            """
-            Automatically created by attrs.
-            """
-            return tuple(getattr(self, name) for name in state_attr_names)
-
-        hash_caching_enabled = self._cache_hash
-
-        def slots_setstate(self, state):
-            """
-            Automatically created by attrs.
-            """
-            __bound_setattr = _obj_setattr.__get__(self, Attribute)
-            for name, value in zip(state_attr_names, state):
-                __bound_setattr(name, value)
+        globs = {
+            "_attrs_setattr": _obj_setattr,
+            "_attrs_setstate_by_name": _setstate_by_name,
+            "_attrs_state_names": state_attr_names,
+        }
+        buffers = frozenset(
+            i for i, a in enumerate(self._attrs) if a.type in _BUFFER_TYPES
+        )
+        make_reduce_ex = (
+            PickleBuffer is not None
+            and buffers
+            and len(state_attr_names) == len(self._attrs)
+            and "__reduce__" not in self._cls.__dict__
+            and "__reduce_ex__" not in self._cls.__dict__
+        )
+        if make_reduce_ex:
+            lines.extend(
+                [
+                    "def __reduce_ex__(self, protocol):",
+                    "    if (",
+                    "        protocol < 5",
+                    "        or self.__class__.__getstate__"
+                    " is not __getstate__",
+                    "    ):",
+                    "        return _attrs_reduce_ex(self, protocol)",
+                    "    return (",
+                    "        _attrs_restore,",
+                    "        (self.__class__, (%s)),"
+                    % (
+                        "".join(
+                            (
+                                "_attrs_out_of_band(self.%s), "
+                                if i in buffers
+                                else "self.%s, "
+                            )
+                            % (name,)
+                            for i, name in enumerate(state_attr_names)
+                        ),
+                    ),
+                    "    )",
+                ]
+            )
+            globs.update(
+                _attrs_reduce_ex=object.__reduce_ex__,
+                _attrs_restore=_restore,
+                _attrs_out_of_band=_out_of_band,
+            )
 
-            # The hash code cache is not included when the object is
-            # serialized, but it still needs to be initialized to None to
-            # indicate that the first call to __hash__ should be a cache
-            # miss.
-            if hash_caching_enabled:
-                __bound_setattr(_hash_cache_field, None)
+        methods = _make_methods(
+            "\n".join(lines),
+            _generate_unique_filename(self._cls, "getstate setstate"),
+            globs,
+        )
+        if make_reduce_ex:
+            # __reduce_ex__ needs to recognize its own __getstate__.
+            globs["__getstate__"] = methods["__getstate__"]
+            reduce_ex = self._add_method_dunders(methods["__reduce_ex__"])
+        else:
+            reduce_ex = None
 
-        return slots_getstate, slots_setstate
+        return (
+            self._add_method_dunders(methods["__getstate__"]),
+            self._add_method_dunders(methods["__setstate__"]),
+            reduce_ex,
+        )
 
     def make_unhashable(self):
         self._cls_dict["__hash__"] = None
@@ -922,6 +1102,15 @@ class _ClassBuilder(object):
 
         return self
 
+    def add_copy(self):
+        cd = self._cls_dict
+
+        cd["__copy__"], cd["__deepcopy__"] = (
+            self._add_method_dunders(meth) for meth in _make_copy()
+        )
+
+        return self
+
     def add_setattr(self):
         if self._frozen:
             return self
@@ -1069,6 +1258,8 @@ def attrs(
     getstate_setstate=None,
     on_setattr=None,
     field_transformer=None,
+    copy_deepcopy=None,
+    cache_asdict=False,
 ):
     r"""
     A class decorator that adds `dunder
@@ -1247,11 +1438,21 @@ def attrs(
        necessary for slotted classes to be pickleable. If left `None`, it's
        `True` by default for slotted classes and ``False`` for dict classes.
 
+       The state is a tuple of the attribute values in the order of
+       `attr.fields`.  For dict classes, this is more compact and faster
+       than pickling the instance dict, but attributes that aren't fields
+       are **not** pickled.
+
        If *auto_detect* is `True`, and *getstate_setstate* is left `None`,
        and **either** ``__getstate__`` or ``__setstate__`` is detected directly
        on the class (i.e. not inherited), it is set to `False` (this is usually
        what you want).
 
+       On Python 3.8 and later, values of fields whose type is `bytes`,
+       `bytearray`, or `memoryview` are additionally handed out as
+       `pickle.PickleBuffer`\ s when pickled using protocol 5, so large
+       values can travel out-of-band.
+
     :param on_setattr: A callable that is run whenever the user attempts to set
         an attribute (either by assignment like ``i.x = 42`` or by using
         `setattr` like ``setattr(i, "x", 42)``). It receives the same arguments
@@ -1269,6 +1470,27 @@ def attrs(
         fields right before ``attrs`` finalizes the class.  You can use
         this, e.g., to automatically add converters or validators to
         fields based on their types.  See `transform-fields` for more details.
+    :param Optional[bool] copy_deepcopy: If `True`, ``__copy__`` and
+        ``__deepcopy__`` are attached to the class that copy the attributes
+        directly instead of going through ``__reduce_ex__``.  When deep
+        copying, values of immutable built-in types like `int` or `str` are
+        not passed to `copy.deepcopy`, and instances of frozen classes whose
+        values don't change are returned as they are -- just like `copy`
+        treats tuples.
+
+        If *auto_detect* is `True`, and *copy_deepcopy* is left `None`, and
+        **either** ``__copy__`` or ``__deepcopy__`` is detected directly on
+        the class, it is set to `False`.  It is never applied to exception
+        classes.
+    :param bool cache_asdict: Cache the results of `attr.asdict` for each
+        instance and each combination of its arguments.  The class must be
+        frozen and its values must not change either, or the cached results
+        will become stale.  Cached results are copied before they are
+        returned, so it's safe to modify them.  *memoize* disables the
+        cache, as do *filter*\ s that are not from `attr.filters`,
+        *value_serializer*\ s that are not an `attr.serializers.Registry`,
+        and arguments that are not hashable.  Only the results of the
+        last few combinations are kept.
 
     .. versionadded:: 16.0.0 *slots*
     .. versionadded:: 16.1.0 *frozen*
@@ -1299,6 +1521,13 @@ def attrs(
     .. versionadded:: 20.1.0 *getstate_setstate*
     .. versionadded:: 20.1.0 *on_setattr*
     .. versionadded:: 20.3.0 *field_transformer*
+    .. versionadded:: 21.1.0 *copy_deepcopy*
+    .. versionadded:: 21.1.0 *cache_asdict*
+    .. versionchanged:: 21.1.0
+       *getstate_setstate* supports pickle protocol 5 out-of-band buffers.
+    .. versionchanged:: 21.1.0
+       The state of dict classes with *getstate_setstate* is written directly
+       into the instance dict when unpickling.
     """
     if auto_detect and PY2:
         raise PythonTooOldError(
@@ -1324,6 +1553,11 @@ def attrs(
 
         if has_own_setattr and is_frozen:
             raise ValueError("Can't freeze a class with a custom __setattr__.")
+        if cache_asdict and not is_frozen:
+            raise TypeError(
+                "Invalid value for cache_asdict.  To cache asdict results,"
+                " the class must be frozen."
+            )
 
         builder = _ClassBuilder(
             cls,
@@ -1346,7 +1580,16 @@ def attrs(
             on_setattr,
             has_own_setattr,
             field_transformer,
+            cache_asdict,
         )
+        if not is_exc and _determine_whether_to_implement(
+            cls,
+            copy_deepcopy,
+            auto_detect,
+            ("__copy__", "__deepcopy__"),
+            default=False,
+        ):
+            builder.add_copy()
         if _determine_whether_to_implement(
             cls, repr, auto_detect, ("__repr__",)
         ):
@@ -1492,6 +1735,27 @@ def _generate_unique_filename(cls, func_name):
         extra = "-{0}".format(count)
 
 
+def _make_methods(script, filename, globs=None):
+    """
+    Compile *script*, register it with linecache, and return a dict of the
+    functions that it defines.
+    """
+    locs = {}
+    bytecode = compile(script, filename, "exec")
+    eval(bytecode, {} if globs is None else globs, locs)
+
+    # In order of debuggers like PDB being able to step through the code,
+    # we add a fake linecache entry.
+    linecache.cache[filename] = (
+        len(script),
+        None,
+        script.splitlines(True),
+        filename,
+    )
+
+    return locs
+
+
 def _make_hash(cls, attrs, frozen, cache_hash):
     attrs = tuple(
         a for a in attrs if a.hash is True or (a.hash is None and a.eq is True)
@@ -1834,6 +2098,316 @@ def fields_dict(cls):
     return ordered_dict(((a.name, a) for a in attrs))
 
 
+def _class_cache(cls):
+    """
+    Return the dict that *cls* uses to cache plans and generated helpers that
+    are derived from its fields.
+
+    The dict lives in the class' own ``__dict__`` so it's neither inherited
+    by subclasses nor does it outlive *cls*.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]
+    except KeyError:
+        cache = {}
+        setattr(cls, "__attrs_cache__", cache)
+        return cache
+
+
+def _trusted_constructor(cls):
+    """
+    Return a function that creates an instance of *cls* from the values of
+    all its fields, passed positionally in field order.
+
+    Just like unpickling, it neither calls ``__init__`` nor converters,
+    validators, or ``__attrs_post_init__``.  Therefore it must only be used
+    with values that come from an instance of *cls*.
+
+    The function is generated once per class.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["trusted_constructor"]
+    except KeyError:
+        pass
+
+    names = tuple(a.name for a in fields(cls))
+    args = ", ".join("v%d" % (i,) for i in range(len(names)))
+    if cls.__setattr__ is object.__setattr__:
+        assign = "    self.%s = %s"
+    else:
+        assign = "    _attrs_setattr(self, '%s', %s)"
+
+    lines = ["def trusted_constructor(%s):" % (args,)]
+    lines.append("    self = _attrs_new(_attrs_cls)")
+    lines.extend(assign % (name, "v%d" % (i,)) for i, name in enumerate(names))
+    if getattr(cls, "__attrs_cache_hash__", False):
+        lines.append(assign % (_hash_cache_field, "None"))
+    lines.append("    return self")
+
+    constructor = _make_methods(
+        "\n".join(lines),
+        _generate_unique_filename(cls, "trusted constructor"),
+        {
+            "_attrs_cls": cls,
+            "_attrs_new": object.__new__,
+            "_attrs_setattr": _obj_setattr,
+        },
+    )["trusted_constructor"]
+    _class_cache(cls)["trusted_constructor"] = constructor
+
+    return constructor
+
+
+def _values_getter(cls):
+    """
+    Return a callable that returns the values of all fields of an instance
+    of *cls* as a tuple in field order.
+
+    It's the counterpart of `_trusted_constructor` and, except for classes
+    with a single field, an `operator.attrgetter`.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["values_getter"]
+    except KeyError:
+        pass
+
+    names = tuple(a.name for a in fields(cls))
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        get = lambda inst: (getter(inst),)  # noqa: E731
+    elif names:
+        get = attrgetter(*names)
+    else:
+        get = lambda inst: ()  # noqa: E731
+    _class_cache(cls)["values_getter"] = get
+
+    return get
+
+
+# Values of these types are never deep-copied.
+_ATOMIC_TYPES = frozenset(
+    (
+        type(None),
+        bool,
+        int,
+        type(2 ** 64),
+        float,
+        complex,
+        str,
+        type(u""),
+        bytes,
+        type,
+    )
+)
+
+
+def _serialized_name(a):
+    """
+    Return the key of the field *a* in the results of `attr.asdict`.
+    """
+    return a.metadata.get("alias", a.name)
+
+
+# Factories whose results are empty collections.
+_EMPTY_FACTORIES = (list, dict, set, frozenset, tuple, bytearray)
+
+
+def _keeps_non_default(a):
+    """
+    Return a callable that returns `True` for values of *a* that differ from
+    its default, or ``None`` if values of *a* are never omitted.
+    """
+    default = a.default
+    if default is NOTHING:
+        return None
+
+    if isinstance(default, Factory):
+        factory = default.factory
+        if (
+            default.takes_self
+            or a.converter is not None
+            or not isclass(factory)
+            or not issubclass(factory, _EMPTY_FACTORIES)
+        ):
+            return None
+
+        return lambda v: v.__class__ is not factory or len(v) != 0
+
+    if a.converter is not None:
+        default = a.converter(default)
+
+    cls = default.__class__
+    if cls is bool or default is None:
+        return lambda v: v is not default
+    if cls in _ATOMIC_TYPES or cls is tuple or cls is frozenset:
+        return lambda v: v.__class__ is not cls or v != default
+
+    return lambda v: v is not default
+
+
+def _default_checks(cls):
+    """
+    Return a dict of field names of *cls* to their `_keeps_non_default`.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["default_checks"]
+    except KeyError:
+        checks = dict((a.name, _keeps_non_default(a)) for a in fields(cls))
+        _class_cache(cls)["default_checks"] = checks
+
+        return checks
+
+
+def _omit_defaults(cls, plan):
+    """
+    Return the `attr.asdict` *plan* of *cls* with the checks extended to
+    drop default values.
+    """
+    checks = _default_checks(cls)
+    rv = []
+    for a, name, check, child in plan:
+        keep = checks[a.name]
+        if keep is not None:
+            check = keep if check is None else _both(check, keep)
+        rv.append((a, name, check, child))
+
+    return tuple(rv)
+
+
+def _both(first, second):
+    """
+    Return a check that passes if *first* and *second* pass.
+    """
+    return lambda v: first(v) and second(v)
+
+
+def _copy_methods(cls):
+    """
+    Return a tuple of functions that shallowly and deeply copy instances of
+    *cls*.
+
+    They are generated once per class, so subclasses that are not ``attrs``
+    classes themselves get their own.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["copy_methods"]
+    except KeyError:
+        pass
+
+    attrs = fields(cls)
+    slot_names = set()
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        slot_names.update((slots,) if isinstance(slots, str) else slots)
+    in_slots = tuple(
+        a.name
+        for a in attrs
+        if a.name in slot_names and a.name != "__weakref__"
+    )
+    has_dict = any("__dict__" in base.__dict__ for base in cls.__mro__)
+    reset_hash = (
+        getattr(cls, "__attrs_cache_hash__", False)
+        and _hash_cache_field in slot_names
+    )
+    frozen = cls.__setattr__ is _frozen_setattrs
+
+    copy_lines = [
+        "def copy(self):",
+        "    new = _attrs_cls.__new__(_attrs_cls)",
+    ]
+    copy_lines.extend(
+        "    _attrs_setattr(new, '%s', self.%s)" % (name, name)
+        for name in in_slots
+    )
+
+    deepcopy_lines = [
+        "def deepcopy(self, memo):",
+        "    new = _attrs_cls.__new__(_attrs_cls)",
+        "    memo[id(self)] = new",
+    ]
+    for i, name in enumerate(in_slots):
+        deepcopy_lines.extend(
+            [
+                "    o%d = self.%s" % (i, name),
+                "    v%d = o%d if o%d.__class__ in _attrs_atomic else "
+                "_attrs_deepcopy(o%d, memo)" % (i, i, i, i),
+            ]
+        )
+    if has_dict:
+        copy_lines.append("    new.__dict__.update(self.__dict__)")
+        deepcopy_lines.extend(
+            [
+                "    changed = False",
+                "    d = new.__dict__",
+                "    for k, o in self.__dict__.items():",
+                "        v = o if o.__class__ in _attrs_atomic else "
+                "_attrs_deepcopy(o, memo)",
+                "        d[k] = v",
+                "        if v is not o and k != '%s':" % (_hash_cache_field,),
+                "            changed = True",
+            ]
+        )
+        if getattr(cls, "__attrs_cache_hash__", False) and not reset_hash:
+            deepcopy_lines.append("    d['%s'] = None" % (_hash_cache_field,))
+    if frozen:
+        unchanged = ["v%d is o%d" % (i, i) for i in range(len(in_slots))]
+        if has_dict:
+            unchanged.append("not changed")
+        deepcopy_lines.extend(
+            [
+                "    if %s:" % (" and ".join(unchanged or ["True"]),),
+                "        memo[id(self)] = self",
+                "        return self",
+            ]
+        )
+    deepcopy_lines.extend(
+        "    _attrs_setattr(new, '%s', v%d)" % (name, i)
+        for i, name in enumerate(in_slots)
+    )
+    if reset_hash:
+        line = "    _attrs_setattr(new, '%s', None)" % (_hash_cache_field,)
+        copy_lines.append(line)
+        deepcopy_lines.append(line)
+    copy_lines.append("    return new")
+    deepcopy_lines.append("    return new")
+
+    methods = _make_methods(
+        "\n".join(copy_lines + deepcopy_lines),
+        _generate_unique_filename(cls, "copy"),
+        {
+            "_attrs_cls": cls,
+            "_attrs_setattr": _obj_setattr,
+            "_attrs_atomic": _ATOMIC_TYPES,
+            "_attrs_deepcopy": copy.deepcopy,
+        },
+    )
+    rv = (methods["copy"], methods["deepcopy"])
+    _class_cache(cls)["copy_methods"] = rv
+
+    return rv
+
+
+def _make_copy():
+    """
+    Return ``__copy__`` and ``__deepcopy__`` methods that delegate to the
+    methods of `_copy_methods` for the class of the instance.
+    """
+
+    def __copy__(self):
+        """
+        Return a shallow copy of *self*.
+        """
+        return _copy_methods(self.__class__)[0](self)
+
+    def __deepcopy__(self, memo):
+        """
+        Return a deep copy of *self*.
+        """
+        return _copy_methods(self.__class__)[1](self, memo)
+
+    return __copy__, __deepcopy__
+
+
 def validate(inst):
     """
     Validate all attributes on *inst* that have a validator.
@@ -2478,6 +3052,17 @@ class Attribute(object):
 
         return new
 
+    def __copy__(self):
+        """
+        Copy the slots directly; the metadata proxy is read-only anyway.
+        """
+        new = self.__class__.__new__(self.__class__)
+        bound_setattr = _obj_setattr.__get__(new, Attribute)
+        for name in self.__slots__:
+            bound_setattr(name, getattr(self, name))
+
+        return new
+
     # Don't use _add_pickle since fields(Attribute) doesn't work
     def __getstate__(self):
         """
@@ -2694,7 +3279,9 @@ class Factory(object):
         self.takes_self = takes_self
 
 
-def make_class(name, attrs, bases=(object,), **attributes_arguments):
+def make_class(
+    name, attrs, bases=(object,), picklable=False, **attributes_arguments
+):
     """
     A quick way to create a new class called *name* with *attrs*.
 
@@ -2711,6 +3298,16 @@ def make_class(name, attrs, bases=(object,), **attributes_arguments):
 
     :param tuple bases: Classes that the new class will subclass.
 
+    :param bool picklable: Pickle instances together with the arguments of
+        this call instead of a reference to the class, which only works if
+        the class can be imported.  Unpickling creates the class from these
+        arguments once per process, so instances can be sent to processes
+        that never created the class, like the workers of a
+        `concurrent.futures.ProcessPoolExecutor`.  Pickling back into the
+        process that created the class returns instances of the original
+        class.  All arguments, including validators and converters, must be
+        picklable themselves.  These classes are never garbage-collected.
+
     :param attributes_arguments: Passed unmodified to `attr.s`.
 
     :return: A new class with *attrs*.
@@ -2718,7 +3315,16 @@ def make_class(name, attrs, bases=(object,), **attributes_arguments):
 
     .. versionadded:: 17.1.0 *bases*
     .. versionchanged:: 18.1.0 If *attrs* is ordered, the order is retained.
-    """
+    .. versionadded:: 21.1.0 *picklable*
+    """
+    if picklable is True:
+        arguments = (
+            name,
+            dict(attrs) if isinstance(attrs, dict) else attrs,
+            bases,
+            dict(attributes_arguments),
+        )
+
     if isinstance(attrs, dict):
         cls_dict = attrs
     elif isinstance(attrs, (list, tuple)):
@@ -2755,7 +3361,50 @@ def make_class(name, attrs, bases=(object,), **attributes_arguments):
         True,
     )
 
-    return _attrs(these=cls_dict, **attributes_arguments)(type_)
+    cls = _attrs(these=cls_dict, **attributes_arguments)(type_)
+    if picklable is True:
+        _pickle_by_schema(cls, uuid.uuid4().hex, arguments + (cls.__module__,))
+
+    return cls
+
+
+# Classes made by make_class(picklable=True) by the keys of their schemas.
+# They're kept alive, so unpickling creates each class at most once.
+_classes_by_schema = {}
+
+
+def _pickle_by_schema(cls, key, schema):
+    """
+    Make instances of *cls* pickle a reference to *schema* instead of *cls*
+    and remember *cls* as the class of *key*.
+    """
+
+    def __reduce_ex__(self, protocol):
+        rv = object.__reduce_ex__(self, max(protocol, 2))
+        if self.__class__ is not cls:
+            # Subclasses are importable classes.
+            return rv
+
+        return (_from_schema, (key, schema)) + rv[2:]
+
+    cls.__reduce_ex__ = __reduce_ex__
+    _classes_by_schema[key] = cls
+
+
+def _from_schema(key, schema):
+    """
+    Return an empty instance of the class of *key*, creating the class from
+    *schema* if this process hasn't seen it yet.
+    """
+    try:
+        cls = _classes_by_schema[key]
+    except KeyError:
+        name, attrs, bases, attributes_arguments, module = schema
+        cls = make_class(name, attrs, bases, **attributes_arguments)
+        cls.__module__ = module
+        _pickle_by_schema(cls, key, schema)
+
+    return object.__new__(cls)
 
 
 # These are required by within this module so we define them here and merely
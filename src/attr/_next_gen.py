@@ -34,6 +34,8 @@ def define(
     getstate_setstate=None,
     on_setattr=None,
     field_transformer=None,
+    copy_deepcopy=None,
+    cache_asdict=False,
 ):
     r"""
     The only behavioral differences are the handling of the *auto_attribs*
@@ -74,6 +76,8 @@ def define(
             getstate_setstate=getstate_setstate,
             on_setattr=on_setattr,
             field_transformer=field_transformer,
+            copy_deepcopy=copy_deepcopy,
+            cache_asdict=cache_asdict,
         )
 
     def wrap(cls):
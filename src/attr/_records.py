@@ -0,0 +1,84 @@
+"""
+Read-only record views that look like instances of ``attrs`` classes.
+
+They're shared by `attr.Table`, `attr.numpy`, `attr.recordfile`, and
+`attr.shared` which only differ in where the field values come from.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from ._make import _class_cache, fields
+
+
+def _record_class(cls, base, cache_key, make_properties):
+    """
+    Return the subclass of *base* for the record views of *cls*.
+
+    *make_properties* is called with *cls* and returns a dict mapping the
+    name of every field to the read-only property that returns its value.
+    The class is cached as *cache_key* in the class cache of *cls*.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"][cache_key]
+    except KeyError:
+        pass
+
+    body = {
+        "__slots__": (),
+        "__attrs_record_of__": cls,
+        "__attrs_record_reprs__": tuple(
+            (a.name, repr if a.repr is True else a.repr)
+            for a in fields(cls)
+            if a.repr is not False
+        ),
+    }
+    body.update(make_properties(cls))
+
+    record_class = type(cls.__name__ + "Record", (base,), body)
+    _class_cache(cls)[cache_key] = record_class
+
+    return record_class
+
+
+class _Record(object):
+    """
+    Base class of record views.
+
+    Subclasses add the slots that point to the storage of the values and
+    an ``__init__`` that sets them.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Records are read-only.")
+
+    def __repr__(self):
+        return "{cls}({fields})".format(
+            cls=self.__attrs_record_of__.__name__,
+            fields=", ".join(
+                name + "=" + r(getattr(self, name))
+                for name, r in self.__attrs_record_reprs__
+            ),
+        )
+
+    def __eq__(self, other):
+        cls = self.__attrs_record_of__
+        if other.__class__ is not cls and not (
+            isinstance(other, _Record) and other.__attrs_record_of__ is cls
+        ):
+            return NotImplemented
+
+        return all(
+            getattr(self, a.name) == getattr(other, a.name)
+            for a in fields(cls)
+        )
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return NotImplemented
+
+        return not result
+
+    __hash__ = None
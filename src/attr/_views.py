@@ -0,0 +1,147 @@
+"""
+Lazy attribute views on dicts.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from . import _config
+from ._funcs import has
+from ._make import (
+    NOTHING,
+    Factory,
+    _class_cache,
+    _obj_setattr,
+    _serialized_name,
+    fields,
+)
+
+
+def _view_class(cls):
+    """
+    Return the class of the views of *cls*.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["view_class"]
+    except KeyError:
+        pass
+
+    body = {"__slots__": (), "__attrs_view_of__": cls}
+    for a in fields(cls):
+        body[a.name] = _view_property(a)
+
+    view_class = type(cls.__name__ + "View", (_View,), body)
+    _class_cache(cls)["view_class"] = view_class
+
+    return view_class
+
+
+def _view_property(a):
+    """
+    Return a read-only property that looks up the value of the field *a*.
+    """
+    name = a.name
+    key = _serialized_name(a)
+    default = a.default
+    converter = a.converter
+    validator = a.validator
+    nested = a.type if a.type is not None and has(a.type) else None
+
+    def get(self):
+        values = self._attrs_values
+        try:
+            return values[name]
+        except KeyError:
+            pass
+
+        try:
+            v = self._attrs_mapping[key]
+        except KeyError:
+            if default is NOTHING:
+                raise AttributeError(
+                    "{key!r} is missing for the field {name!r}.".format(
+                        key=key, name=name
+                    )
+                )
+            if not isinstance(default, Factory):
+                v = default
+            elif default.takes_self:
+                v = default.factory(self)
+            else:
+                v = default.factory()
+
+        if nested is not None and isinstance(v, dict):
+            v = view(nested, v, self._attrs_convert, self._attrs_validate)
+        else:
+            if converter is not None and self._attrs_convert:
+                v = converter(v)
+            if (
+                validator is not None
+                and self._attrs_validate
+                and _config._run_validators is True
+            ):
+                validator(self, a, v)
+
+        values[name] = v
+
+        return v
+
+    return property(get)
+
+
+class _View(object):
+    """
+    Base class of views.
+    """
+
+    __slots__ = (
+        "_attrs_mapping",
+        "_attrs_convert",
+        "_attrs_validate",
+        "_attrs_values",
+    )
+
+    def __init__(self, mapping, convert, validate):
+        _obj_setattr(self, "_attrs_mapping", mapping)
+        _obj_setattr(self, "_attrs_convert", convert)
+        _obj_setattr(self, "_attrs_validate", validate)
+        _obj_setattr(self, "_attrs_values", {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Views are read-only.")
+
+    def __repr__(self):
+        return "<attr.view of {cls} on {mapping!r}>".format(
+            cls=self.__attrs_view_of__.__name__, mapping=self._attrs_mapping
+        )
+
+
+def view(cls, mapping, convert=False, validate=False):
+    """
+    Return a read-only object whose attributes are the fields of *cls* and
+    that looks their values up in *mapping*.
+
+    Nothing is copied and nothing is looked up until an attribute is
+    accessed for the first time.  Values are looked up under the keys that
+    `attr.asdict` uses -- the field's ``alias`` or its name -- and the
+    defaults of *cls* are used for missing keys.  Dicts in fields whose type
+    is an ``attrs`` class become views themselves.  Every value is cached
+    after its first access, so later changes to *mapping* may not be
+    visible.
+
+    That makes views much cheaper than `attr.from_dict` if only a few
+    fields of a big dict are used.  Accessing a field whose key is missing
+    and that has no default raises an `AttributeError`.
+
+    :param type cls: An ``attrs``-decorated class.
+    :param mapping: A mapping, usually a dict that was parsed from JSON.
+    :param bool convert: Whether to run the converters of *cls* on first
+        access.
+    :param bool validate: Whether to run the validators of *cls* on first
+        access.  They receive the view as the instance.
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+
+    ..  versionadded:: 21.1.0
+    """
+    return _view_class(cls)(mapping, convert, validate)
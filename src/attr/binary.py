@@ -0,0 +1,246 @@
+"""
+Fixed-layout binary serialization of ``attrs`` instances.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import struct
+
+from ._compat import PY2
+from ._funcs import has
+from ._make import (
+    _class_cache,
+    _generate_unique_filename,
+    _make_methods,
+    _trusted_constructor,
+    fields,
+)
+
+
+__all__ = ["iter_unpack", "pack", "pack_into", "size", "unpack"]
+
+_FORMATS = {bool: "?", int: "q", float: "d"}
+
+
+class _Codec(object):
+    """
+    The compiled binary layout of a class.
+    """
+
+    __slots__ = ("struct", "pack", "pack_into", "unpack")
+
+    def __init__(self, struct, pack, pack_into, unpack):
+        self.struct = struct
+        self.pack = pack
+        self.pack_into = pack_into
+        self.unpack = unpack
+
+
+def _field_format(cls, a):
+    """
+    Return the `struct` format of the single value of field *a* or ``None``
+    if *a* is a nested ``attrs`` class.
+    """
+    fmt = a.metadata.get("binary_format")
+    if fmt is not None:
+        s = struct.Struct("<" + fmt)
+        if len(s.unpack(b"\x00" * s.size)) != 1:
+            raise ValueError(
+                "The binary format {fmt!r} of field {name!r} of {cls!r} "
+                "must describe exactly one value.".format(
+                    fmt=fmt, name=a.name, cls=cls
+                )
+            )
+        return fmt
+
+    fmt = _FORMATS.get(a.type)
+    if fmt is not None:
+        return fmt
+
+    if a.type is not None and has(a.type):
+        return None
+
+    raise TypeError(
+        "Field {name!r} of {cls!r} has no fixed-size binary format.".format(
+            name=a.name, cls=cls
+        )
+    )
+
+
+def _flatten(cls, path, formats, args, globs, seen):
+    """
+    Append the formats and the attribute paths of the fields of *cls* and
+    return the expression that reconstructs it from the unpacked values.
+    """
+    if cls in seen:
+        raise TypeError(
+            "{cls!r} contains itself and has no fixed size.".format(cls=cls)
+        )
+    seen = seen + (cls,)
+
+    constructor = "_attrs_c%d" % (len(globs),)
+    globs[constructor] = _trusted_constructor(cls)
+
+    values = []
+    for a in fields(cls):
+        fmt = _field_format(cls, a)
+        if fmt is None:
+            values.append(
+                _flatten(
+                    a.type, path + "." + a.name, formats, args, globs, seen
+                )
+            )
+        else:
+            values.append("v%d" % (len(args),))
+            formats.append(fmt)
+            args.append(path + "." + a.name)
+
+    return "%s(%s)" % (constructor, ", ".join(values))
+
+
+def _codec(cls):
+    """
+    Return the `_Codec` of *cls*, compiling it if necessary.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["binary_codec"]
+    except KeyError:
+        pass
+
+    formats = []
+    args = []
+    globs = {}
+    constructor = _flatten(cls, "inst", formats, args, globs, ())
+    s = struct.Struct("<" + "".join(formats))
+    globs.update(
+        _attrs_pack=s.pack,
+        _attrs_pack_into=s.pack_into,
+        _attrs_unpack_from=s.unpack_from,
+    )
+
+    values = "".join(", " + arg for arg in args)
+    if args:
+        unpacked = "    %s = " % (
+            "".join("v%d, " % i for i in range(len(args))),
+        )
+    else:
+        unpacked = "    "
+
+    script = "\n".join(
+        [
+            "def pack(inst):",
+            "    return _attrs_pack(%s)" % (values[2:],),
+            "def pack_into(buf, offset, inst):",
+            "    _attrs_pack_into(buf, offset%s)" % (values,),
+            "def unpack(buf, offset):",
+            unpacked + "_attrs_unpack_from(buf, offset)",
+            "    return " + constructor,
+        ]
+    )
+    filename = _generate_unique_filename(cls, "binary codec")
+    methods = _make_methods(script, filename, globs)
+    codec = _Codec(s, methods["pack"], methods["pack_into"], methods["unpack"])
+    _class_cache(cls)["binary_codec"] = codec
+
+    return codec
+
+
+def size(cls):
+    """
+    Return the number of bytes an instance of *cls* takes up when packed.
+
+    :param type cls: An ``attrs``-decorated class.
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+    :raise TypeError: If a field of *cls* has no fixed-size binary format.
+
+    ..  versionadded:: 21.1.0
+    """
+    return _codec(cls).struct.size
+
+
+def pack(inst):
+    """
+    Return the field values of *inst* packed into `bytes`.
+
+    Fields are packed in definition order, little-endian, and without any
+    padding.  Fields whose type is `int`, `float`, or `bool` are packed as
+    ``q``, ``d``, and ``?`` respectively.  Fields whose type is an ``attrs``
+    class with a fixed layout are packed in place.  Every other field needs
+    a `struct` format in its ``binary_format`` metadata, for example
+    ``attr.ib(type=bytes, metadata={"binary_format": "16s"})``.
+
+    The layout is computed and compiled once per class.
+
+    :param inst: Instance of an ``attrs``-decorated class.
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *inst* is not an
+        ``attrs`` instance.
+    :raise TypeError: If a field of the class of *inst* has no fixed-size
+        binary format.
+    :raise struct.error: If a value doesn't fit its format.
+
+    ..  versionadded:: 21.1.0
+    """
+    return _codec(inst.__class__).pack(inst)
+
+
+def pack_into(buf, offset, inst):
+    """
+    Pack the field values of *inst* into the writable buffer *buf* starting
+    at *offset*.
+
+    The layout is the same as `pack`'s.
+
+    ..  versionadded:: 21.1.0
+    """
+    _codec(inst.__class__).pack_into(buf, offset, inst)
+
+
+def unpack(cls, buf, offset=0):
+    """
+    Create an instance of *cls* from the bytes that `pack` produced.
+
+    *buf* can be any object that supports the buffer protocol, like
+    `bytes`, `bytearray`, or `memoryview`, and may be longer than
+    `size` of *cls*.  No copy is made before unpacking.
+
+    Like unpickling, unpacking neither runs converters and validators nor
+    ``__attrs_post_init__``.  Since `struct` pads and truncates strings to
+    their fixed size, such values may not round-trip exactly.
+
+    :param type cls: An ``attrs``-decorated class.
+    :param buf: The buffer to read from.
+    :param int offset: Where in *buf* the packed instance starts.
+
+    :raise struct.error: If *buf* is too short.
+
+    ..  versionadded:: 21.1.0
+    """
+    return _codec(cls).unpack(buf, offset)
+
+
+def iter_unpack(cls, buf):
+    """
+    Iterate over instances of *cls* that have been packed back-to-back into
+    *buf*.
+
+    :raise ValueError: If the length of *buf* is not a multiple of `size`
+        of *cls*.
+
+    ..  versionadded:: 21.1.0
+    """
+    codec = _codec(cls)
+    step = codec.struct.size
+    # len() counts items, not bytes, for typed buffers like arrays.
+    length = len(buf) if PY2 else memoryview(buf).nbytes
+    if step == 0 or length % step:
+        raise ValueError(
+            "The buffer size {length} is not a multiple of the size of "
+            "{cls!r}.".format(length=length, cls=cls)
+        )
+
+    unpack = codec.unpack
+    for offset in range(0, length, step):
+        yield unpack(buf, offset)
@@ -0,0 +1,9 @@
+from typing import Any, Iterator, Type, TypeVar
+
+_T = TypeVar("_T")
+
+def size(cls: type) -> int: ...
+def pack(inst: Any) -> bytes: ...
+def pack_into(buf: Any, offset: int, inst: Any) -> None: ...
+def unpack(cls: Type[_T], buf: Any, offset: int = ...) -> _T: ...
+def iter_unpack(cls: Type[_T], buf: Any) -> Iterator[_T]: ...
@@ -0,0 +1,179 @@
+"""
+CSV import and export of ``attrs`` instances.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import csv
+
+from ._compat import imap
+from ._make import (
+    NOTHING,
+    _class_cache,
+    _generate_unique_filename,
+    _make_methods,
+    _serialized_name,
+    _values_getter,
+    fields,
+)
+
+
+__all__ = ["Writer", "reader", "writer"]
+
+
+def _parse_bool(value):
+    """
+    Parse the way `csv` writes `bool`\\ s.
+    """
+    if value in ("True", "true", "1"):
+        return True
+    if value in ("False", "false", "0", ""):
+        return False
+
+    raise ValueError("Invalid bool: {value!r}.".format(value=value))
+
+
+_PARSERS = {int: int, float: float, bool: _parse_bool}
+
+
+class Writer(object):
+    """
+    Writes instances of an ``attrs`` class as CSV rows.
+
+    Create it using `writer`.
+
+    ..  versionadded:: 21.1.0
+    """
+
+    __slots__ = ("_writer", "_getter")
+
+    def __init__(self, writer, getter):
+        self._writer = writer
+        self._getter = getter
+
+    def writerow(self, inst):
+        """
+        Write the field values of *inst* as one row.
+        """
+        return self._writer.writerow(self._getter(inst))
+
+    def writerows(self, instances):
+        """
+        Write the field values of every instance of the iterable
+        *instances*.
+        """
+        return self._writer.writerows(imap(self._getter, instances))
+
+
+def writer(fp, cls, header=True, **fmtparams):
+    """
+    Return a `Writer` that writes instances of *cls* to *fp* using
+    `csv.writer`.
+
+    There's one column per field in the order of `attr.fields`.  Rows are
+    built using `operator.attrgetter`, so writing doesn't involve any Python
+    code per row.  Values are written like `csv` writes them, so ``None``
+    becomes an empty string and everything else is passed to `str`.
+
+    :param fp: A file-like object opened in text mode with ``newline=""``.
+    :param type cls: An ``attrs``-decorated class.
+    :param bool header: Whether to write a header row with the keys that
+        `attr.asdict` uses: the names of the fields or their ``alias``\\ es.
+    :param fmtparams: Passed to `csv.writer`.
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+
+    ..  versionadded:: 21.1.0
+    """
+    getter = _values_getter(cls)
+    w = csv.writer(fp, **fmtparams)
+    if header is True:
+        w.writerow([_serialized_name(a) for a in fields(cls)])
+
+    return Writer(w, getter)
+
+
+def _builder(cls, header):
+    """
+    Return the compiled function that builds an instance of *cls* from a row
+    with the columns *header*.
+
+    *header* is ``None`` if the columns are the fields of *cls*.
+    """
+    attrs = fields(cls)
+    cache = _class_cache(cls).setdefault("csv_builders", {})
+    try:
+        return cache[header]
+    except KeyError:
+        pass
+
+    if header is None:
+        columns = dict((_serialized_name(a), i) for i, a in enumerate(attrs))
+    else:
+        columns = dict((key, i) for i, key in enumerate(header))
+
+    globs = {"_attrs_cls": cls}
+    args = []
+    for a in attrs:
+        if a.init is False:
+            continue
+
+        key = _serialized_name(a)
+        i = columns.get(key)
+        if i is None:
+            if a.default is NOTHING:
+                raise ValueError(
+                    "The CSV header lacks the column {key!r} of "
+                    "{cls!r}.".format(key=key, cls=cls)
+                )
+            continue
+
+        value = "row[%d]" % (i,)
+        parser = _PARSERS.get(a.type) if a.converter is None else None
+        if parser is not None:
+            parser_name = "_attrs_parse_" + a.name
+            globs[parser_name] = parser
+            value = "%s(%s)" % (parser_name, value)
+        args.append("%s=%s" % (a.name.lstrip("_"), value))
+
+    script = "def build(row):\n    return _attrs_cls(%s)" % (", ".join(args),)
+    filename = _generate_unique_filename(cls, "CSV reader")
+    build = cache[header] = _make_methods(script, filename, globs)["build"]
+
+    return build
+
+
+def reader(fp, cls, header=True, **fmtparams):
+    """
+    Return an iterator over the instances of *cls* in the CSV file *fp*.
+
+    Each row is turned into an instance by a function that is generated
+    once per class and header.  It picks the columns and parses values of
+    fields without a converter whose type is `int`, `float`, or `bool`.
+    Everything else is passed to ``__init__`` as a string, so converters and
+    validators run as usual.
+
+    :param fp: A file-like object opened in text mode with ``newline=""``.
+    :param type cls: An ``attrs``-decorated class.
+    :param bool header: Whether *fp* starts with a header row.  Columns are
+        matched by the keys that `attr.asdict` uses and may be in any order.
+        Columns of fields with defaults are optional, unknown columns are
+        ignored.  Without a header, the columns must be in the order of
+        `attr.fields`.
+    :param fmtparams: Passed to `csv.reader`.
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+    :raise ValueError: If the header lacks the column of a field without a
+        default.
+
+    ..  versionadded:: 21.1.0
+    """
+    rows = csv.reader(fp, **fmtparams)
+    if header is True:
+        columns = tuple(next(rows, ()))
+    else:
+        columns = None
+
+    return imap(_builder(cls, columns), rows)
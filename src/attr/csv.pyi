@@ -0,0 +1,14 @@
+from typing import IO, Any, Iterable, Iterator, Type, TypeVar
+
+_T = TypeVar("_T")
+
+class Writer:
+    def writerow(self, inst: Any) -> Any: ...
+    def writerows(self, instances: Iterable[Any]) -> None: ...
+
+def writer(
+    fp: IO[str], cls: type, header: bool = ..., **fmtparams: Any
+) -> Writer: ...
+def reader(
+    fp: Iterable[str], cls: Type[_T], header: bool = ..., **fmtparams: Any
+) -> Iterator[_T]: ...
@@ -0,0 +1,165 @@
+"""
+Bulk persistence of ``attrs`` instances using `DB-API 2.0
+<https://www.python.org/dev/peps/pep-0249/>`_ drivers like `sqlite3`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from ._compat import imap
+from ._make import (
+    _serialized_name,
+    _trusted_constructor,
+    _values_getter,
+    fields,
+)
+
+
+__all__ = [
+    "insert_many",
+    "insert_sql",
+    "row_factory",
+    "select_sql",
+    "values_getter",
+]
+
+_PLACEHOLDERS = {
+    "qmark": lambda i: "?",
+    "numeric": lambda i: ":%d" % (i + 1,),
+    "format": lambda i: "%s",
+}
+
+
+def _quote(identifier):
+    """
+    Quote *identifier* for use in SQL.
+    """
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _columns(cls):
+    """
+    Return the quoted, comma-separated column names of *cls*.
+    """
+    return ", ".join(_quote(_serialized_name(a)) for a in fields(cls))
+
+
+def insert_sql(cls, table=None, paramstyle="qmark"):
+    """
+    Return an ``INSERT`` statement for all fields of *cls*.
+
+    The columns are the keys that `attr.asdict` uses -- the names of the
+    fields or their ``alias``\\ es -- in the order of `attr.fields`, so the
+    parameters are the tuples that `values_getter` returns.
+
+    :param type cls: An ``attrs``-decorated class.
+    :param str table: The name of the table.  Defaults to the name of
+        *cls*.
+    :param str paramstyle: The ``paramstyle`` of the driver.  ``"qmark"``
+        (`sqlite3`), ``"numeric"``, and ``"format"`` are supported.
+
+    :rtype: str
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+    :raise ValueError: If *paramstyle* is not supported.
+
+    ..  versionadded:: 21.1.0
+    """
+    try:
+        placeholder = _PLACEHOLDERS[paramstyle]
+    except KeyError:
+        raise ValueError(
+            "Unsupported paramstyle {paramstyle!r}.".format(
+                paramstyle=paramstyle
+            )
+        )
+
+    return "INSERT INTO {table} ({columns}) VALUES ({values})".format(
+        table=_quote(table if table is not None else cls.__name__),
+        columns=_columns(cls),
+        values=", ".join(placeholder(i) for i in range(len(fields(cls)))),
+    )
+
+
+def select_sql(cls, table=None):
+    """
+    Return a ``SELECT`` statement for all fields of *cls* in the order that
+    `row_factory` expects.
+
+    Append a ``WHERE`` clause as needed.
+
+    :param type cls: An ``attrs``-decorated class.
+    :param str table: The name of the table.  Defaults to the name of
+        *cls*.
+
+    :rtype: str
+
+    ..  versionadded:: 21.1.0
+    """
+    return "SELECT {columns} FROM {table}".format(
+        columns=_columns(cls),
+        table=_quote(table if table is not None else cls.__name__),
+    )
+
+
+def values_getter(cls):
+    """
+    Return a callable that returns the field values of an instance of *cls*
+    as a tuple in the order of `attr.fields`.
+
+    For classes with more than one field, it's a cached
+    `operator.attrgetter`.  Use it to turn instances into parameters of
+    `insert_sql`.
+
+    ..  versionadded:: 21.1.0
+    """
+    return _values_getter(cls)
+
+
+def insert_many(cursor, cls, instances, table=None, paramstyle="qmark"):
+    """
+    Insert all *instances* of *cls* using a single ``executemany`` call.
+
+    The parameters are produced lazily from *instances* by `values_getter`,
+    so neither intermediate dicts nor a list of all rows are built.
+
+    :param cursor: A DB-API cursor or a `sqlite3.Connection`.
+    :param type cls: An ``attrs``-decorated class.
+    :param instances: An iterable of instances of *cls*.
+    :param str table: See `insert_sql`.
+    :param str paramstyle: See `insert_sql`.
+
+    :return: Whatever ``cursor.executemany`` returns.
+
+    ..  versionadded:: 21.1.0
+    """
+    return cursor.executemany(
+        insert_sql(cls, table, paramstyle),
+        imap(_values_getter(cls), instances),
+    )
+
+
+def row_factory(cls):
+    """
+    Return a `sqlite3` *row_factory* that turns rows into instances of
+    *cls*.
+
+    The rows must consist of the fields of *cls* in the order of
+    `attr.fields`, like the results of `select_sql`.  Like unpickling, the
+    instances are created without calling ``__init__``, so neither
+    converters nor validators run and values are used as the driver returns
+    them.  For instance, `sqlite3` returns `bool`\\ s as `int`\\ s.
+
+    :param type cls: An ``attrs``-decorated class.
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+
+    ..  versionadded:: 21.1.0
+    """
+    constructor = _trusted_constructor(cls)
+
+    def factory(cursor, row):
+        return constructor(*row)
+
+    return factory
@@ -0,0 +1,17 @@
+from typing import Any, Callable, Iterable, Optional, Tuple, Type, TypeVar
+
+_T = TypeVar("_T")
+
+def insert_sql(
+    cls: type, table: Optional[str] = ..., paramstyle: str = ...
+) -> str: ...
+def select_sql(cls: type, table: Optional[str] = ...) -> str: ...
+def values_getter(cls: Type[_T]) -> Callable[[_T], Tuple[Any, ...]]: ...
+def insert_many(
+    cursor: Any,
+    cls: Type[_T],
+    instances: Iterable[_T],
+    table: Optional[str] = ...,
+    paramstyle: str = ...,
+) -> Any: ...
+def row_factory(cls: Type[_T]) -> Callable[[Any, Tuple[Any, ...]], _T]: ...
@@ -4,8 +4,15 @@ Commonly useful filters for `attr.asdict`.
 
 from __future__ import absolute_import, division, print_function
 
-from ._compat import isclass
-from ._make import Attribute
+from ._compat import isclass, string_types
+from ._make import (
+    Attribute,
+    _omit_defaults,
+    _serialized_name,
+    attrib,
+    attrs,
+    fields,
+)
 
 
 def _split_what(what):
@@ -18,35 +25,195 @@ def _split_what(what):
     )
 
 
+class _PathNode(object):
+    """
+    A node in the tree of dotted paths of a filter.
+
+    A node without children is the end of a path.
+    """
+
+    __slots__ = ("children",)
+
+    def __init__(self):
+        self.children = {}
+
+
+_ALL = _PathNode()
+"""
+Node of everything below the end of an included path.
+"""
+
+
+def _build_path_tree(what):
+    """
+    Parse the dotted paths in *what* into a tree of `_PathNode`\\ s.
+
+    Returns ``None`` if there are no paths.
+    """
+    paths = [p for p in what if isinstance(p, string_types)]
+    if not paths:
+        return None
+
+    root = _PathNode()
+    for path in paths:
+        names = path.split(".")
+        if not all(names):
+            raise ValueError("Invalid attribute path {!r}.".format(path))
+
+        node = root
+        for name in names:
+            child = node.children.get(name)
+            if child is None:
+                child = node.children[name] = _PathNode()
+            elif not child.children:
+                # A shorter path already covers this one.
+                break
+            node = child
+        else:
+            # Longer paths are covered by this one.
+            node.children.clear()
+
+    return root
+
+
+@attrs(slots=True, frozen=True, repr=False)
+class _Filter(object):
+    """
+    A filter whose decisions that only depend on the attribute are computed
+    once per class and path and then reused by `attr.asdict` and
+    `attr.astuple`.
+    """
+
+    _include = attrib()
+    _classes = attrib()
+    _attrs = attrib()
+    _paths = attrib()
+    _plans = attrib(init=False, factory=dict, eq=False)
+
+    def __call__(self, attribute, value):
+        """
+        Decide about *attribute* with *value* on the top level.
+
+        Paths can only be fully honored by `attr.asdict` and `attr.astuple`
+        which know where they are within the object graph.
+        """
+        if self._include:
+            return (
+                value.__class__ in self._classes
+                or attribute in self._attrs
+                or (
+                    self._paths is not None
+                    and attribute.name in self._paths.children
+                )
+            )
+
+        return (
+            value.__class__ not in self._classes
+            and attribute not in self._attrs
+            and not (
+                self._paths is not None
+                and attribute.name in self._paths.children
+                and not self._paths.children[attribute.name].children
+            )
+        )
+
+    def _keeps_value(self, value):
+        """
+        The part of the decision that depends on the value.
+        """
+        return (value.__class__ in self._classes) is self._include
+
+    def _plan(self, cls, node):
+        """
+        Return a tuple of ``(attribute, name, check, child_node)`` for every
+        attribute of *cls* that is not dropped statically at *node*.
+
+        *name* is the key of the attribute in the results of `attr.asdict`.
+
+        *check* is ``None`` if the attribute is kept unconditionally,
+        otherwise a callable that decides based on the value.  *child_node*
+        is the position within the paths for values of the attribute.
+        """
+        key = (cls, node)
+        try:
+            return self._plans[key]
+        except KeyError:
+            pass
+
+        check = self._keeps_value if self._classes else None
+        plan = []
+        for a in fields(cls):
+            sub = node.children.get(a.name) if node is not None else None
+            name = _serialized_name(a)
+            if self._include:
+                if node is _ALL:
+                    plan.append((a, name, None, _ALL))
+                elif sub is not None:
+                    plan.append((a, name, None, sub if sub.children else _ALL))
+                elif a in self._attrs:
+                    plan.append((a, name, None, None))
+                elif check is not None:
+                    plan.append((a, name, check, None))
+            elif a not in self._attrs and (sub is None or sub.children):
+                plan.append((a, name, check, sub))
+
+        plan = tuple(plan)
+        self._plans[key] = plan
+
+        return plan
+
+    def _plan_omitting_defaults(self, cls, node):
+        """
+        Return `_plan` with checks that drop values that equal the default.
+        """
+        key = (cls, node, "omit_defaults")
+        try:
+            return self._plans[key]
+        except KeyError:
+            plan = self._plans[key] = _omit_defaults(
+                cls, self._plan(cls, node)
+            )
+
+            return plan
+
+    def __repr__(self):
+        return "<{kind} filter>".format(
+            kind="include" if self._include else "exclude"
+        )
+
+
 def include(*what):
     """
     Whitelist *what*.
 
-    :param what: What to whitelist.
-    :type what: `list` of `type` or `attr.Attribute`\\ s
+    :param what: What to whitelist.  Dotted paths like ``"order.items.sku"``
+        are resolved from the instance passed to `attr.asdict` or
+        `attr.astuple` and include the whole path.  Collections are
+        transparent: ``items`` may be a list of instances.
+    :type what: `list` of `type`, `attr.Attribute`\\ s, or `str`\\ s
 
     :rtype: `callable`
+
+    ..  versionchanged:: 21.1.0 Accept dotted paths.
     """
     cls, attrs = _split_what(what)
 
-    def include_(attribute, value):
-        return value.__class__ in cls or attribute in attrs
-
-    return include_
+    return _Filter(True, cls, attrs, _build_path_tree(what))
 
 
 def exclude(*what):
     """
     Blacklist *what*.
 
-    :param what: What to blacklist.
-    :type what: `list` of classes or `attr.Attribute`\\ s.
+    :param what: What to blacklist.  Dotted paths like ``"order.items.sku"``
+        are resolved from the instance passed to `attr.asdict` or
+        `attr.astuple` and exclude the last attribute of the path.
+    :type what: `list` of classes, `attr.Attribute`\\ s, or `str`\\ s.
 
     :rtype: `callable`
+
+    ..  versionchanged:: 21.1.0 Accept dotted paths.
     """
     cls, attrs = _split_what(what)
 
-    def exclude_(attribute, value):
-        return value.__class__ not in cls and attribute not in attrs
-
-    return exclude_
+    return _Filter(False, cls, attrs, _build_path_tree(what))
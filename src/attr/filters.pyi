@@ -1,5 +1,5 @@
 from typing import Union, Any
 from . import Attribute, _FilterType
 
-def include(*what: Union[type, Attribute[Any]]) -> _FilterType[Any]: ...
-def exclude(*what: Union[type, Attribute[Any]]) -> _FilterType[Any]: ...
+def include(*what: Union[type, Attribute[Any], str]) -> _FilterType[Any]: ...
+def exclude(*what: Union[type, Attribute[Any], str]) -> _FilterType[Any]: ...
@@ -0,0 +1,159 @@
+"""
+Streaming `JSON Lines <https://jsonlines.org/>`_ serialization of ``attrs``
+instances.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import json
+
+from ._compat import PY2
+from ._funcs import TaggedUnion, _from_dict_function, has
+from ._make import (
+    _class_cache,
+    _generate_unique_filename,
+    _make_methods,
+    _serialized_name,
+    fields,
+)
+
+
+__all__ = ["read", "write"]
+
+
+def _to_dict(cls):
+    """
+    Return the compiled function that returns the fields of an instance of
+    *cls* as a flat dict.
+
+    Nested values are taken care of by the `json` encoder.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["jsonl_to_dict"]
+    except KeyError:
+        pass
+
+    items = ", ".join(
+        "%r: inst.%s" % (_serialized_name(a), a.name) for a in fields(cls)
+    )
+    script = "def to_dict(inst):\n    return {%s}" % (items,)
+    filename = _generate_unique_filename(cls, "JSON Lines encoder")
+    fn = _make_methods(script, filename)["to_dict"]
+    _class_cache(cls)["jsonl_to_dict"] = fn
+
+    return fn
+
+
+def _default(o):
+    """
+    Convert values the `json` module doesn't know.
+    """
+    if has(o.__class__):
+        return _to_dict(o.__class__)(o)
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+
+    raise TypeError(
+        "Object of type {cls} is not JSON serializable.".format(
+            cls=o.__class__.__name__
+        )
+    )
+
+
+_encode = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, default=_default
+).encode
+_decode = json.JSONDecoder().decode
+
+if PY2:
+    _encode_str = _encode
+
+    def _encode(obj):
+        """
+        Always return text, even if *obj* is pure ASCII.
+        """
+        rv = _encode_str(obj)
+        if isinstance(rv, str):
+            rv = rv.decode("utf-8")
+
+        return rv
+
+
+def write(fp, instances, chunk_size=1000):
+    """
+    Write *instances* to the text file *fp*, one JSON object per line.
+
+    The objects have the same keys as the results of `attr.asdict`,
+    including ``alias``\\ es.  Nested ``attrs`` instances become nested
+    objects, sets and tuples become arrays.  The code that turns instances
+    of a class into dicts is compiled once per class.
+
+    *instances* is consumed lazily.  The encoded lines are collected and
+    written using a single ``fp.write`` for every *chunk_size* instances, so
+    memory usage is bounded by *chunk_size*.
+
+    :param fp: A file-like object opened in text mode.
+    :param instances: An iterable of ``attrs`` instances.
+    :param int chunk_size: The number of lines per ``fp.write``.
+
+    :return: The number of written instances.
+    :rtype: int
+
+    :raise attr.exceptions.NotAnAttrsClassError: If an item of *instances*
+        is not an ``attrs`` instance.
+    :raise TypeError: If a value is not JSON serializable.
+
+    ..  versionadded:: 21.1.0
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+
+    count = 0
+    cls = to_dict = None
+    lines = []
+    for inst in instances:
+        if inst.__class__ is not cls:
+            cls = inst.__class__
+            to_dict = _to_dict(cls)
+        lines.append(_encode(to_dict(inst)))
+        if len(lines) == chunk_size:
+            lines.append("")
+            fp.write("\n".join(lines))
+            count += chunk_size
+            del lines[:]
+
+    if lines:
+        lines.append("")
+        fp.write("\n".join(lines))
+        count += len(lines) - 1
+
+    return count
+
+
+def read(fp, cls):
+    """
+    Iterate over the instances of *cls* in the JSON Lines file *fp*.
+
+    Lines are read and structured one by one using `attr.from_dict`'s
+    compiled code for *cls*, so memory usage doesn't depend on the size of
+    *fp*.  Blank lines are skipped.
+
+    :param fp: An iterable of lines, usually a file object opened in text
+        mode.
+    :param cls: An ``attrs``-decorated class or an `attr.TaggedUnion` to
+        pick the class of each line from.
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+    :raise ValueError: If a line is not valid JSON.
+    :raise KeyError: If a line lacks the key of a field without a default.
+
+    ..  versionadded:: 21.1.0
+    """
+    if isinstance(cls, TaggedUnion):
+        structure = cls.structure
+    else:
+        structure = _from_dict_function(cls)
+    for line in fp:
+        if line.strip():
+            yield structure(_decode(line))
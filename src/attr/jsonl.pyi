@@ -0,0 +1,13 @@
+from typing import IO, Any, Iterable, Iterator, Type, TypeVar, overload
+
+from . import TaggedUnion
+
+_T = TypeVar("_T")
+
+def write(
+    fp: IO[str], instances: Iterable[Any], chunk_size: int = ...
+) -> int: ...
+@overload
+def read(fp: Iterable[str], cls: Type[_T]) -> Iterator[_T]: ...
+@overload
+def read(fp: Iterable[str], cls: TaggedUnion) -> Iterator[Any]: ...
@@ -0,0 +1,414 @@
+"""
+Versioned schema migrations that are applied while structuring dicts.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from ._funcs import TaggedUnion, _structure, has
+from ._make import (
+    NOTHING,
+    Factory,
+    _class_cache,
+    _generate_unique_filename,
+    _make_methods,
+    _serialized_name,
+    attrib,
+    attrs,
+    fields,
+)
+
+
+__all__ = [
+    "default",
+    "drop",
+    "load",
+    "rename",
+    "split",
+    "transform",
+    "version",
+    "versioned",
+]
+
+_ABSENT = (None, False)
+"""
+The slot of a key that has been removed.
+"""
+
+
+class _Compiler(object):
+    """
+    Tracks where the value of every key is after each step.
+
+    The slot of a key is a tuple of the expression of its value and its
+    condition: ``None`` if it's always present, ``False`` if it's never
+    present, or an expression that is true if it's present.  Conditions only
+    ever look at the original dict, so they stay valid throughout.
+    """
+
+    __slots__ = ("lines", "globs", "slots")
+
+    def __init__(self):
+        self.lines = []
+        self.globs = {}
+        self.slots = {}
+
+    def slot(self, key):
+        try:
+            return self.slots[key]
+        except KeyError:
+            return ("d[%r]" % (key,), "%r in d" % (key,))
+
+    def name(self, value):
+        """
+        Make *value* available to the generated code.
+        """
+        name = "_attrs_g%d" % (len(self.globs),)
+        self.globs[name] = value
+
+        return name
+
+    def assign(self, cond, expr):
+        """
+        Assign *expr* to a new local if *cond* is true and return its name.
+        """
+        var = "v%d" % (len(self.lines),)
+        if cond is None:
+            self.lines.append("    %s = %s" % (var, expr))
+        else:
+            self.lines.append(
+                "    if %s:\n        %s = %s" % (cond, var, expr)
+            )
+
+        return var
+
+
+@attrs(slots=True, frozen=True)
+class _Rename(object):
+    old = attrib()
+    new = attrib()
+
+    def _compile(self, c):
+        expr, cond = c.slot(self.old)
+        c.slots[self.old] = _ABSENT
+        if cond is False:
+            return
+
+        new_expr, new_cond = c.slot(self.new)
+        if cond is None or new_cond is False:
+            c.slots[self.new] = (expr, cond)
+            return
+
+        # Keep the value of *new* if *old* is missing.
+        if new_cond is not None:
+            new_cond = "(%s or %s)" % (cond, new_cond)
+        var = c.assign(new_cond, "%s if %s else %s" % (expr, cond, new_expr))
+        c.slots[self.new] = (var, new_cond)
+
+
+@attrs(slots=True, frozen=True)
+class _Drop(object):
+    key = attrib()
+
+    def _compile(self, c):
+        c.slots[self.key] = _ABSENT
+
+
+@attrs(slots=True, frozen=True)
+class _Default(object):
+    key = attrib()
+    value = attrib()
+
+    def _compile(self, c):
+        expr, cond = c.slot(self.key)
+        if cond is None:
+            return
+
+        if isinstance(self.value, Factory):
+            value = c.name(self.value.factory) + "()"
+        else:
+            value = c.name(self.value)
+        if cond is not False:
+            value = "%s if %s else %s" % (expr, cond, value)
+        c.slots[self.key] = (c.assign(None, value), None)
+
+
+@attrs(slots=True, frozen=True)
+class _Transform(object):
+    key = attrib()
+    fn = attrib()
+
+    def _compile(self, c):
+        expr, cond = c.slot(self.key)
+        if cond is False:
+            return
+
+        var = c.assign(cond, "%s(%s)" % (c.name(self.fn), expr))
+        c.slots[self.key] = (var, cond)
+
+
+@attrs(slots=True, frozen=True)
+class _Split(object):
+    key = attrib()
+    into = attrib(converter=tuple)
+    fn = attrib()
+
+    def _compile(self, c):
+        expr, cond = c.slot(self.key)
+        c.slots[self.key] = _ABSENT
+        if cond is False:
+            for key in self.into:
+                c.slots[key] = _ABSENT
+            return
+
+        var = c.assign(cond, "%s(%s)" % (c.name(self.fn), expr))
+        for i, key in enumerate(self.into):
+            item = "%s[%d]" % (var, i)
+            prev_expr, prev_cond = c.slot(key)
+            if cond is None or prev_cond is False:
+                c.slots[key] = (item, cond)
+                continue
+
+            # Keep the previous value of *key* if *self.key* is missing.
+            if prev_cond is not None:
+                prev_cond = "(%s or %s)" % (cond, prev_cond)
+            item_var = c.assign(
+                prev_cond, "%s if %s else %s" % (item, cond, prev_expr)
+            )
+            c.slots[key] = (item_var, prev_cond)
+
+
+def rename(old, new):
+    """
+    Move the value of the key *old* to the key *new* if *old* is present.
+    """
+    return _Rename(old, new)
+
+
+def drop(key):
+    """
+    Remove *key*.
+    """
+    return _Drop(key)
+
+
+def default(key, value):
+    """
+    Set *key* to *value* if it's missing.
+
+    *value* can be an `attr.Factory` without *takes_self*, whose factory is
+    called for every dict that lacks *key*.
+    """
+    if isinstance(value, Factory) and value.takes_self:
+        raise ValueError("Factories of migrations can't take self.")
+
+    return _Default(key, value)
+
+
+def transform(key, fn):
+    """
+    Replace the value of *key* by the result of calling *fn* with it if
+    *key* is present.
+    """
+    return _Transform(key, fn)
+
+
+def split(key, into, fn):
+    """
+    Replace *key* by the keys *into* if it's present.
+
+    *fn* is called with the value of *key* and must return a sequence of
+    values, one for each key in *into*.
+    """
+    return _Split(key, into, fn)
+
+
+@attrs(slots=True, frozen=True)
+class _Migrations(object):
+    version = attrib()
+    steps = attrib()
+    key = attrib()
+
+
+def versioned(version, steps=None, key=None):
+    """
+    A class decorator that declares that *version* is the current version
+    of the schema of the decorated ``attrs`` class.
+
+    Dicts of older versions are upgraded by `load`.
+
+    :param int version: The current version.
+    :param dict steps: A dict mapping versions to lists of `rename`, `drop`,
+        `default`, `transform`, and `split` steps that upgrade a dict of
+        that version to the next one.  Versions without changes may be left
+        out.
+    :param str key: The key of dicts that stores their version, if any.
+
+    :raise ValueError: If a version in *steps* is not older than *version*.
+
+    ..  versionadded:: 21.1.0
+    """
+    steps = dict(steps or {})
+    for v in steps:
+        if not 0 <= v < version:
+            raise ValueError(
+                "Steps of version {v!r} can't upgrade to version "
+                "{version!r}.".format(v=v, version=version)
+            )
+
+    migrations = _Migrations(
+        version, dict((v, tuple(s)) for v, s in steps.items()), key
+    )
+
+    def wrap(cls):
+        cls.__attrs_migrations__ = migrations
+
+        return cls
+
+    return wrap
+
+
+def _migrations(cls):
+    """
+    Return the `_Migrations` of *cls*.
+    """
+    fields(cls)
+    try:
+        return cls.__attrs_migrations__
+    except AttributeError:
+        raise ValueError("{cls!r} has no versioned schema.".format(cls=cls))
+
+
+def version(cls):
+    """
+    Return the current version of the schema of *cls*.
+
+    Store it along with the dicts of instances of *cls* to be able to
+    `load` them after the schema changed.
+
+    :raise ValueError: If *cls* is not `versioned`.
+
+    ..  versionadded:: 21.1.0
+    """
+    return _migrations(cls).version
+
+
+def _loader(cls, from_version):
+    """
+    Return the compiled function that upgrades dicts of *from_version* to
+    the current version of *cls* and structures them.
+    """
+    migrations = _migrations(cls)
+    cache = _class_cache(cls).setdefault("migrations", {})
+    try:
+        return cache[from_version]
+    except KeyError:
+        pass
+
+    if from_version not in range(migrations.version + 1):
+        raise ValueError(
+            "Can't upgrade version {from_version!r} of {cls!r} to version "
+            "{version!r}.".format(
+                from_version=from_version,
+                cls=cls,
+                version=migrations.version,
+            )
+        )
+
+    c = _Compiler()
+    for v in range(from_version, migrations.version):
+        for step in migrations.steps.get(v, ()):
+            step._compile(c)
+
+    structure = c.name(_structure)
+    args = []
+    optional = []
+    for a in fields(cls):
+        if a.init is False:
+            continue
+
+        arg_name = a.name.lstrip("_")
+        key = _serialized_name(a)
+        expr, cond = c.slot(key)
+        if cond is False:
+            if a.default is NOTHING:
+                c.lines.append("    raise KeyError(%r)" % (key,))
+            continue
+
+        if a.type is not None and (
+            isinstance(a.type, TaggedUnion) or has(a.type)
+        ):
+            expr = "%s(%s, %s)" % (structure, c.name(a.type), expr)
+
+        if cond is None:
+            args.append("%s=%s" % (arg_name, expr))
+        elif a.default is NOTHING:
+            if not expr.startswith("d["):
+                # Missing locals must raise the same error as missing keys.
+                c.lines.append(
+                    "    if not (%s):\n        raise KeyError(%r)"
+                    % (cond, key)
+                )
+            args.append("%s=%s" % (arg_name, expr))
+        else:
+            optional.append(
+                "    if %s:\n        kw[%r] = %s" % (cond, arg_name, expr)
+            )
+
+    if optional:
+        c.lines.append("    kw = {}")
+        c.lines.extend(optional)
+        args.append("**kw")
+
+    c.globs["_attrs_cls"] = cls
+    script = "\n".join(
+        ["def load(d):"]
+        + c.lines
+        + ["    return _attrs_cls(%s)" % (", ".join(args),)]
+    )
+    fn = _make_methods(
+        script, _generate_unique_filename(cls, "migrations"), c.globs
+    )["load"]
+    cache[from_version] = fn
+
+    return fn
+
+
+def load(cls, d, version=None):
+    """
+    Upgrade the dict *d* of the schema version *version* to the current
+    version of *cls* and create an instance of *cls* from it like
+    `attr.from_dict`.
+
+    The steps between any two versions are compiled once into a single
+    function that reads the values straight from *d* and passes them to
+    ``__init__``, so neither *d* is copied nor intermediate dicts are built.
+    Nested dicts are structured using `attr.from_dict`; use `transform` to
+    upgrade them.
+
+    :param type cls: A `versioned` ``attrs`` class.
+    :param dict d: The dict to load.
+    :param int version: The version of *d*.  Defaults to the value of the
+        version *key* of *cls* in *d*.
+
+    :raise ValueError: If *cls* is not `versioned`, if *version* is
+        unknown, or if *version* is not passed and *cls* has no version
+        *key*.
+    :raise KeyError: If *d* lacks the key of a field without a default
+        after the upgrade.
+
+    ..  versionadded:: 21.1.0
+    """
+    if version is None:
+        key = _migrations(cls).key
+        if key is None:
+            raise ValueError(
+                "{cls!r} has no version key, pass a version.".format(cls=cls)
+            )
+        version = d[key]
+
+    try:
+        fn = cls.__dict__["__attrs_cache__"]["migrations"][version]
+    except KeyError:
+        fn = _loader(cls, version)
+
+    return fn(d)
@@ -0,0 +1,33 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+_T = TypeVar("_T")
+_C = TypeVar("_C", bound=type)
+
+class _Step: ...
+
+def rename(old: str, new: str) -> _Step: ...
+def drop(key: str) -> _Step: ...
+def default(key: str, value: Any) -> _Step: ...
+def transform(key: str, fn: Callable[[Any], Any]) -> _Step: ...
+def split(
+    key: str, into: Iterable[str], fn: Callable[[Any], Sequence[Any]]
+) -> _Step: ...
+def versioned(
+    version: int,
+    steps: Optional[Dict[int, Iterable[_Step]]] = ...,
+    key: Optional[str] = ...,
+) -> Callable[[_C], _C]: ...
+def version(cls: type) -> int: ...
+def load(
+    cls: Type[_T], d: Mapping[str, Any], version: Optional[int] = ...
+) -> _T: ...
@@ -0,0 +1,350 @@
+"""
+Conversion of ``attrs`` instances from and to NumPy structured arrays.
+
+NumPy is only imported when it's needed.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from itertools import starmap
+
+from . import _records
+from ._funcs import has
+from ._make import (
+    _class_cache,
+    _generate_unique_filename,
+    _make_methods,
+    _obj_setattr,
+    _trusted_constructor,
+    _values_getter,
+    fields,
+)
+
+
+__all__ = ["dtype", "from_array", "records", "to_array"]
+
+_DTYPES = {bool: "?", int: "<i8", float: "<f8", complex: "<c16"}
+
+
+def _numpy():
+    """
+    Import NumPy lazily.
+    """
+    import numpy
+
+    return numpy
+
+
+def _field_dtype(cls, a, seen):
+    """
+    Return the dtype spec of the field *a* of *cls*.
+    """
+    spec = a.metadata.get("numpy_dtype")
+    if spec is not None:
+        return spec
+
+    spec = _DTYPES.get(a.type)
+    if spec is not None:
+        return spec
+
+    if a.type is not None and has(a.type):
+        return _dtype_spec(a.type, seen)
+
+    raise TypeError(
+        "Field {name!r} of {cls!r} has no fixed-size NumPy dtype.".format(
+            name=a.name, cls=cls
+        )
+    )
+
+
+def _dtype_spec(cls, seen=()):
+    """
+    Return the list of ``(name, spec)`` tuples of the dtype of *cls*.
+    """
+    if cls in seen:
+        raise TypeError(
+            "{cls!r} contains itself and has no fixed size.".format(cls=cls)
+        )
+    seen = seen + (cls,)
+
+    return [(str(a.name), _field_dtype(cls, a, seen)) for a in fields(cls)]
+
+
+def dtype(cls):
+    """
+    Return the structured `numpy.dtype` of instances of *cls*.
+
+    There's one field per ``attrs`` field with the same name and order.
+    Fields whose type is `bool`, `int`, `float`, or `complex` become
+    ``?``, ``<i8``, ``<f8``, and ``<c16`` respectively.  Fields whose type
+    is an ``attrs`` class become nested structured fields.  Every other
+    field needs a NumPy dtype in its ``numpy_dtype`` metadata, for example
+    ``attr.ib(type=str, metadata={"numpy_dtype": "U16"})``.
+
+    The dtype is computed once per class.
+
+    :param type cls: An ``attrs``-decorated class.
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+    :raise TypeError: If a field of *cls* has no fixed-size dtype.
+
+    ..  versionadded:: 21.1.0
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["numpy_dtype"]
+    except KeyError:
+        pass
+
+    dt = _numpy().dtype(_dtype_spec(cls))
+    _class_cache(cls)["numpy_dtype"] = dt
+
+    return dt
+
+
+def _is_nested(a):
+    """
+    Whether the field *a* is stored as a nested structured field.
+    """
+    return (
+        a.metadata.get("numpy_dtype") is None
+        and a.type is not None
+        and has(a.type)
+    )
+
+
+def _nested(cls, inst, record, globs):
+    """
+    Return the expression that produces the nested tuple of the values of
+    the instance *inst* of *cls* and the expression that rebuilds the
+    instance from the nested tuple *record*.
+    """
+    constructor = "_attrs_c%d" % (len(globs),)
+    globs[constructor] = _trusted_constructor(cls)
+
+    values = []
+    args = []
+    for i, a in enumerate(fields(cls)):
+        value = "%s.%s" % (inst, a.name)
+        arg = "%s[%d]" % (record, i)
+        if _is_nested(a):
+            value, arg = _nested(a.type, value, arg, globs)
+        values.append(value)
+        args.append(arg)
+
+    return (
+        "(%s)" % ("".join(v + ", " for v in values),),
+        "%s(%s)" % (constructor, ", ".join(args)),
+    )
+
+
+def _converters(cls):
+    """
+    Return the functions that turn instances of *cls* into nested tuples and
+    rows of tuples into lists of instances.
+    """
+    try:
+        return cls.__dict__["__attrs_cache__"]["numpy_converters"]
+    except KeyError:
+        pass
+
+    dtype(cls)
+    if any(_is_nested(a) for a in fields(cls)):
+        globs = {}
+        to_record, from_record = _nested(cls, "inst", "r", globs)
+        script = "\n".join(
+            [
+                "def to_record(inst):",
+                "    return " + to_record,
+                "def from_record(r):",
+                "    return " + from_record,
+            ]
+        )
+        methods = _make_methods(
+            script, _generate_unique_filename(cls, "NumPy converters"), globs
+        )
+        from_record = methods["from_record"]
+        converters = (
+            methods["to_record"],
+            lambda rows: list(map(from_record, rows)),
+        )
+    else:
+        # Flat classes don't need any generated code.
+        constructor = _trusted_constructor(cls)
+        converters = (
+            _values_getter(cls),
+            lambda rows: list(starmap(constructor, rows)),
+        )
+    _class_cache(cls)["numpy_converters"] = converters
+
+    return converters
+
+
+def to_array(instances, cls=None):
+    """
+    Return a structured `numpy.ndarray` of the field values of *instances*.
+
+    :param instances: An iterable of instances of *cls*.
+    :param type cls: An ``attrs``-decorated class.  Defaults to the class of
+        the first instance.
+
+    :raise ValueError: If *instances* is empty and no *cls* is passed.
+    :raise TypeError: If a field of *cls* has no fixed-size dtype.
+
+    ..  versionadded:: 21.1.0
+    """
+    if not isinstance(instances, (list, tuple)):
+        instances = list(instances)
+    if cls is None:
+        if not instances:
+            raise ValueError("Pass cls to convert no instances.")
+        cls = instances[0].__class__
+
+    to_record = _converters(cls)[0]
+
+    return _numpy().array(list(map(to_record, instances)), dtype=dtype(cls))
+
+
+def _check_dtype(cls, arr):
+    """
+    Raise a `TypeError` if *arr* doesn't have the `dtype` of *cls*.
+    """
+    if arr.dtype != dtype(cls):
+        raise TypeError(
+            "The array has the dtype {actual!r} instead of the dtype "
+            "{expected!r} of {cls!r}.".format(
+                actual=arr.dtype, expected=dtype(cls), cls=cls
+            )
+        )
+
+
+def from_array(cls, arr):
+    """
+    Return a list of instances of *cls* from the structured array *arr*.
+
+    The field values are converted to Python objects using
+    `numpy.ndarray.tolist`.  Like unpickling, the instances are created
+    without calling ``__init__``, so neither converters nor validators nor
+    ``__attrs_post_init__`` run.
+
+    :param type cls: An ``attrs``-decorated class.
+    :param numpy.ndarray arr: A one-dimensional array of `dtype` of *cls*.
+
+    :raise TypeError: If *arr* has a different dtype.
+
+    ..  versionadded:: 21.1.0
+    """
+    _check_dtype(cls, arr)
+
+    return _converters(cls)[1](arr.tolist())
+
+
+def _record_class(cls):
+    """
+    Return the class of the record views of *cls*.
+    """
+    return _records._record_class(
+        cls, _ArrayRecord, "numpy_record_class", _properties
+    )
+
+
+def _properties(cls):
+    """
+    Return the properties of the record views of *cls*.
+    """
+    return dict(
+        (
+            a.name,
+            _nested_property(a.name, _record_class(a.type))
+            if _is_nested(a)
+            else _property(a.name),
+        )
+        for a in fields(cls)
+    )
+
+
+def _property(name):
+    """
+    Return a read-only property for the field *name* of a record.
+    """
+
+    def get(self):
+        return self._attrs_record[name].tolist()
+
+    return property(get)
+
+
+def _nested_property(name, record_class):
+    """
+    Return a read-only property for the nested record *name*.
+    """
+
+    def get(self):
+        return record_class(self._attrs_record[name])
+
+    return property(get)
+
+
+class _ArrayRecord(_records._Record):
+    """
+    Base class of the record views of a structured array.
+    """
+
+    __slots__ = ("_attrs_record",)
+
+    def __init__(self, record):
+        _obj_setattr(self, "_attrs_record", record)
+
+
+class Records(object):
+    """
+    A read-only sequence of record views on a structured array.
+
+    Create it using `records`.
+
+    ..  versionadded:: 21.1.0
+    """
+
+    __slots__ = ("array", "_record_class")
+
+    def __init__(self, arr, record_class):
+        self.array = arr
+        self._record_class = record_class
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Records(self.array[index], self._record_class)
+
+        return self._record_class(self.array[index])
+
+    def __iter__(self):
+        record_class = self._record_class
+        for record in self.array:
+            yield record_class(record)
+
+
+def records(cls, arr):
+    """
+    Return a sequence of read-only, zero-copy views on the rows of the
+    structured array *arr*.
+
+    The views have the fields of *cls* as attributes, look like instances of
+    *cls*, and compare equal to views and instances with equal values.
+    Field values are read from *arr* when they are accessed, so changes to
+    *arr* are visible.  Nested ``attrs`` classes are nested views.
+
+    :param type cls: An ``attrs``-decorated class.
+    :param numpy.ndarray arr: A one-dimensional array of `dtype` of *cls*.
+
+    :rtype: Records
+
+    :raise TypeError: If *arr* has a different dtype.
+
+    ..  versionadded:: 21.1.0
+    """
+    _check_dtype(cls, arr)
+
+    return Records(arr, _record_class(cls))
@@ -0,0 +1,15 @@
+from typing import Any, Iterable, Iterator, List, Optional, Type, TypeVar
+
+_T = TypeVar("_T")
+
+def dtype(cls: type) -> Any: ...
+def to_array(instances: Iterable[Any], cls: Optional[type] = ...) -> Any: ...
+def from_array(cls: Type[_T], arr: Any) -> List[_T]: ...
+
+class Records:
+    array: Any
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: Any) -> Any: ...
+    def __iter__(self) -> Iterator[Any]: ...
+
+def records(cls: type, arr: Any) -> Records: ...
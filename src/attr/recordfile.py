@@ -0,0 +1,341 @@
+"""
+Memory-mapped files of ``attrs`` instances with a fixed binary layout.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import mmap
+import os
+import struct
+
+from . import _records
+from ._make import _obj_setattr, fields
+from .binary import _codec, _field_format
+
+
+__all__ = ["RecordFile", "open"]
+
+_MAGIC = b"ATTRSREC"
+_HEADER = struct.Struct("<8sII")
+
+
+def _format(cls):
+    """
+    Return the `struct` format of *cls* as `bytes`.
+    """
+    fmt = _codec(cls).struct.format
+    if not isinstance(fmt, bytes):
+        fmt = fmt.encode("ascii")
+
+    return fmt
+
+
+def _view_class(cls):
+    """
+    Return the class of the record views of *cls*.
+    """
+    return _records._record_class(
+        cls, _BufferRecord, "recordfile_view_class", _properties
+    )
+
+
+def _properties(cls):
+    """
+    Return the properties of the record views of *cls*, which unpack the
+    values of the fields from their offsets in the layout of `attr.binary`.
+    """
+    rv = {}
+    offset = 0
+    for a in fields(cls):
+        fmt = _field_format(cls, a)
+        if fmt is None:
+            rv[a.name] = _nested_property(offset, _view_class(a.type))
+            offset += _codec(a.type).struct.size
+        else:
+            s = struct.Struct("<" + fmt)
+            rv[a.name] = _property(offset, s.unpack_from)
+            offset += s.size
+
+    return rv
+
+
+def _property(offset, unpack_from):
+    """
+    Return a read-only property that unpacks a value at *offset*.
+    """
+
+    def get(self):
+        return unpack_from(self._attrs_buf, self._attrs_offset + offset)[0]
+
+    return property(get)
+
+
+def _nested_property(offset, view_class):
+    """
+    Return a read-only property for the nested record at *offset*.
+    """
+
+    def get(self):
+        return view_class(self._attrs_buf, self._attrs_offset + offset)
+
+    return property(get)
+
+
+class _BufferRecord(_records._Record):
+    """
+    Base class of the record views of packed instances in a buffer.
+    """
+
+    __slots__ = ("_attrs_buf", "_attrs_offset")
+
+    def __init__(self, buf, offset):
+        _obj_setattr(self, "_attrs_buf", buf)
+        _obj_setattr(self, "_attrs_offset", offset)
+
+
+class RecordFile(object):
+    """
+    A file of packed instances of an ``attrs`` class that is mapped into
+    memory.
+
+    Create it using `open`.
+
+    Indexing and iterating return read-only views that have the fields of
+    *cls* as attributes and unpack their values from the mapping when they
+    are accessed.  The views look like instances of *cls* and compare equal
+    to views and instances with equal values.  Nested ``attrs`` classes are
+    nested views.
+
+    ..  versionadded:: 21.1.0
+    """
+
+    __slots__ = (
+        "cls",
+        "_file",
+        "_writable",
+        "_size",
+        "_start",
+        "_len",
+        "_map",
+        "_mapped",
+        "_codec",
+        "_view_class",
+    )
+
+    def __init__(self, f, cls, writable, start, length):
+        self.cls = cls
+        self._file = f
+        self._writable = writable
+        self._codec = _codec(cls)
+        self._size = self._codec.struct.size
+        self._start = start
+        self._len = length
+        self._view_class = _view_class(cls)
+        self._map = None
+        self._mapped = 0
+        self._remap()
+
+    def __repr__(self):
+        return "<attr.recordfile.RecordFile of {n} {cls} records>".format(
+            n=self._len, cls=self.cls.__name__
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._len
+
+    def _remap(self):
+        """
+        Map everything that has been appended so far.
+
+        Views of earlier mappings keep them alive, so they stay valid.
+        """
+        self._file.flush()
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mapped = self._len
+
+    def _check_writable(self):
+        if not self._writable:
+            raise io.UnsupportedOperation("The record file is read-only.")
+
+    def append(self, inst):
+        """
+        Append *inst* at the end of the file.
+
+        :raise TypeError: If *inst* is not an instance of *cls*.
+        """
+        self._check_writable()
+        if inst.__class__ is not self.cls:
+            raise TypeError(
+                "Only instances of {cls!r} can be appended.".format(
+                    cls=self.cls
+                )
+            )
+
+        self._file.write(self._codec.pack(inst))
+        self._len += 1
+
+    def extend(self, instances):
+        """
+        Append all *instances* using a single write.
+        """
+        self._check_writable()
+        cls = self.cls
+        pack = self._codec.pack
+        data = []
+        for inst in instances:
+            if inst.__class__ is not cls:
+                raise TypeError(
+                    "Only instances of {cls!r} can be appended.".format(
+                        cls=cls
+                    )
+                )
+            data.append(pack(inst))
+
+        self._file.write(b"".join(data))
+        self._len += len(data)
+
+    def _offset(self, index):
+        """
+        Return the offset of the record *index* in the mapping.
+        """
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("RecordFile index out of range")
+        if index >= self._mapped:
+            self._remap()
+
+        return self._start + index * self._size
+
+    def __getitem__(self, index):
+        offset = self._offset(index)
+
+        return self._view_class(self._map, offset)
+
+    def read(self, index):
+        """
+        Return the record *index* as an instance of *cls*.
+
+        Like unpickling, neither converters nor validators nor
+        ``__attrs_post_init__`` run.
+        """
+        offset = self._offset(index)
+
+        return self._codec.unpack(self._map, offset)
+
+    def __iter__(self):
+        if self._mapped < self._len:
+            self._remap()
+
+        view_class = self._view_class
+        buf = self._map
+        size = self._size
+        start = self._start
+        for offset in range(start, start + self._mapped * size, size):
+            yield view_class(buf, offset)
+
+    def flush(self):
+        """
+        Write all appended records to the disk.
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """
+        Close the file.  Views that are still around keep the mapping open
+        until they are garbage-collected.
+        """
+        self._map = None
+        self._file.close()
+
+
+def open(path, cls, mode="r"):
+    """
+    Open the record file of *cls* at *path*.
+
+    A record file consists of a short header with the layout of *cls*
+    followed by its instances packed back-to-back using `attr.binary`, so
+    *cls* must only have fields with a fixed size.  The file is mapped into
+    memory using `mmap` and records are only read from the mapping when
+    their fields are accessed, so files may be much bigger than the
+    available memory.
+
+    Appended records are written to the end of the file and the mapping is
+    renewed when they are accessed.
+
+    :param str path: The path of the file.
+    :param type cls: An ``attrs``-decorated class with a fixed binary
+        layout.
+    :param str mode: ``"r"`` to read an existing file, ``"a"`` to read and
+        append to an existing or new file, and ``"w"`` to create an empty
+        file, replacing any existing one.
+
+    :rtype: RecordFile
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+    :raise TypeError: If a field of *cls* has no fixed-size binary format.
+    :raise ValueError: If the file has been created for a different layout
+        or has been truncated.
+
+    ..  versionadded:: 21.1.0
+    """
+    fmt = _format(cls)
+    size = _codec(cls).struct.size
+    if size == 0:
+        raise ValueError(
+            "Instances of {cls!r} take up no space.".format(cls=cls)
+        )
+
+    if mode == "r":
+        f = io.open(path, "rb")
+    elif mode == "a":
+        f = io.open(path, "a+b")
+    elif mode == "w":
+        f = io.open(path, "w+b")
+    else:
+        raise ValueError("Invalid mode {mode!r}.".format(mode=mode))
+
+    try:
+        f.seek(0)
+        header = f.read(_HEADER.size)
+        if not header and mode != "r":
+            header = _HEADER.pack(_MAGIC, size, len(fmt))
+            f.write(header + fmt)
+            f.seek(_HEADER.size)
+
+        if len(header) == _HEADER.size:
+            magic, _, fmt_len = _HEADER.unpack(header)
+        else:
+            magic = None
+        if magic != _MAGIC:
+            raise ValueError(
+                "{path!r} is not a record file.".format(path=path)
+            )
+        if f.read(fmt_len) != fmt:
+            raise ValueError(
+                "{path!r} doesn't contain records of {cls!r}.".format(
+                    path=path, cls=cls
+                )
+            )
+
+        start = _HEADER.size + fmt_len
+        length, rest = divmod(os.fstat(f.fileno()).st_size - start, size)
+        if rest:
+            raise ValueError(
+                "{path!r} ends with an incomplete record.".format(path=path)
+            )
+        f.seek(0, io.SEEK_END)
+
+        return RecordFile(f, cls, mode != "r", start, length)
+    except BaseException:
+        f.close()
+        raise
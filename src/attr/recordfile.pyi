@@ -0,0 +1,32 @@
+from types import TracebackType
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+_T = TypeVar("_T")
+
+class RecordFile(Generic[_T]):
+    cls: Type[_T]
+    def __enter__(self) -> RecordFile[_T]: ...
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> Any: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def append(self, inst: _T) -> None: ...
+    def extend(self, instances: Iterable[_T]) -> None: ...
+    def read(self, index: int) -> _T: ...
+    def flush(self) -> None: ...
+    def close(self) -> None: ...
+
+def open(path: str, cls: Type[_T], mode: str = ...) -> RecordFile[_T]: ...
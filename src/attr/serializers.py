@@ -0,0 +1,129 @@
+"""
+Commonly useful value serializers for `attr.asdict`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from ._compat import isclass
+from ._make import _class_cache, fields
+
+
+__all__ = ["Registry", "dispatch", "register", "registry"]
+
+
+class Registry(object):
+    """
+    A *value_serializer* for `attr.asdict` that looks up hooks by the type of
+    the value.
+
+    Hooks have the same signature as *value_serializer*.  They are resolved
+    by the exact type of the value first and then by its MRO.  The results
+    of the lookups are cached, so values whose type has no hook cost one
+    dict lookup and no call at all when serialized using `attr.asdict`.
+
+    Additionally, fields whose type is a class that is unrelated to all
+    registered types are not looked at at all.  Therefore values *must*
+    adhere to the type of their fields.
+
+    A `Registry` is also a callable with the signature of
+    *value_serializer*, so it works anywhere a hook is expected.
+
+    .. versionadded:: 21.1.0
+    """
+
+    __slots__ = ("_hooks", "_cache", "_unhooked", "_version")
+
+    def __init__(self):
+        self._hooks = {}
+        self._cache = {}
+        self._unhooked = {}
+        self._version = 0
+
+    def __repr__(self):
+        return "<attr.serializers.Registry with {n} hooks>".format(
+            n=len(self._hooks)
+        )
+
+    def register(self, type, hook):
+        """
+        Serialize values of *type* and its subclasses using *hook*.
+
+        :param type type: The type to register *hook* for.
+        :param callable hook: A callable that receives the current instance,
+            field, and value and returns the serialized value.
+        """
+        if not isclass(type):
+            raise TypeError("Hooks can only be registered for classes.")
+
+        self._hooks[type] = hook
+        self._cache.clear()
+        self._unhooked.clear()
+        self._version += 1
+
+    def dispatch(self, cls):
+        """
+        Return the hook that is responsible for values of *cls* or ``None``.
+
+        :param type cls: The type of a value.
+        """
+        try:
+            return self._cache[cls]
+        except KeyError:
+            pass
+
+        hook = None
+        for base in getattr(cls, "__mro__", (cls,)):
+            hook = self._hooks.get(base)
+            if hook is not None:
+                break
+
+        self._cache[cls] = hook
+
+        return hook
+
+    def __call__(self, inst, field, value):
+        hook = self.dispatch(value.__class__)
+        if hook is None:
+            return value
+
+        return hook(inst, field, value)
+
+    def _unhooked_fields(self, cls):
+        """
+        Return a frozenset of the names of the fields of *cls* whose types
+        guarantee that none of our hooks apply.
+        """
+        # The token is dropped by attr.resolve_types together with the rest
+        # of the class cache, so the names are recomputed for the new types.
+        try:
+            token, names = self._unhooked[cls]
+            if cls.__dict__["__attrs_cache__"].get("types_token") is token:
+                return names
+        except KeyError:
+            pass
+
+        names = frozenset(
+            a.name
+            for a in fields(cls)
+            if isclass(a.type)
+            and not any(
+                issubclass(t, a.type) or issubclass(a.type, t)
+                for t in self._hooks
+            )
+        )
+        token = _class_cache(cls).setdefault("types_token", object())
+        self._unhooked[cls] = (token, names)
+
+        return names
+
+
+registry = Registry()
+"""
+The default `Registry`.
+
+Pass it as *value_serializer* to `attr.asdict` to use the hooks that have
+been registered using `register`.
+"""
+
+register = registry.register
+dispatch = registry.dispatch
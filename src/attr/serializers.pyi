@@ -0,0 +1,15 @@
+from typing import Any, Optional, Type
+
+from . import _ValueSerializerType
+
+class Registry:
+    def register(
+        self, type: Type[Any], hook: _ValueSerializerType
+    ) -> None: ...
+    def dispatch(self, cls: Type[Any]) -> Optional[_ValueSerializerType]: ...
+    def __call__(self, inst: Any, field: Any, value: Any) -> Any: ...
+
+registry: Registry
+
+def register(type: Type[Any], hook: _ValueSerializerType) -> None: ...
+def dispatch(cls: Type[Any]) -> Optional[_ValueSerializerType]: ...
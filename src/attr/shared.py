@@ -0,0 +1,237 @@
+"""
+Read-only ``attrs`` records in shared memory that many processes can use
+without copying or unpickling them.
+
+Needs `multiprocessing.shared_memory` which is only available on Python 3.8
+and later.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import struct
+
+from .binary import _codec
+from .recordfile import _format, _view_class
+
+
+__all__ = ["SharedRecords", "attach", "create"]
+
+_MAGIC = b"ATTRSSHM"
+_HEADER = struct.Struct("<8sIIQ")
+
+
+def _shared_memory(**kw):
+    """
+    Import `multiprocessing.shared_memory` lazily and create a
+    `multiprocessing.shared_memory.SharedMemory`.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    if not kw.get("create"):
+        try:
+            # Attaching processes must not unlink the memory on exit.
+            return SharedMemory(track=False, **kw)
+        except TypeError:  # pragma: no cover
+            # Python < 3.13
+            pass
+
+    return SharedMemory(**kw)
+
+
+class SharedRecords(object):
+    """
+    A read-only sequence of instances of an ``attrs`` class in shared
+    memory.
+
+    Create it using `create` and `attach`.  Pickling it -- for example by
+    passing it to a `multiprocessing` worker -- only pickles its `name` and
+    *cls*, unpickling attaches to the same memory.
+
+    Indexing and iterating return read-only views like the ones of
+    `attr.recordfile.RecordFile` that unpack their field values from the
+    shared memory when they are accessed.  They never touch the reference
+    counts of the shared data, so the memory stays shared between forked
+    processes too.
+
+    ..  versionadded:: 21.1.0
+    """
+
+    __slots__ = ("cls", "_shm", "_len", "_size", "_view_class", "_codec")
+
+    def __init__(self, shm, cls, length):
+        self.cls = cls
+        self._shm = shm
+        self._len = length
+        self._codec = _codec(cls)
+        self._size = self._codec.struct.size
+        self._view_class = _view_class(cls)
+
+    @property
+    def name(self):
+        """
+        The name of the shared memory block.
+        """
+        return self._shm.name
+
+    def __reduce__(self):
+        return attach, (self._shm.name, self.cls)
+
+    def __repr__(self):
+        return (
+            "<attr.shared.SharedRecords of {n} {cls} records in {name!r}>"
+        ).format(n=self._len, cls=self.cls.__name__, name=self._shm.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._len
+
+    def _offset(self, index):
+        """
+        Return the offset of the record *index*.
+        """
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SharedRecords index out of range")
+
+        return _HEADER.size + index * self._size
+
+    def __getitem__(self, index):
+        return self._view_class(self._shm.buf, self._offset(index))
+
+    def read(self, index):
+        """
+        Return the record *index* as an instance of *cls*.
+
+        Like unpickling, neither converters nor validators nor
+        ``__attrs_post_init__`` run.
+        """
+        return self._codec.unpack(self._shm.buf, self._offset(index))
+
+    def __iter__(self):
+        view_class = self._view_class
+        buf = self._shm.buf
+        size = self._size
+        start = _HEADER.size
+        for offset in range(start, start + self._len * size, size):
+            yield view_class(buf, offset)
+
+    def close(self):
+        """
+        Detach from the shared memory.  Views must not be used afterwards.
+        """
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Free the shared memory once all processes have closed it.
+
+        Call it exactly once, usually in the process that created it.
+        """
+        self._shm.unlink()
+
+
+def create(cls, instances, name=None):
+    """
+    Pack *instances* into a new block of shared memory.
+
+    The instances are packed back-to-back using `attr.binary`, so *cls*
+    must only have fields with a fixed size.  Since the records can't be
+    changed, *cls* is usually frozen.
+
+    :param type cls: An ``attrs``-decorated class with a fixed binary
+        layout.
+    :param instances: An iterable of instances of *cls*.
+    :param str name: The name of the shared memory block.  A random one is
+        picked by default.
+
+    :rtype: SharedRecords
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+    :raise TypeError: If a field of *cls* has no fixed-size binary format or
+        an item of *instances* is not an instance of *cls*.
+    :raise ImportError: On Python versions before 3.8.
+
+    ..  versionadded:: 21.1.0
+    """
+    codec = _codec(cls)
+    fmt = _format(cls)
+    size = codec.struct.size
+    if size == 0:
+        raise ValueError(
+            "Instances of {cls!r} take up no space.".format(cls=cls)
+        )
+    if not isinstance(instances, (list, tuple)):
+        instances = list(instances)
+    for inst in instances:
+        if inst.__class__ is not cls:
+            raise TypeError(
+                "Only instances of {cls!r} can be shared.".format(cls=cls)
+            )
+
+    # The layout is checked by attach; the format goes after the records.
+    end = _HEADER.size + len(instances) * size
+    fmt_end = end + len(fmt)
+    shm = _shared_memory(name=name, create=True, size=fmt_end)
+    try:
+        buf = shm.buf
+        _HEADER.pack_into(buf, 0, _MAGIC, size, len(fmt), len(instances))
+        pack_into = codec.pack_into
+        for offset, inst in zip(range(_HEADER.size, end, size), instances):
+            pack_into(buf, offset, inst)
+        buf[end:fmt_end] = fmt
+        del buf
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+
+    return SharedRecords(shm, cls, len(instances))
+
+
+def attach(name, cls):
+    """
+    Attach to the shared records of *cls* called *name* that `create`
+    created.
+
+    :param str name: The `SharedRecords.name` of the records.
+    :param type cls: The class of the records.
+
+    :rtype: SharedRecords
+
+    :raise ValueError: If the shared memory block doesn't contain records
+        of *cls*.
+
+    ..  versionadded:: 21.1.0
+    """
+    fmt = _format(cls)
+    shm = _shared_memory(name=name)
+    try:
+        if shm.size < _HEADER.size:
+            magic = None
+        else:
+            magic, size, fmt_len, length = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC:
+            raise ValueError(
+                "{name!r} doesn't contain shared records.".format(name=name)
+            )
+
+        end = _HEADER.size + length * size
+        fmt_end = end + fmt_len
+        if bytes(shm.buf[end:fmt_end]) != fmt:
+            raise ValueError(
+                "{name!r} doesn't contain records of {cls!r}.".format(
+                    name=name, cls=cls
+                )
+            )
+    except BaseException:
+        shm.close()
+        raise
+
+    return SharedRecords(shm, cls, length)
@@ -0,0 +1,27 @@
+from types import TracebackType
+from typing import Any, Generic, Iterable, Iterator, Optional, Type, TypeVar
+
+_T = TypeVar("_T")
+
+class SharedRecords(Generic[_T]):
+    cls: Type[_T]
+    @property
+    def name(self) -> str: ...
+    def __enter__(self) -> SharedRecords[_T]: ...
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> Any: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def read(self, index: int) -> _T: ...
+    def close(self) -> None: ...
+    def unlink(self) -> None: ...
+
+def create(
+    cls: Type[_T], instances: Iterable[_T], name: Optional[str] = ...
+) -> SharedRecords[_T]: ...
+def attach(name: str, cls: Type[_T]) -> SharedRecords[_T]: ...
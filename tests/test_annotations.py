@@ -578,3 +578,22 @@ class TestAnnotations:
 
         assert typing.List[B] == attr.fields(A).a.type
         assert A == attr.fields(B).a.type
+
+    def test_resolve_types_clears_class_cache(self):
+        """
+        Resolving types invalidates plans that have been derived from the
+        unresolved types.
+        """
+
+        @attr.s(auto_attribs=True)
+        class A:
+            a: "int"
+
+        r = attr.serializers.Registry()
+        r.register(str, lambda inst, field, value: value)
+
+        assert frozenset() == r._unhooked_fields(A)
+
+        attr.resolve_types(A, globals(), locals())
+
+        assert frozenset(["a"]) == r._unhooked_fields(A)
@@ -0,0 +1,309 @@
+"""
+Tests for `attr._async`.
+
+Python 3.6+ only.
+"""
+
+import asyncio
+
+from collections import OrderedDict
+from datetime import date
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+import attr
+
+from attr.exceptions import NotAnAttrsClassError
+from attr.filters import exclude
+from attr.serializers import Registry
+
+from .strategies import nested_classes
+
+
+def run(coro):
+    """
+    Run *coro* in a new event loop.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@attr.s
+class Leaf(object):
+    when = attr.ib()
+    tags = attr.ib(factory=set)
+
+
+@attr.s
+class Node(object):
+    name = attr.ib()
+    children = attr.ib(factory=list)
+    index = attr.ib(factory=dict)
+    leaf = attr.ib(default=None, type=Leaf)
+    pair = attr.ib(default=(1, 2))
+
+
+def tree(depth, width):
+    """
+    Return a tree of `Node`\\ s.
+    """
+    leaf = Leaf(date(2021, 1, 1), {"a"})
+    if depth == 0:
+        return Node("leaf", leaf=leaf)
+
+    children = [tree(depth - 1, width) for _ in range(width)]
+
+    return Node(
+        "n%d" % (depth,),
+        children,
+        {"first": children[0], leaf.when: [leaf, (leaf,)]},
+        leaf,
+    )
+
+
+TREE = tree(4, 4)
+
+
+class TestAsDictAsync(object):
+    """
+    Tests for `asdict_async`.
+    """
+
+    @given(nested_classes)
+    def test_hypothesis(self, C):
+        """
+        The results equal the results of asdict.
+        """
+        inst = C()
+
+        assert attr.asdict(inst) == run(attr.asdict_async(inst, chunk_size=1))
+
+    @pytest.mark.parametrize(
+        "kw",
+        [
+            {},
+            {"dict_factory": OrderedDict},
+            {"retain_collection_types": True},
+            {"omit_defaults": True},
+            {"filter": exclude(attr.fields(Node).pair)},
+            {"filter": lambda a, v: a.name != "index"},
+            {"value_serializer": lambda inst, a, v: repr(v)},
+        ],
+    )
+    def test_options(self, kw):
+        """
+        All options have the same effect as with asdict.
+        """
+        assert attr.asdict(TREE, **kw) == run(attr.asdict_async(TREE, **kw))
+
+    def test_registry(self):
+        """
+        Registries work like with asdict.
+        """
+        r = Registry()
+        r.register(date, lambda inst, a, v: v.isoformat())
+        r.register(set, lambda inst, a, v: sorted(v))
+
+        assert attr.asdict(TREE, value_serializer=r) == run(
+            attr.asdict_async(TREE, value_serializer=r)
+        )
+
+    def test_yields(self):
+        """
+        Control is handed back to the event loop every chunk_size steps.
+        """
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def main(chunk_size):
+            del ticks[:]
+            t = asyncio.ensure_future(ticker())
+            rv = await attr.asdict_async(TREE, chunk_size=chunk_size)
+            t.cancel()
+
+            return rv, len(ticks)
+
+        rv, few = run(main(10000))
+        rv2, many = run(main(10))
+
+        assert rv == rv2
+        assert few < 5
+        assert many > 100
+
+    def test_time_slice(self):
+        """
+        With a time_slice of zero, every step yields.
+        """
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def main():
+            t = asyncio.ensure_future(ticker())
+            await attr.asdict_async(
+                Node("x", [1, 2, 3]), chunk_size=10000, time_slice=0
+            )
+            t.cancel()
+
+        run(main())
+
+        assert len(ticks) >= 3
+
+    def test_deep(self):
+        """
+        Graphs deeper than the recursion limit work.
+        """
+        n = Node("0")
+        for i in range(5000):
+            n = Node(str(i), [n])
+
+        d = run(attr.asdict_async(n))
+
+        for _ in range(5000):
+            d = d["children"][0]
+        assert "0" == d["name"]
+
+    @pytest.mark.parametrize("container", [list, dict, None])
+    def test_cycle(self, container):
+        """
+        Reference cycles raise a ValueError instead of growing forever.
+        """
+        n = Node("0")
+        if container is list:
+            n.children.append(Node("1", [n]))
+        elif container is dict:
+            n.children.append({"self": n})
+        else:
+            n.children.append(n.children)
+
+        with pytest.raises(ValueError) as e:
+            run(attr.asdict_async(n))
+
+        assert (
+            "Circular reference detected while serializing {!r}.".format(
+                list if container is None else Node
+            ),
+        ) == e.value.args
+
+    def test_shared(self):
+        """
+        Shared instances that don't form a cycle are serialized each time.
+        """
+        shared = Node("s")
+        n = Node("0", [shared, shared], {"s": shared})
+
+        assert attr.asdict(n) == run(attr.asdict_async(n))
+
+    def test_not_attrs(self):
+        """
+        Non-attrs instances and non-positive chunk sizes raise errors.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            run(attr.asdict_async(object()))
+        with pytest.raises(ValueError):
+            run(attr.asdict_async(TREE, chunk_size=0))
+
+
+@attr.s
+class Circle(object):
+    radius = attr.ib()
+    kind = attr.ib(default="circle", init=False, metadata={"tag": True})
+
+
+@attr.s
+class Square(object):
+    side = attr.ib()
+    kind = attr.ib(default="square", init=False, metadata={"tag": True})
+
+
+SHAPE = attr.TaggedUnion("kind", [Circle, Square])
+
+
+@attr.s
+class Drawing(object):
+    shape = attr.ib(type=SHAPE)
+    _inner: "Drawing" = attr.ib(default=None)
+    title = attr.ib(default="", metadata={"alias": "Title"})
+
+
+attr.resolve_types(Drawing)
+
+
+class TestFromDictAsync(object):
+    """
+    Tests for `from_dict_async`.
+    """
+
+    def test_equal(self):
+        """
+        The results equal the results of from_dict.
+        """
+        d = attr.asdict(
+            Drawing(Circle(1), Drawing(Square(2), title="inner"), "outer")
+        )
+
+        assert attr.from_dict(Drawing, d) == run(
+            attr.from_dict_async(Drawing, d, chunk_size=1)
+        )
+
+    def test_union(self):
+        """
+        Tagged unions pick the class.
+        """
+        assert Square(3) == run(
+            attr.from_dict_async(SHAPE, {"kind": "square", "side": 3})
+        )
+
+    def test_deep(self):
+        """
+        Dicts deeper than the recursion limit work.
+        """
+        d = {"shape": {"kind": "circle", "radius": 0}}
+        for i in range(5000):
+            d = {"shape": {"kind": "circle", "radius": i + 1}, "_inner": d}
+
+        rv = run(attr.from_dict_async(Drawing, d))
+
+        assert Circle(5000) == rv.shape
+        assert Circle(4999) == rv._inner.shape
+
+    @pytest.mark.parametrize(
+        "d, exc",
+        [
+            ({"shape": {"kind": "circle"}}, KeyError),
+            ({"shape": {"kind": "triangle"}}, ValueError),
+            ({}, KeyError),
+        ],
+    )
+    def test_errors(self, d, exc):
+        """
+        Errors are the same as with from_dict.
+        """
+        with pytest.raises(exc):
+            attr.from_dict(Drawing, d)
+        with pytest.raises(exc):
+            run(attr.from_dict_async(Drawing, d))
+
+    @given(st.integers(min_value=1, max_value=5))
+    def test_chunk_sizes(self, chunk_size):
+        """
+        The chunk size doesn't change the result.
+        """
+        d = {"shape": {"kind": "square", "side": 1}, "_inner": None}
+
+        assert Drawing(Square(1)) == run(
+            attr.from_dict_async(Drawing, d, chunk_size=chunk_size)
+        )
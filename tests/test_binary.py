@@ -0,0 +1,208 @@
+"""
+Tests for `attr.binary`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import struct
+
+from array import array
+
+import pytest
+
+import attr
+
+from attr._compat import PY2
+from attr.binary import iter_unpack, pack, pack_into, size, unpack
+from attr.exceptions import NotAnAttrsClassError
+
+
+@attr.s(frozen=True)
+class Point(object):
+    x = attr.ib(type=int)
+    y = attr.ib(type=float)
+
+
+@attr.s(slots=True, frozen=True, cache_hash=True, hash=True)
+class Label(object):
+    at = attr.ib(type=Point)
+    text = attr.ib(type=bytes, metadata={"binary_format": "4s"})
+    visible = attr.ib(type=bool)
+
+
+class TestPack(object):
+    """
+    Tests for `pack` and `pack_into`.
+    """
+
+    def test_layout(self):
+        """
+        Fields are packed little-endian, in order, and without padding.
+        Nested classes are packed in place.
+        """
+        assert struct.pack("<qd4s?", 1, 2.0, b"ab", True) == pack(
+            Label(Point(1, 2.0), b"ab", True)
+        )
+        assert 21 == size(Label)
+
+    def test_pack_into(self):
+        """
+        Instances can be packed into existing buffers.
+        """
+        buf = bytearray(20)
+        pack_into(buf, 4, Point(1, 2.0))
+
+        assert b"\x00" * 4 + pack(Point(1, 2.0)) == buf
+
+    def test_not_fixed(self):
+        """
+        Fields without a fixed size raise a TypeError.
+        """
+
+        @attr.s
+        class C(object):
+            x = attr.ib(type=str)
+
+        with pytest.raises(TypeError) as e:
+            pack(C("a"))
+
+        assert (
+            "Field 'x' of {!r} has no fixed-size binary format.".format(C),
+        ) == e.value.args
+
+    def test_recursive(self):
+        """
+        Classes that contain themselves raise a TypeError.
+        """
+
+        @attr.s
+        class C(object):
+            x = attr.ib()
+
+        object.__setattr__(attr.fields(C).x, "type", C)
+
+        with pytest.raises(TypeError):
+            size(C)
+
+    def test_multiple_values(self):
+        """
+        Formats must describe exactly one value.
+        """
+
+        @attr.s
+        class C(object):
+            x = attr.ib(metadata={"binary_format": "2q"})
+
+        with pytest.raises(ValueError):
+            size(C)
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise an error.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            size(object)
+
+    def test_value_error(self):
+        """
+        Values that don't fit their format raise struct.error.
+        """
+        with pytest.raises(struct.error):
+            pack(Point(2 ** 64, 0.0))
+
+    def test_no_fields(self):
+        """
+        Classes without fields pack into nothing.
+        """
+
+        @attr.s
+        class C(object):
+            pass
+
+        assert b"" == pack(C())
+        assert C() == unpack(C, b"")
+
+
+class TestUnpack(object):
+    """
+    Tests for `unpack` and `iter_unpack`.
+    """
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_roundtrip(self, wrap):
+        """
+        Packed instances can be unpacked from any buffer.
+        """
+        label = Label(Point(-1, 2.5), b"abcd", False)
+
+        assert label == unpack(Label, wrap(pack(label)))
+
+    def test_offset(self):
+        """
+        Unpacking can start at an offset.
+        """
+        assert Point(1, 2.0) == unpack(
+            Point, b"\x00\x00" + pack(Point(1, 2.0)), 2
+        )
+
+    def test_no_init(self):
+        """
+        Unpacking doesn't run __init__ and resets the cached hash.
+        """
+        label = Label(Point(1, 2.0), b"abcd", True)
+        hash(label)
+
+        rv = unpack(Label, pack(label))
+
+        assert None is rv._attrs_cached_hash
+        assert hash(label) == hash(rv)
+
+    def test_padding(self):
+        """
+        Strings are padded to their fixed size.
+        """
+        rv = unpack(Label, pack(Label(Point(1, 2.0), b"a", True)))
+
+        assert b"a\x00\x00\x00" == rv.text
+
+    def test_too_short(self):
+        """
+        Short buffers raise struct.error.
+        """
+        with pytest.raises(struct.error):
+            unpack(Point, b"\x00")
+
+    def test_iter_unpack(self):
+        """
+        Instances packed back-to-back can be iterated over.
+        """
+        points = [Point(i, i / 2) for i in range(3)]
+
+        assert points == list(
+            iter_unpack(Point, b"".join(pack(p) for p in points))
+        )
+
+    @pytest.mark.skipif(PY2, reason="Arrays have no new-style buffers.")
+    def test_iter_unpack_typed_buffer(self):
+        """
+        The size of typed buffers is their size in bytes.
+        """
+
+        @attr.s
+        class Vector(object):
+            x = attr.ib(type=float)
+            y = attr.ib(type=float)
+
+        buf = memoryview(array("d", [1.0, 2.0, 3.0, 4.0]))
+
+        assert [Vector(1.0, 2.0), Vector(3.0, 4.0)] == list(
+            iter_unpack(Vector, buf)
+        )
+
+    def test_iter_unpack_size(self):
+        """
+        Buffers whose size is not a multiple of the instance size raise a
+        ValueError.
+        """
+        with pytest.raises(ValueError):
+            list(iter_unpack(Point, b"\x00" * 17))
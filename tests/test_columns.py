@@ -0,0 +1,334 @@
+"""
+Tests for `attr._columns`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import pickle
+
+from array import array
+
+import pytest
+
+import attr
+
+from attr import recordfile
+from attr._columns import _INT_TYPECODE
+from attr.exceptions import NotAnAttrsClassError
+
+
+@attr.s
+class C(object):
+    i = attr.ib(type=int)
+    f = attr.ib(type=float)
+    s = attr.ib(type=str)
+    b = attr.ib(type=bool)
+
+
+class TestToColumns(object):
+    """
+    Tests for `to_columns`.
+    """
+
+    def test_columns(self):
+        """
+        Numeric fields become arrays, everything else becomes lists.  The
+        order of the fields is preserved.
+        """
+        cols = attr.to_columns(
+            [C(1, 1.5, "a", True), C(2, 2.5, "b", False)], C
+        )
+
+        assert ["i", "f", "s", "b"] == list(cols)
+        assert array(_INT_TYPECODE, [1, 2]) == cols["i"]
+        assert array("d", [1.5, 2.5]) == cols["f"]
+        assert ["a", "b"] == cols["s"]
+        assert [True, False] == cols["b"]
+
+    def test_iterable(self):
+        """
+        Any iterable of instances works.
+        """
+        cols = attr.to_columns((C(i, 0.0, "", False) for i in range(3)), C)
+
+        assert array(_INT_TYPECODE, [0, 1, 2]) == cols["i"]
+
+    def test_empty(self):
+        """
+        No instances result in empty columns.
+        """
+        cols = attr.to_columns([], C)
+
+        assert array(_INT_TYPECODE) == cols["i"]
+        assert [] == cols["s"]
+
+    @pytest.mark.parametrize("value", [None, 2 ** 70, 1.5, True])
+    def test_fallback(self, value):
+        """
+        If values don't fit into an array or would change their type, a list
+        is returned.
+        """
+        cols = attr.to_columns([C(1, 0.0, "", False), C(value, 0, "", 0)], C)
+
+        assert [1, value] == cols["i"]
+        assert value.__class__ is cols["i"][1].__class__
+        assert [0.0, 0] == cols["f"]
+        assert int is cols["f"][1].__class__
+
+    def test_not_attrs(self):
+        """
+        Passing a non-attrs class raises an error.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            attr.to_columns([], object)
+
+
+@attr.s
+class P(object):
+    x = attr.ib(type=int)
+    label = attr.ib(repr=lambda v: "<" + v + ">")
+    _index = attr.ib(default=0.0, type=float, repr=False)
+
+
+class TestTable(object):
+    """
+    Tests for `Table`.
+    """
+
+    def test_empty(self):
+        """
+        A new table is empty and uses typed arrays for numeric fields.
+        """
+        t = attr.Table(P)
+
+        assert 0 == len(t)
+        assert P is t.cls
+        assert array(_INT_TYPECODE) == t.column("x")
+        assert [] == t.column("label")
+        assert array("d") == t.column("_index")
+        assert "<attr.Table of 0 P rows>" == repr(t)
+
+    def test_append_extend(self):
+        """
+        Instances can be appended one by one or in bulk.
+        """
+        t = attr.Table(P, [P(1, "a")])
+        t.append(P(2, "b", 1.5))
+        t.extend(P(i, "c") for i in range(3, 5))
+
+        assert 4 == len(t)
+        assert array(_INT_TYPECODE, [1, 2, 3, 4]) == t.column("x")
+        assert ["a", "b", "c", "c"] == t.column("label")
+        assert array("d", [0.0, 1.5, 0.0, 0.0]) == t.column("_index")
+
+    @pytest.mark.parametrize("value", [None, True])
+    @pytest.mark.parametrize("bulk", [True, False])
+    def test_fallback(self, bulk, value):
+        """
+        If a value doesn't fit into its array or would change its type, the
+        column becomes a list.
+        """
+        t = attr.Table(P, [P(1, "a")])
+        if bulk:
+            t.extend([P(value, "b")])
+        else:
+            t.append(P(value, "b"))
+
+        assert [1, value] == t.column("x")
+        assert value is t[1].x
+
+    def test_unknown_column(self):
+        """
+        Asking for a column that doesn't exist raises a KeyError.
+        """
+        with pytest.raises(KeyError):
+            attr.Table(P).column("y")
+
+    def test_rows(self):
+        """
+        Rows have the fields as attributes, compare like instances, and look
+        like instances.
+        """
+        t = attr.Table(P, [P(1, "a"), P(2, "b", 2.0)])
+        row = t[1]
+
+        assert 2 == row.x
+        assert "b" == row.label
+        assert 2.0 == row._index
+        assert "P(x=2, label=<b>)" == repr(row)
+        assert P(2, "b", 2.0) == row
+        assert row == P(2, "b", 2.0)
+        assert row != P(2, "b")
+        assert t[1] == row
+        assert t[0] != row
+        assert row != 42
+        assert t[-1] == row
+        assert [P(1, "a"), P(2, "b", 2.0)] == list(t)
+
+    def test_rows_equal_records(self, tmpdir):
+        """
+        Rows compare equal to the record views of attr.recordfile.
+        """
+
+        @attr.s
+        class R(object):
+            x = attr.ib(type=int)
+            y = attr.ib(type=float)
+
+        insts = [R(1, 2.0), R(3, 4.0)]
+        t = attr.Table(R, insts)
+        with recordfile.open(str(tmpdir.join("r.rec")), R, "w") as rf:
+            rf.extend(insts)
+
+            assert t[0] == rf[0]
+            assert rf[0] == t[0]
+            assert t[0] != rf[1]
+            assert repr(rf[1]) == repr(t[1])
+
+    def test_rows_read_only(self):
+        """
+        Rows can't be changed.
+        """
+        row = attr.Table(P, [P(1, "a")])[0]
+
+        with pytest.raises(AttributeError):
+            row.x = 2
+
+    @pytest.mark.parametrize("index", [2, -3])
+    def test_index_error(self, index):
+        """
+        Indexes out of range raise an IndexError.
+        """
+        with pytest.raises(IndexError):
+            attr.Table(P, [P(1, "a"), P(2, "b")])[index]
+
+    def test_slice(self):
+        """
+        Slicing returns a new table.
+        """
+        t = attr.Table(P, [P(i, str(i)) for i in range(5)])
+        s = t[3:0:-2]
+
+        assert isinstance(s, attr.Table)
+        assert 2 == len(s)
+        assert array(_INT_TYPECODE, [3, 1]) == s.column("x")
+        assert [P(3, "3"), P(1, "1")] == list(s)
+
+    def test_no_fields(self):
+        """
+        Classes without fields work too.
+        """
+
+        @attr.s
+        class E(object):
+            pass
+
+        t = attr.Table(E, [E()])
+        t.append(E())
+
+        assert 2 == len(t)
+        assert [E(), E()] == list(t)
+
+
+@attr.s(frozen=True, slots=True, cache_hash=True)
+class Frozen(object):
+    x = attr.ib(type=int, converter=int)
+    y = attr.ib()
+
+
+@attr.s
+class E(object):
+    pass
+
+
+class TestPackMany(object):
+    """
+    Tests for `pack_many` and `unpack_many`.
+    """
+
+    def test_roundtrip(self):
+        """
+        Packed instances survive pickling and come back equal.
+        """
+        insts = [C(i, i / 2, str(i), bool(i % 2)) for i in range(5)]
+
+        data = pickle.loads(pickle.dumps(attr.pack_many(insts)))
+
+        assert C is data[0]
+        assert 5 == data[1]
+        assert array(_INT_TYPECODE, range(5)) == data[2][0]
+        assert insts == attr.unpack_many(data)
+
+    def test_types_preserved(self):
+        """
+        Values of numeric fields keep their exact types.
+        """
+        (inst,) = attr.unpack_many(attr.pack_many([C(True, 1, "", False)]))
+
+        assert inst.i is True
+        assert int is inst.f.__class__
+
+    @pytest.mark.parametrize(
+        "insts", [[Frozen(1, "a"), Frozen(2, None)], [E(), E()], []]
+    )
+    def test_classes(self, insts):
+        """
+        Frozen classes, slotted classes, classes without fields, and empty
+        iterables work.
+        """
+        rv = attr.unpack_many(attr.pack_many(iter(insts)))
+
+        assert insts == rv
+
+    def test_cache_hash(self):
+        """
+        The hash cache of unpacked instances is reset.
+        """
+        (rv,) = attr.unpack_many(attr.pack_many([Frozen(1, "a")]))
+
+        assert hash(Frozen(1, "a")) == hash(rv)
+
+    def test_no_init(self):
+        """
+        Unpacking doesn't run __init__.
+        """
+        d = attr.pack_many([Frozen(1, 2)])
+        d = (d[0], d[1], (["not an int"], [2]))
+
+        assert "not an int" == attr.unpack_many(d)[0].x
+
+    def test_mixed_classes(self):
+        """
+        Instances of different classes raise a TypeError.
+        """
+
+        @attr.s
+        class Sub(C):
+            extra = attr.ib(default=None)
+
+        with pytest.raises(TypeError, match="Only instances of"):
+            attr.pack_many([C(1, 1.0, "", True), Sub(1, 1.0, "", True)])
+
+    def test_explicit_class(self):
+        """
+        If cls is passed, all instances must be of it.
+        """
+        assert (E, 0, ()) == attr.pack_many([], E)
+
+        with pytest.raises(TypeError):
+            attr.pack_many([C(1, 1.0, "", True)], E)
+
+
+class TestImport(object):
+    """
+    Tests for importing `attr._columns`.
+    """
+
+    def test_access(self):
+        """
+        The public names of attr._columns are available from attr.
+        """
+        from attr import _columns
+
+        for name in ("Table", "pack_many", "to_columns", "unpack_many"):
+            assert getattr(_columns, name) is getattr(attr, name)
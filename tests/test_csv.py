@@ -0,0 +1,142 @@
+"""
+Tests for `attr.csv`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+
+import pytest
+
+import attr
+
+from attr.csv import reader, writer
+from attr.exceptions import NotAnAttrsClassError
+
+
+@attr.s
+class Row(object):
+    sku = attr.ib(type=str, metadata={"alias": "SKU"})
+    count = attr.ib(type=int)
+    price = attr.ib(type=float)
+    active = attr.ib(default=True, type=bool)
+    note = attr.ib(default=None)
+
+
+@attr.s
+class Single(object):
+    _x = attr.ib(converter=lambda v: v.upper())
+
+
+class TestWriter(object):
+    """
+    Tests for `writer`.
+    """
+
+    def test_header_and_rows(self):
+        """
+        The header consists of the keys of asdict, the rows of the field
+        values.
+        """
+        fp = io.StringIO()
+        w = writer(fp, Row)
+        w.writerow(Row("a", 1, 1.5))
+        w.writerows(iter([Row("b", 2, 0.25, False, "n")]))
+
+        assert (
+            u"SKU,count,price,active,note\r\n"
+            u"a,1,1.5,True,\r\n"
+            u"b,2,0.25,False,n\r\n"
+        ) == fp.getvalue()
+
+    def test_no_header(self):
+        """
+        The header can be switched off and fmtparams are passed through.
+        """
+        fp = io.StringIO()
+        writer(fp, Single, header=False, lineterminator="\n").writerows(
+            [Single("a"), Single("b")]
+        )
+
+        assert u"A\nB\n" == fp.getvalue()
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            writer(io.StringIO(), object)
+
+
+class TestReader(object):
+    """
+    Tests for `reader`.
+    """
+
+    def test_round_trip(self):
+        """
+        Reading what has been written returns equal instances with parsed
+        numbers and bools.
+        """
+        rows = [Row("a", 1, 1.5), Row("b", 2, 0.25, False, "n")]
+        fp = io.StringIO()
+        writer(fp, Row).writerows(rows)
+        fp.seek(0)
+
+        assert [Row("a", 1, 1.5, True, ""), rows[1]] == list(reader(fp, Row))
+
+    def test_header_order(self):
+        """
+        Columns are matched by the header, optional ones may be missing, and
+        unknown ones are ignored.
+        """
+        fp = io.StringIO(u"price,extra,count,SKU\n2.5,x,3,c\n")
+
+        assert [Row("c", 3, 2.5)] == list(reader(fp, Row))
+
+    def test_no_header(self):
+        """
+        Without a header, columns are in the order of the fields.
+        """
+        fp = io.StringIO(u"a,1,1.5,false,\n")
+
+        assert [Row("a", 1, 1.5, False, "")] == list(
+            reader(fp, Row, header=False)
+        )
+
+    def test_converters(self):
+        """
+        Converters run and private fields are passed without underscore.
+        """
+        assert [Single("X")] == list(reader(io.StringIO(u"_x\nx\n"), Single))
+
+    def test_missing_column(self):
+        """
+        A missing column of a mandatory field raises a ValueError.
+        """
+        with pytest.raises(ValueError) as e:
+            reader(io.StringIO(u"SKU,count\n"), Row)
+
+        assert (
+            "The CSV header lacks the column 'price' of {!r}.".format(Row),
+        ) == e.value.args
+
+    def test_invalid_bool(self):
+        """
+        Invalid bools raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            list(reader(io.StringIO(u"a,1,1,maybe,\n"), Row, header=False))
+
+    def test_cached(self):
+        """
+        Row builders are compiled once per class and header.
+        """
+        reader(io.StringIO(u"SKU,count,price\n"), Row)
+        reader(io.StringIO(u"SKU,count,price\n"), Row)
+        reader(io.StringIO(u""), Row, header=False)
+
+        assert {
+            ("SKU", "count", "price"),
+            None,
+        } <= set(Row.__attrs_cache__["csv_builders"])
@@ -0,0 +1,163 @@
+"""
+Tests for `attr.dbapi`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sqlite3
+
+import pytest
+
+import attr
+
+from attr.dbapi import (
+    insert_many,
+    insert_sql,
+    row_factory,
+    select_sql,
+    values_getter,
+)
+from attr.exceptions import NotAnAttrsClassError
+
+
+@attr.s(frozen=True, slots=True, cache_hash=True, hash=True)
+class Reading(object):
+    sensor = attr.ib(metadata={"alias": "sensorId"})
+    value = attr.ib()
+    order = attr.ib(default=0)
+
+
+@attr.s
+class Single(object):
+    x = attr.ib()
+
+
+@pytest.fixture(name="conn")
+def _conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        'CREATE TABLE "Reading" ("sensorId" TEXT, "value" REAL, "order" INT)'
+    )
+    yield conn
+    conn.close()
+
+
+class TestSQL(object):
+    """
+    Tests for `insert_sql` and `select_sql`.
+    """
+
+    def test_insert(self):
+        """
+        Columns are quoted keys of asdict in field order.
+        """
+        assert (
+            'INSERT INTO "Reading" ("sensorId", "value", "order") '
+            "VALUES (?, ?, ?)"
+        ) == insert_sql(Reading)
+
+    @pytest.mark.parametrize(
+        "paramstyle, values",
+        [("numeric", ":1, :2, :3"), ("format", "%s, %s, %s")],
+    )
+    def test_paramstyles(self, paramstyle, values):
+        """
+        Placeholders follow the paramstyle and the table can be set.
+        """
+        assert (
+            'INSERT INTO "r""s" ("sensorId", "value", "order") '
+            "VALUES (" + values + ")"
+        ) == insert_sql(Reading, 'r"s', paramstyle)
+
+    def test_unsupported_paramstyle(self):
+        """
+        Named paramstyles raise a ValueError.
+        """
+        with pytest.raises(ValueError) as e:
+            insert_sql(Reading, paramstyle="named")
+
+        assert ("Unsupported paramstyle 'named'.",) == e.value.args
+
+    def test_select(self):
+        """
+        Selects all columns in field order.
+        """
+        assert (
+            'SELECT "sensorId", "value", "order" FROM "readings"'
+            == select_sql(Reading, "readings")
+        )
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            insert_sql(object)
+
+
+class TestValuesGetter(object):
+    """
+    Tests for `values_getter`.
+    """
+
+    @pytest.mark.parametrize(
+        "inst, values",
+        [(Reading("a", 1.0), ("a", 1.0, 0)), (Single(1), (1,))],
+    )
+    def test_tuples(self, inst, values):
+        """
+        Returns tuples of all values, also for single fields.
+        """
+        assert values == values_getter(inst.__class__)(inst)
+
+    def test_empty(self):
+        """
+        Classes without fields produce empty tuples.
+        """
+
+        @attr.s
+        class E(object):
+            pass
+
+        assert () == values_getter(E)(E())
+
+    def test_cached(self):
+        """
+        The getter is created once per class.
+        """
+        assert values_getter(Reading) is values_getter(Reading)
+
+
+class TestSQLite(object):
+    """
+    Round trips through `sqlite3`.
+    """
+
+    def test_round_trip(self, conn):
+        """
+        Instances are inserted lazily and rows become equal instances.
+        """
+        readings = [Reading("s%d" % i, i / 2, i) for i in range(10)]
+        insert_many(conn, Reading, iter(readings))
+        conn.row_factory = row_factory(Reading)
+
+        rv = conn.execute(select_sql(Reading) + ' ORDER BY "order"').fetchall()
+
+        assert readings == rv
+        assert hash(readings[3]) == hash(rv[3])
+
+    def test_no_init(self, conn):
+        """
+        Instances are created without running __init__.
+        """
+
+        @attr.s
+        class C(object):
+            x = attr.ib(validator=attr.validators.instance_of(str))
+
+        conn.row_factory = row_factory(C)
+
+        c = conn.execute("SELECT 42").fetchone()
+
+        assert 42 == c.x
+        assert isinstance(c, C)
@@ -781,6 +781,163 @@ class TestAddInit(object):
         assert 42 == i._private
 
 
+@attr.s(slots=True, frozen=True, copy_deepcopy=True)
+class FrozenCopy(object):
+    x = attr.ib()
+    y = attr.ib()
+
+
+class TestCopy(object):
+    """
+    Tests for the generated `__copy__` and `__deepcopy__`.
+    """
+
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_copy(self, slots):
+        """
+        Shallow copies share the values.
+        """
+
+        @attr.s(slots=slots, copy_deepcopy=True)
+        class C(object):
+            x = attr.ib()
+            y = attr.ib()
+
+        i = C(1, [])
+        c = copy.copy(i)
+
+        assert i == c
+        assert i is not c
+        assert i.y is c.y
+
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_deepcopy(self, slots):
+        """
+        Deep copies copy mutable values, share atomic ones, and work with
+        cycles.
+        """
+
+        @attr.s(slots=slots, copy_deepcopy=True)
+        class C(object):
+            x = attr.ib()
+            y = attr.ib()
+
+        s = "s" * 100
+        i = C(s, [1])
+        i.y.append(i)
+        c = copy.deepcopy(i)
+
+        assert c is not i
+        assert s is c.x
+        assert c.y is not i.y
+        assert c is c.y[1]
+
+    def test_frozen_unchanged(self):
+        """
+        Frozen instances whose values don't change are returned as they are.
+        """
+        i = FrozenCopy(1, ("a", 2.0))
+        memo = {}
+
+        assert i is copy.deepcopy(i, memo)
+        assert i is memo[id(i)]
+
+        i = FrozenCopy(1, [])
+        c = copy.deepcopy(i)
+
+        assert i == c
+        assert i is not c
+
+    def test_extra_attributes(self):
+        """
+        Attributes that are not fields are copied too.
+        """
+
+        @attr.s(copy_deepcopy=True)
+        class C(object):
+            x = attr.ib()
+
+        i = C(1)
+        i.extra = [2]
+        c = copy.deepcopy(i)
+
+        assert [2] == c.extra
+        assert i.extra is not c.extra
+        assert i.extra is copy.copy(i).extra
+
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_cached_hash(self, slots):
+        """
+        Deep copies start with an empty hash cache.
+        """
+
+        @attr.s(slots=slots, frozen=True, cache_hash=True, copy_deepcopy=True)
+        class C(object):
+            x = attr.ib()
+            y = attr.ib(hash=False)
+
+        i = C(1, [])
+        hash(i)
+        c = copy.deepcopy(i)
+
+        assert i is not c
+        assert None is c._attrs_cached_hash
+        assert hash(i) == hash(c)
+
+        i = C(1, ())
+        hash(i)
+
+        assert i is copy.deepcopy(i)
+        assert hash(i) == hash(copy.copy(i))
+
+    def test_subclass(self):
+        """
+        Subclasses that are not attrs classes get their own methods.
+        """
+
+        class Sub(FrozenCopy):
+            pass
+
+        i = Sub(1, [])
+
+        assert Sub is copy.copy(i).__class__
+        assert Sub is copy.deepcopy(i).__class__
+
+    def test_off_by_default(self):
+        """
+        The methods are only attached if asked for.
+        """
+
+        @attr.s
+        class C(object):
+            x = attr.ib()
+
+        assert "__copy__" not in C.__dict__
+        assert "__copy__" in FrozenCopy.__dict__
+
+    def test_exceptions(self):
+        """
+        Exception classes don't get the methods.
+        """
+
+        @attr.s(auto_exc=True, copy_deepcopy=True)
+        class E(Exception):
+            x = attr.ib()
+
+        assert "__copy__" not in E.__dict__
+
+    def test_attribute(self):
+        """
+        Attributes can be copied and evolved.
+        """
+        a = fields(FrozenCopy).x
+        c = copy.copy(a)
+
+        assert a == c
+        assert a is not c
+        assert "y" == a.evolve(name="y").name
+
+
 class TestNothing(object):
     """
     Tests for `_Nothing`.
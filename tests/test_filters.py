@@ -9,7 +9,7 @@ import pytest
 import attr
 
 from attr import fields
-from attr.filters import _split_what, exclude, include
+from attr.filters import _build_path_tree, _split_what, exclude, include
 
 
 @attr.s
@@ -107,3 +107,101 @@ class TestExclude(object):
         """
         e = exclude(*excl)
         assert e(fields(C).a, value) is False
+
+
+class TestPaths(object):
+    """
+    Tests for dotted paths in filters.
+    """
+
+    def test_build_tree(self):
+        """
+        Paths are parsed into a tree, shorter paths cover longer ones.
+        """
+        root = _build_path_tree(("a.b.c", "a.d", "a.b", "e.f", "e", int))
+
+        assert ["a", "e"] == sorted(root.children)
+        assert ["b", "d"] == sorted(root.children["a"].children)
+        assert {} == root.children["a"].children["b"].children
+        assert {} == root.children["e"].children
+
+    def test_text_paths(self):
+        """
+        Text paths work on Python 2 too.
+        """
+        root = _build_path_tree((u"a.b",))
+
+        assert ["a"] == list(root.children)
+        assert ["b"] == list(root.children["a"].children)
+
+    def test_no_paths(self):
+        """
+        Without paths, there's no tree.
+        """
+        assert None is _build_path_tree((int, fields(C).a))
+
+    @pytest.mark.parametrize("path", ["", "a.", ".a", "a..b"])
+    def test_invalid(self, path):
+        """
+        Empty path components raise a ValueError.
+        """
+        with pytest.raises(ValueError) as e:
+            include(path)
+
+        assert ("Invalid attribute path {!r}.".format(path),) == e.value.args
+
+    def test_call(self):
+        """
+        Called directly, filters decide based on the first path component.
+        """
+        i = include("a.x")
+        e = exclude("a", "b.x")
+
+        assert i(fields(C).a, 42) is True
+        assert i(fields(C).b, 42) is False
+        assert e(fields(C).a, 42) is False
+        assert e(fields(C).b, 42) is True
+
+
+class TestPlan(object):
+    """
+    Tests for the per-class plans of filters.
+    """
+
+    def test_static_include(self):
+        """
+        If only attributes are included, the decision is made once and
+        without the need to look at values.
+        """
+        i = include(fields(C).b)
+
+        assert ((fields(C).b, "b", None, None),) == i._plan(C, None)
+
+    def test_static_exclude(self):
+        """
+        Excluded attributes are dropped from the plan.
+        """
+        e = exclude(fields(C).b)
+
+        assert ((fields(C).a, "a", None, None),) == e._plan(C, None)
+
+    def test_classes_need_check(self):
+        """
+        If classes are involved, undecided attributes need a check on the
+        value.
+        """
+        i = include(int, fields(C).b)
+        (a, _, check, _), b = i._plan(C, None)
+
+        assert fields(C).a is a
+        assert check(42) is True
+        assert check("42") is False
+        assert (fields(C).b, "b", None, None) == b
+
+    def test_cached(self):
+        """
+        Plans are computed once per class and node.
+        """
+        i = include(fields(C).a)
+
+        assert i._plan(C, None) is i._plan(C, None)
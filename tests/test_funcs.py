@@ -4,6 +4,8 @@ Tests for `attr._funcs`.
 
 from __future__ import absolute_import, division, print_function
 
+import pickle
+
 from collections import OrderedDict
 
 import pytest
@@ -15,7 +17,9 @@ import attr
 
 from attr import asdict, assoc, astuple, evolve, fields, has
 from attr._compat import TYPE, Mapping, Sequence, ordered_dict
+from attr._funcs import _ASDICT_CACHE_SIZE
 from attr.exceptions import AttrsAttributeNotFoundError
+from attr.serializers import Registry
 from attr.validators import instance_of
 
 from .strategies import nested_classes, simple_classes
@@ -199,6 +203,120 @@ class TestAsDict(object):
 
         assert [a.name for a in fields(cls)] == list(dict_instance.keys())
 
+    def test_memoize_shares_results(self, C):
+        """
+        If memoize is True, an instance that is referenced multiple times is
+        serialized only once and all references share the result.
+        """
+        shared = C(1, 2)
+        d = asdict(C([shared, shared], {"a": shared}), memoize=True)
+
+        assert {
+            "x": [{"x": 1, "y": 2}, {"x": 1, "y": 2}],
+            "y": {"a": {"x": 1, "y": 2}},
+        } == d
+        assert d["x"][0] is d["x"][1] is d["y"]["a"]
+
+    def test_memoize_filter_paths(self, C):
+        """
+        An instance that is reached through different filter paths is
+        serialized once per path.
+        """
+        shared = C(1, 2)
+        d = asdict(
+            C(shared, shared),
+            filter=attr.filters.include("x.x", "y"),
+            memoize=True,
+        )
+
+        assert {"x": {"x": 1}, "y": {"x": 1, "y": 2}} == d
+
+    def test_memoize_calls_serializer_once(self, C):
+        """
+        The value_serializer is called only once per field of a shared
+        instance.
+        """
+        calls = []
+
+        def hook(inst, a, v):
+            calls.append((inst, a, v))
+            return v
+
+        shared = C(1, 2)
+        asdict(C(shared, shared), value_serializer=hook, memoize=True)
+
+        assert 4 == len(calls)
+
+    def test_no_memoize_copies(self, C):
+        """
+        Without memoize, every reference gets its own dict.
+        """
+        shared = C(1, 2)
+        d = asdict(C(shared, shared))
+
+        assert d["x"] == d["y"]
+        assert d["x"] is not d["y"]
+
+    @pytest.mark.parametrize("container", [list, tuple, dict])
+    def test_memoize_cycle(self, C, container):
+        """
+        If memoize is True, reference cycles raise a ValueError instead of
+        recursing forever.
+        """
+        inst = C(1, None)
+        if container is dict:
+            inst.y = {"self": inst}
+        else:
+            inst.y = container([inst])
+
+        with pytest.raises(ValueError) as e:
+            asdict(inst, memoize=True)
+
+        assert (
+            "Circular reference detected while serializing {!r}.".format(C),
+        ) == e.value.args
+
+    def test_include_paths(self, C):
+        """
+        Dotted paths include everything on and below the path, collections
+        are transparent.
+        """
+        inst = C(C(1, [C(2, 3), C(4, C(5, 6))]), C(7, 8))
+
+        assert {"x": {"y": [{"y": 3}, {"y": {"x": 5, "y": 6}}]}} == asdict(
+            inst, filter=attr.filters.include("x.y.y")
+        )
+
+    def test_include_paths_and_attributes(self, C):
+        """
+        Paths are combined with attributes and classes.
+        """
+        inst = C(C(1, "a"), 2)
+
+        assert {"x": {"x": 1}, "y": 2} == asdict(
+            inst, filter=attr.filters.include("x.x", int)
+        )
+
+    def test_exclude_paths(self, C):
+        """
+        Dotted paths exclude the last attribute of the path.
+        """
+        inst = C(C(1, {"k": C(2, 3)}), C(4, 5))
+
+        assert {"x": {"x": 1, "y": {"k": {"x": 2}}}, "y": {"x": 4}} == asdict(
+            inst, filter=attr.filters.exclude("x.y.y", "y.y")
+        )
+
+    def test_static_filter_not_called(self, C):
+        """
+        A filter that consists only of attributes is never called for values.
+        """
+        f = attr.filters.include(fields(C).x)
+        f._plans.clear()
+
+        assert {"x": 1} == asdict(C(1, 2), filter=f)
+        assert {(C, None): ((fields(C).x, "x", None, None),)} == f._plans
+
 
 class TestAsTuple(object):
     """
@@ -357,6 +475,17 @@ class TestAsTuple(object):
 
         assert (1, [1, 2, 3]) == d
 
+    def test_filter_paths(self, C):
+        """
+        Dotted paths in filters are honored.
+        """
+        inst = C(C(1, [C(2, 3)]), C(4, 5))
+
+        assert (([(3,)],), (4, 5)) == astuple(
+            inst, filter=attr.filters.exclude("x.x", "x.y.x")
+        )
+        assert ((1,),) == astuple(inst, filter=attr.filters.include("x.x"))
+
 
 class TestHas(object):
     """
@@ -590,3 +719,648 @@ class TestEvolve(object):
             b = attr.ib(init=False, default=0)
 
         assert evolve(C(1), a=2).a == 2
+
+
+@attr.s
+class Point(object):
+    x = attr.ib()
+    y = attr.ib()
+
+
+@attr.s(frozen=True)
+class Player(object):
+    name = attr.ib(validator=instance_of(str))
+    position = attr.ib()
+    _score = attr.ib(default=0)
+    seen = attr.ib(default=0, eq=False)
+
+
+class TestDiff(object):
+    """
+    Tests for `diff`.
+    """
+
+    def test_equal(self):
+        """
+        Equal instances have no differences.
+        """
+        assert {} == attr.diff(Point(1, [2]), Point(1, [2]))
+
+    def test_changes(self):
+        """
+        Changed fields are reported with the new values, fields that don't
+        take part in comparisons are ignored.
+        """
+        a = Player("a", Point(1, 2), 1, seen=1)
+        b = Player("b", Point(1, 3), 1, seen=2)
+
+        assert {"name": "b", "position": Point(1, 3)} == attr.diff(a, b)
+
+    def test_recurse(self):
+        """
+        Instances of the same attrs class are diffed recursively.
+        """
+        a = Player("a", Point(1, Point(2, 3)))
+        b = Player("a", Point(1, Point(2, 4)), 5)
+
+        assert {"position.y.y": 4, "_score": 5} == attr.diff(
+            a, b, recurse=True
+        )
+
+    def test_recurse_different_classes(self):
+        """
+        Values of different classes are reported as a whole.
+        """
+        a = Player("a", Point(1, 2))
+        b = Player("a", Point(1, Point(2, 3)))
+
+        assert {"position.y": Point(2, 3)} == attr.diff(a, b, recurse=True)
+
+    def test_identity(self):
+        """
+        Identical values are not compared.
+        """
+
+        class NeverEqual(object):
+            def __ne__(self, other):
+                raise AssertionError("compared")
+
+        v = NeverEqual()
+
+        assert {} == attr.diff(Point(v, 1), Point(v, 1))
+
+    def test_different_classes(self):
+        """
+        Instances of different classes raise a TypeError.
+        """
+        with pytest.raises(TypeError):
+            attr.diff(Point(1, 2), Player("a", 1))
+
+
+class TestPatch(object):
+    """
+    Tests for `patch`.
+    """
+
+    def test_roundtrip(self):
+        """
+        Applying a diff to the first instance yields the second one.
+        """
+        a = Player("a", Point(1, Point(2, 3)))
+        b = Player("b", Point(1, Point(2, 4)), 5)
+
+        for recurse in (True, False):
+            rv = attr.patch(a, attr.diff(a, b, recurse=recurse))
+
+            assert b == rv
+            assert a is not rv
+            assert Player("a", Point(1, Point(2, 3))) == a
+
+    def test_no_init(self):
+        """
+        Fields without init and private fields can be patched by their names.
+        """
+
+        @attr.s
+        class C(object):
+            _x = attr.ib()
+            y = attr.ib(init=False, default=1)
+
+        rv = attr.patch(C(1), {"_x": 2, "y": 3})
+
+        assert 2 == rv._x
+        assert 3 == rv.y
+
+    def test_validators(self):
+        """
+        Validators of changed fields run.
+        """
+        i = Player("a", Point(1, 2))
+
+        with pytest.raises(TypeError):
+            attr.patch(i, {"name": 42})
+
+        attr.set_run_validators(False)
+        try:
+            assert 42 == attr.patch(i, {"name": 42}).name
+        finally:
+            attr.set_run_validators(True)
+
+    def test_unknown(self):
+        """
+        Unknown names raise an AttrsAttributeNotFoundError.
+        """
+        with pytest.raises(AttrsAttributeNotFoundError) as e:
+            attr.patch(Point(1, 2), {"z.a": 1})
+
+        assert (
+            "z is not an attrs attribute on {!r}.".format(Point),
+        ) == e.value.args
+
+    def test_conflict(self):
+        """
+        Changing a field and paths below it at the same time raises a
+        ValueError.
+        """
+        with pytest.raises(ValueError):
+            attr.patch(
+                Player("a", Point(1, 2)), {"position": 1, "position.x": 2}
+            )
+
+
+@attr.s(frozen=True, slots=True, cache_asdict=True)
+class Currency(object):
+    code = attr.ib()
+    names = attr.ib()
+
+
+@attr.s(frozen=True, cache_asdict=True)
+class Product(object):
+    name = attr.ib()
+    currency = attr.ib()
+
+
+class TestCachedAsDict(object):
+    """
+    Tests for `asdict` on classes with *cache_asdict*.
+    """
+
+    def test_cached(self):
+        """
+        Results are computed once per instance and configuration.
+        """
+        calls = []
+
+        def hook(inst, field, value):
+            calls.append(value)
+            return value
+
+        serializer = Registry()
+        serializer.register(object, hook)
+        p = Product("x", Currency("EUR", ()))
+
+        assert attr.asdict(p, value_serializer=serializer) == attr.asdict(
+            p, value_serializer=serializer
+        )
+        assert 4 == len(calls)
+
+        attr.asdict(p, recurse=False, value_serializer=serializer)
+
+        assert 6 == len(calls)
+
+    def test_nested_instances(self):
+        """
+        Cached nested instances are reused by other instances.
+        """
+        c = Currency("EUR", ("euro",))
+        attr.asdict(c)
+        cache = c._attrs_cached_asdict
+
+        assert {
+            "name": "x",
+            "currency": {"code": "EUR", "names": ["euro"]},
+        } == attr.asdict(Product("x", c))
+        assert 1 == len(cache)
+
+    def test_copies(self):
+        """
+        Changing results doesn't change the cache.
+        """
+        p = Product("x", Currency("EUR", ("euro",)))
+
+        rv = attr.asdict(p)
+        rv["currency"]["names"].append("eur")
+        rv["name"] = "y"
+
+        assert {
+            "name": "x",
+            "currency": {"code": "EUR", "names": ["euro"]},
+        } == attr.asdict(p)
+
+    def test_retained_collections(self):
+        """
+        Collections of all types are copied.
+        """
+        c = Currency("EUR", ({"a": [1]},))
+        rv = attr.asdict(c, retain_collection_types=True)
+        rv["names"][0]["a"].append(2)
+
+        assert {"code": "EUR", "names": ({"a": [1]},)} == attr.asdict(
+            c, retain_collection_types=True
+        )
+
+    def test_uncacheable(self):
+        """
+        Unhashable arguments and memoize don't use the cache.
+        """
+
+        class Unhashable(object):
+            __hash__ = None
+
+            def __call__(self, *args):
+                return dict(*args)
+
+        c = Currency("EUR", ())
+        attr.asdict(c, dict_factory=Unhashable())
+        attr.asdict(c, memoize=True)
+
+        assert not hasattr(c, "_attrs_cached_asdict")
+
+    def test_callables(self):
+        """
+        Filters and value serializers that aren't from attrs aren't cached.
+        """
+        c = Currency("EUR", ())
+        for _ in range(3):
+            attr.asdict(c, filter=lambda a, v: True)
+            attr.asdict(c, value_serializer=lambda i, a, v: v)
+
+        assert not hasattr(c, "_attrs_cached_asdict")
+
+    def test_bounded(self):
+        """
+        Only the results of the last few configurations are kept.
+        """
+        c = Currency("EUR", ())
+        for _ in range(100):
+            attr.asdict(c, filter=attr.filters.exclude(int))
+
+        assert 0 < len(c._attrs_cached_asdict) <= _ASDICT_CACHE_SIZE
+
+    def test_pickle(self):
+        """
+        The cache is never pickled.
+        """
+        p = Product("x", Currency("EUR", ()))
+        attr.asdict(p, filter=attr.filters.exclude(int))
+
+        assert {} == pickle.loads(pickle.dumps(p))._attrs_cached_asdict
+        assert Product("x", Currency("EUR", ())) == pickle.loads(
+            pickle.dumps(p)
+        )
+
+    def test_frozen_only(self):
+        """
+        Only frozen classes can cache their results.
+        """
+        with pytest.raises(TypeError) as e:
+
+            @attr.s(cache_asdict=True)
+            class C(object):
+                pass
+
+        assert (
+            "Invalid value for cache_asdict.  To cache asdict results, the "
+            "class must be frozen.",
+        ) == e.value.args
+
+
+@attr.s
+class Address(object):
+    street_name = attr.ib(metadata={"alias": "streetName"})
+    zip_code = attr.ib(default=None, metadata={"alias": "zipCode"})
+
+
+@attr.s
+class Customer(object):
+    _first_name = attr.ib(metadata={"alias": "firstName"})
+    address = attr.ib(type=Address)
+    tags = attr.ib(factory=list)
+    version = attr.ib(init=False, default=1)
+
+
+class TestAliases(object):
+    """
+    Tests for aliases in `asdict` and `from_dict`.
+    """
+
+    def test_asdict(self):
+        """
+        Aliased fields are stored under their alias, also in nested
+        instances and when filtered.
+        """
+        c = Customer("Jane", Address("Main St", "12345"), ["vip"])
+
+        assert {
+            "firstName": "Jane",
+            "address": {"streetName": "Main St", "zipCode": "12345"},
+            "tags": ["vip"],
+            "version": 1,
+        } == asdict(c)
+        assert {"address": {"streetName": "Main St"}} == asdict(
+            c, filter=attr.filters.include("address.street_name")
+        )
+
+    def test_astuple(self):
+        """
+        Aliases don't affect astuple.
+        """
+        assert ("Main St", None) == astuple(Address("Main St"))
+
+    def test_round_trip(self):
+        """
+        from_dict structures what asdict produced, including nested
+        instances.
+        """
+        c = Customer("Jane", Address("Main St", "12345"), ["vip"])
+
+        assert c == attr.from_dict(Customer, asdict(c))
+
+    def test_defaults(self):
+        """
+        Keys of fields with defaults are optional, fields that are not part
+        of __init__ and unknown keys are ignored.
+        """
+        c = attr.from_dict(
+            Customer,
+            {
+                "firstName": "Jane",
+                "address": {"streetName": "Main St"},
+                "version": 2,
+                "unknown": 3,
+            },
+        )
+
+        assert Customer("Jane", Address("Main St")) == c
+        assert 1 == c.version
+
+    def test_non_dict_values(self):
+        """
+        Values of attrs-typed fields that are not dicts are passed as is.
+        """
+        a = Address("Main St")
+
+        assert (
+            a
+            is attr.from_dict(
+                Customer, {"firstName": "Jane", "address": a}
+            ).address
+        )
+
+    def test_missing_key(self):
+        """
+        Missing keys of mandatory fields raise a KeyError with the key.
+        """
+        with pytest.raises(KeyError) as e:
+            attr.from_dict(Address, {"street_name": "Main St"})
+
+        assert ("streetName",) == e.value.args
+
+    def test_runs_init(self):
+        """
+        Converters and validators run.
+        """
+
+        @attr.s
+        class C(object):
+            x = attr.ib(converter=int, validator=instance_of(int))
+
+        assert C(1) == attr.from_dict(C, {"x": "1"})
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(attr.exceptions.NotAnAttrsClassError):
+            attr.from_dict(object, {})
+
+
+@attr.s
+class Config(object):
+    name = attr.ib()
+    debug = attr.ib(default=False)
+    retries = attr.ib(default=0)
+    ratio = attr.ib(default=0.5, converter=float)
+    path = attr.ib(default=("etc",))
+    tags = attr.ib(factory=list)
+    sub = attr.ib(default=None)
+
+
+class TestOmitDefaults(object):
+    """
+    Tests for *omit_defaults* of `asdict` and `astuple`.
+    """
+
+    def test_asdict(self):
+        """
+        Fields whose values equal their defaults are left out, also in
+        nested instances.
+        """
+        c = Config("x", sub=Config("y", retries=3, tags=["a"]))
+
+        assert {
+            "name": "x",
+            "sub": {"name": "y", "retries": 3, "tags": ["a"]},
+        } == asdict(c, omit_defaults=True)
+
+    def test_all_defaults_kept(self):
+        """
+        By default nothing is omitted.
+        """
+        assert 7 == len(asdict(Config("x")))
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            ("debug", 0),
+            ("retries", False),
+            ("retries", 0.0),
+            ("path", ["etc"]),
+            ("tags", ()),
+            ("tags", set()),
+        ],
+    )
+    def test_strict_comparison(self, field, value):
+        """
+        Values of a different class than the default are kept even if they
+        compare equal.
+        """
+        c = Config("x")
+        object.__setattr__(c, field, value)
+
+        assert value == asdict(c, recurse=False, omit_defaults=True)[field]
+
+    def test_converted_default(self):
+        """
+        Defaults are compared after conversion.
+        """
+        assert "ratio" not in asdict(
+            Config("x", ratio=1 / 2), omit_defaults=True
+        )
+
+    def test_identity(self):
+        """
+        Defaults that aren't immutable builtins are compared by identity.
+        """
+        default = {"k": "v"}
+
+        @attr.s
+        class C(object):
+            x = attr.ib(default=default)
+
+        assert {} == asdict(C(), omit_defaults=True)
+        assert {"x": {"k": "v"}} == asdict(C({"k": "v"}), omit_defaults=True)
+
+    def test_other_factories(self):
+        """
+        Values of fields with other factories are kept.
+        """
+
+        @attr.s
+        class C(object):
+            x = attr.ib(default=attr.Factory(lambda: 42))
+            y = attr.ib(default=attr.Factory(lambda self: [], takes_self=True))
+
+        assert {"x": 42, "y": []} == asdict(C(), omit_defaults=True)
+
+    def test_filter(self):
+        """
+        Omitting defaults works together with filters.
+        """
+        f = attr.filters.exclude(fields(Config).name)
+
+        assert {"retries": 3} == asdict(
+            Config("x", retries=3), filter=f, omit_defaults=True
+        )
+        assert 6 == len(asdict(Config("x", retries=3), filter=f))
+
+    def test_astuple_trailing(self):
+        """
+        astuple only leaves out trailing defaults.
+        """
+        assert ("x",) == astuple(Config("x"), omit_defaults=True)
+        assert ("x", False, 3) == astuple(
+            Config("x", retries=3), omit_defaults=True
+        )
+        assert ("x", False, 0, 0.5, ["etc"], [], ("y",)) == astuple(
+            Config("x", sub=Config("y")), omit_defaults=True
+        )
+
+    def test_astuple_round_trip(self):
+        """
+        The trimmed tuples can be passed back into the class.
+        """
+        c = Config("x", retries=3)
+
+        assert c == Config(*astuple(c, recurse=False, omit_defaults=True))
+
+
+shapes = attr.TaggedUnion("kind")
+
+
+@shapes.register
+@attr.s
+class Circle(object):
+    kind = attr.ib(default="circle", init=False, metadata={"tag": True})
+    r = attr.ib()
+
+
+@shapes.register
+@attr.s(frozen=True)
+class Square(object):
+    side = attr.ib()
+    kind = attr.ib(default="square", metadata={"tag": True})
+
+
+@attr.s
+class Text(object):
+    text = attr.ib()
+
+
+shapes.register(Text, "text")
+
+
+@attr.s
+class Drawing(object):
+    main = attr.ib(type=shapes)
+    others = attr.ib(factory=list)
+
+
+class TestTaggedUnion(object):
+    """
+    Tests for `TaggedUnion`.
+    """
+
+    def test_tag_fields(self):
+        """
+        asdict emits tag fields and the union dispatches on them.
+        """
+        d = asdict(Circle(2))
+
+        assert {"kind": "circle", "r": 2} == d
+        assert Circle(2) == shapes.structure(d)
+        assert Square(3) == attr.from_dict(
+            shapes, {"kind": "square", "side": 3}
+        )
+
+    def test_explicit_tag(self):
+        """
+        Tags of classes without tag fields are added by the union's asdict.
+        """
+        d = shapes.asdict(Text("hi"))
+
+        assert {"text": "hi", "kind": "text"} == d
+        assert {"kind": "circle", "r": 1} == shapes.asdict(Circle(1))
+        assert Text("hi") == shapes.structure(d)
+
+    def test_nested(self):
+        """
+        Fields whose type is a union are structured through it.
+        """
+        d = asdict(Drawing(Square(1)))
+
+        assert Drawing(Square(1)) == attr.from_dict(Drawing, d)
+
+    @pytest.mark.parametrize("d", [{"r": 1}, {"kind": "triangle"}])
+    def test_unknown_tag(self, d):
+        """
+        Missing and unknown tags raise a ValueError.
+        """
+        with pytest.raises(ValueError) as e:
+            shapes.structure(d)
+
+        assert (
+            "Unknown or missing tag 'kind' in {!r}.".format(d),
+        ) == e.value.args
+
+    def test_register_errors(self):
+        """
+        Invalid registrations raise ValueErrors.
+        """
+
+        @attr.s
+        class NoDefault(object):
+            kind = attr.ib(metadata={"tag": True})
+
+        @attr.s
+        class OtherKey(object):
+            type = attr.ib(default="x", metadata={"tag": True})
+
+        u = attr.TaggedUnion("kind", [Circle])
+
+        for cls, tag in [
+            (Text, attr.NOTHING),
+            (Square, "square"),
+            (NoDefault, attr.NOTHING),
+            (OtherKey, attr.NOTHING),
+            (Circle, attr.NOTHING),
+            (Text, "circle"),
+        ]:
+            with pytest.raises(ValueError):
+                u.register(cls, tag)
+
+    def test_repr(self):
+        """
+        The repr shows the key and the number of classes.
+        """
+        assert "<attr.TaggedUnion on 'kind' with 3 classes>" == repr(shapes)
+
+    def test_jsonl(self):
+        """
+        JSON Lines files can contain mixed classes.
+        """
+        from attr.jsonl import read
+
+        lines = ['{"kind": "circle", "r": 1}', '{"kind": "text", "text": "a"}']
+
+        assert [Circle(1), Text("a")] == list(read(lines, shapes))
@@ -0,0 +1,57 @@
+"""
+Tests for importing `attr`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import subprocess
+import sys
+
+import pytest
+
+import attr
+
+
+needs_module_getattr = pytest.mark.skipif(
+    sys.version_info[:2] < (3, 7), reason="Needs module __getattr__."
+)
+
+# Modules that are only imported when they're used.
+LAZY_MODULES = [
+    "attr.binary",
+    "attr.jsonl",
+    "attr.csv",
+    "attr.dbapi",
+    "attr.numpy",
+    pytest.param("attr._views", marks=needs_module_getattr),
+    pytest.param("attr._columns", marks=needs_module_getattr),
+    "attr.migrations",
+    "attr.recordfile",
+    "attr.shared",
+]
+
+
+class TestImport(object):
+    """
+    Tests for importing `attr`.
+    """
+
+    @pytest.mark.parametrize("module", LAZY_MODULES)
+    def test_not_imported(self, module):
+        """
+        Importing attr doesn't import *module*.
+        """
+        code = "import sys, attr; assert {module!r} not in sys.modules"
+
+        subprocess.check_call(
+            [sys.executable, "-c", code.format(module=module)]
+        )
+
+    def test_star_import(self):
+        """
+        All names in attr.__all__ can be star-imported.
+        """
+        ns = {}
+        exec("from attr import *", ns)
+
+        assert set(attr.__all__) <= set(ns)
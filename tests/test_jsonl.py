@@ -0,0 +1,166 @@
+"""
+Tests for `attr.jsonl`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import json
+
+import pytest
+
+import attr
+
+from attr.exceptions import NotAnAttrsClassError
+from attr.jsonl import read, write
+
+
+@attr.s
+class Point(object):
+    x = attr.ib()
+    y = attr.ib(default=0)
+
+
+@attr.s(slots=True, frozen=True)
+class Shape(object):
+    shape_name = attr.ib(metadata={"alias": "shapeName"})
+    origin = attr.ib(type=Point)
+    tags = attr.ib(default=())
+
+
+class TestWrite(object):
+    """
+    Tests for `write`.
+    """
+
+    def test_lines(self):
+        """
+        Every instance becomes one compact JSON object per line with the
+        keys of asdict.
+        """
+        fp = io.StringIO()
+
+        assert 2 == write(
+            fp,
+            [
+                Shape(u"sq", Point(1, 2), (u"a",)),
+                Shape(u"\xfc", Point(3), frozenset([1])),
+            ],
+        )
+        assert (
+            u'{"shapeName":"sq","origin":{"x":1,"y":2},"tags":["a"]}\n'
+            u'{"shapeName":"\xfc","origin":{"x":3,"y":0},"tags":[1]}\n'
+        ) == fp.getvalue()
+
+    def test_text_file(self, tmpdir):
+        """
+        ASCII and non-ASCII lines can be written to files opened in text
+        mode.
+        """
+        path = str(tmpdir.join("shapes.jsonl"))
+        with io.open(path, "w", encoding="utf-8") as f:
+            write(f, [Point(1), Point(u"\xfc")], chunk_size=1)
+
+        with io.open(path, encoding="utf-8") as f:
+            assert [Point(1), Point(u"\xfc")] == list(read(f, Point))
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 1000])
+    def test_chunks(self, chunk_size):
+        """
+        Lines are written in chunks of *chunk_size* and the result doesn't
+        depend on it.
+        """
+        writes = []
+
+        class FP(object):
+            def write(self, s):
+                writes.append(s)
+
+        n = write(FP(), (Point(i) for i in range(5)), chunk_size=chunk_size)
+
+        assert 5 == n
+        assert -(-5 // chunk_size) == len(writes)
+        assert [{"x": i, "y": 0} for i in range(5)] == [
+            json.loads(line) for line in "".join(writes).splitlines()
+        ]
+
+    def test_empty(self):
+        """
+        No instances, no writes.
+        """
+        fp = io.StringIO()
+
+        assert 0 == write(fp, [])
+        assert u"" == fp.getvalue()
+
+    def test_mixed_classes(self):
+        """
+        Instances of different classes can be mixed.
+        """
+        fp = io.StringIO()
+        write(fp, [Point(1), Shape(u"s", Point(2)), Point(3)])
+
+        assert (
+            u'{"x":1,"y":0}\n'
+            u'{"shapeName":"s","origin":{"x":2,"y":0},"tags":[]}\n'
+            u'{"x":3,"y":0}\n'
+        ) == fp.getvalue()
+
+    def test_not_serializable(self):
+        """
+        Values that can't be serialized raise a TypeError.
+        """
+        with pytest.raises(TypeError):
+            write(io.StringIO(), [Point(object())])
+
+    def test_not_attrs(self):
+        """
+        Non-attrs instances raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            write(io.StringIO(), [object()])
+
+    def test_invalid_chunk_size(self):
+        """
+        The chunk size must be positive.
+        """
+        with pytest.raises(ValueError):
+            write(io.StringIO(), [], chunk_size=0)
+
+
+class TestRead(object):
+    """
+    Tests for `read`.
+    """
+
+    def test_round_trip(self):
+        """
+        Reading what has been written returns equal instances.
+        """
+        shapes = [Shape(u"s%d" % i, Point(i, -i)) for i in range(10)]
+        fp = io.StringIO()
+        write(fp, shapes, chunk_size=3)
+        fp.seek(0)
+
+        assert [Shape(s.shape_name, s.origin, []) for s in shapes] == list(
+            read(fp, Shape)
+        )
+
+    def test_lazy(self):
+        """
+        Lines are read on demand and blank lines are skipped.
+        """
+        lines = iter([u'{"x": 1}\n', u"\n", u'{"x": 2, "y": 3}\n', u"{"])
+        it = read(lines, Point)
+
+        assert Point(1) == next(it)
+        assert Point(2, 3) == next(it)
+        with pytest.raises(ValueError):
+            next(it)
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            list(read([], object))
@@ -9,7 +9,11 @@ import functools
 import gc
 import inspect
 import itertools
+import os
+import pickle
+import subprocess
 import sys
+import weakref
 
 from operator import attrgetter
 
@@ -28,6 +32,7 @@ from attr._make import (
     _AndValidator,
     _Attributes,
     _ClassBuilder,
+    _classes_by_schema,
     _CountingAttr,
     _determine_eq_order,
     _determine_whether_to_implement,
@@ -1067,6 +1072,95 @@ class TestMakeClass(object):
         assert "C(a=1, b=2)" == repr(C())
 
 
+class TestPicklableMakeClass(object):
+    """
+    Tests for `make_class` with *picklable*.
+    """
+
+    def test_same_process(self):
+        """
+        Pickling within the creating process returns instances of the
+        original class.
+        """
+        C = attr.make_class(
+            "C",
+            {"x": attr.ib(validator=attr.validators.instance_of(int))},
+            picklable=True,
+        )
+        c = C(1)
+
+        assert c == pickle.loads(pickle.dumps(c))
+        assert C is pickle.loads(pickle.dumps(c)).__class__
+
+    @pytest.mark.skipif(PY2, reason="Needs subprocess input.")
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_new_process(self, slots):
+        """
+        A process that never created the class creates it from the schema
+        once and can send instances back.
+        """
+        C = attr.make_class(
+            "C", ["x", "y"], picklable=True, slots=slots, frozen=True
+        )
+        data = pickle.dumps([C(1, [2]), C(3, 4)])
+        script = (
+            "import pickle, sys\n"
+            "a, b = pickle.loads(sys.stdin.buffer.read())\n"
+            "assert a.__class__ is b.__class__\n"
+            "assert a.__class__.__module__ == {module!r}\n"
+            "sys.stdout.buffer.write(pickle.dumps(attr.evolve(a, x=5)))\n"
+        ).format(module=__name__)
+        out = subprocess.check_output(
+            [sys.executable, "-c", "import attr\n" + script],
+            input=data,
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        )
+
+        assert C(5, [2]) == pickle.loads(out)
+
+    def test_rebuilt_once(self):
+        """
+        Classes created from a schema are kept even if no instances are
+        left.
+        """
+        C = attr.make_class("C", ["x"], picklable=True)
+        data = pickle.dumps(C(1))
+        # Pretend to be another process.
+        del _classes_by_schema[C(1).__reduce_ex__(2)[1][0]]
+
+        ref = weakref.ref(pickle.loads(data).__class__)
+        gc.collect()
+
+        assert ref() is not None
+        assert ref() is pickle.loads(data).__class__
+        assert C is not ref()
+
+    def test_subclasses(self):
+        """
+        Subclasses of picklable classes are pickled by reference.
+        """
+        assert PicklableSub is PicklableSub(1).__reduce_ex__(2)[1][0]
+        assert PicklableSub(1) == pickle.loads(pickle.dumps(PicklableSub(1)))
+
+    def test_unpicklable_arguments(self):
+        """
+        Unpicklable arguments make pickling fail.
+        """
+        C = attr.make_class(
+            "C", {"x": attr.ib(converter=lambda v: v)}, picklable=True
+        )
+
+        with pytest.raises((pickle.PicklingError, AttributeError)):
+            pickle.dumps(C(1))
+
+
+PicklableSub = attr.make_class(
+    "PicklableSub",
+    [],
+    bases=(attr.make_class("Base", ["x"], picklable=True),),
+)
+
+
 class TestFields(object):
     """
     Tests for `fields`.
@@ -1547,6 +1641,8 @@ class TestClassBuilder(object):
             "__le__",
             "__gt__",
             "__ge__",
+            "__copy__",
+            "__deepcopy__",
         ],
     )
     def test_attaches_meta_dunders(self, meth_name):
@@ -1555,12 +1651,12 @@ class TestClassBuilder(object):
         attributes.
         """
 
-        @attr.s(hash=True, str=True)
+        @attr.s(hash=True, str=True, copy_deepcopy=True)
         class C(object):
             def organic(self):
                 pass
 
-        @attr.s(hash=True, str=True)
+        @attr.s(hash=True, str=True, copy_deepcopy=True)
         class D(object):
             pass
 
@@ -0,0 +1,264 @@
+"""
+Tests for `attr.migrations`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+import attr
+
+from attr import migrations as m
+from attr.exceptions import NotAnAttrsClassError
+
+
+def split_name(name):
+    first, _, last = name.partition(" ")
+
+    return first, last
+
+
+@attr.s
+class Address(object):
+    city = attr.ib()
+
+
+@m.versioned(
+    3,
+    {
+        0: [m.rename("name", "full_name"), m.rename("mail", "email")],
+        1: [
+            m.split("full_name", ["first", "last"], split_name),
+            m.default("email", ""),
+            m.default("tags", attr.Factory(list)),
+        ],
+        2: [m.transform("age", int), m.drop("x")],
+    },
+    key="v",
+)
+@attr.s
+class User(object):
+    first = attr.ib()
+    last = attr.ib()
+    email = attr.ib()
+    tags = attr.ib()
+    age = attr.ib(default=0)
+    address = attr.ib(default=None, type=Address)
+    _x = attr.ib(default="default", metadata={"alias": "x"})
+
+
+class TestLoad(object):
+    """
+    Tests for `load`.
+    """
+
+    @pytest.mark.parametrize(
+        "d",
+        [
+            {"v": 0, "name": "Ada Lovelace", "age": "36"},
+            {"v": 1, "full_name": "Ada Lovelace", "age": "36"},
+            {
+                "v": 2,
+                "first": "Ada",
+                "last": "Lovelace",
+                "email": "",
+                "tags": [],
+                "age": "36",
+                "x": 1,
+            },
+            {
+                "v": 3,
+                "first": "Ada",
+                "last": "Lovelace",
+                "email": "",
+                "tags": [],
+                "age": 36,
+            },
+        ],
+    )
+    def test_versions(self, d):
+        """
+        Dicts of all versions are upgraded to the current version.
+        """
+        assert User("Ada", "Lovelace", "", []) == attr.evolve(
+            m.load(User, d), age=0
+        )
+        assert 36 == m.load(User, d).age
+
+    def test_explicit_version(self):
+        """
+        An explicit version takes precedence over the version key.
+        """
+        assert "Ada" == m.load(User, {"name": "Ada L", "v": 3}, 0).first
+
+    def test_optional(self):
+        """
+        Missing keys of fields with defaults keep the defaults, nested dicts
+        are structured.
+        """
+        u = m.load(
+            User,
+            {
+                "v": 0,
+                "name": "Ada L",
+                "mail": "ada@example.com",
+                "address": {"city": "London"},
+                "x": "dropped",
+            },
+        )
+
+        assert "ada@example.com" == u.email
+        assert 0 == u.age
+        assert Address("London") == u.address
+        assert "default" == u._x
+
+        d = attr.asdict(attr.evolve(u, x="kept"))
+
+        assert "kept" == m.load(User, d, 3)._x
+
+    def test_rename_keeps_existing(self):
+        """
+        Renaming a missing key keeps the value of the new key.
+        """
+        d = {"v": 0, "name": "Ada L", "email": "a@b"}
+
+        assert "a@b" == m.load(User, d).email
+
+    def test_split_keeps_existing(self):
+        """
+        Splitting a missing key keeps the values of the target keys.
+        """
+
+        @m.versioned(
+            2,
+            {0: [m.rename("name", "full")], 1: [m.split("full", ["a"], list)]},
+        )
+        @attr.s
+        class C(object):
+            a = attr.ib()
+
+        assert C("x") == m.load(C, {"name": "x"}, 0)
+        assert C("y") == m.load(C, {"a": "y"}, 0)
+        assert C("x") == m.load(C, {"name": "x", "a": "y"}, 0)
+        with pytest.raises(KeyError, match="'a'"):
+            m.load(C, {}, 0)
+
+    def test_split_keeps_existing_user(self):
+        """
+        Upgrading a dict that already has the keys of a split keeps them.
+        """
+        u = m.load(User, {"v": 1, "first": "y", "last": "x"})
+
+        assert ("y", "x") == (u.first, u.last)
+
+    def test_factory(self):
+        """
+        Factories are called for every dict.
+        """
+        d = {"v": 1, "full_name": "Ada L"}
+
+        assert m.load(User, d).tags is not m.load(User, d).tags
+
+    @pytest.mark.parametrize(
+        "d", [{"v": 0, "age": 1}, {"v": 3, "first": "Ada", "last": "L"}]
+    )
+    def test_missing(self, d):
+        """
+        Missing keys of fields without defaults raise KeyErrors.
+        """
+        with pytest.raises(KeyError):
+            m.load(User, d)
+
+    def test_required_after_rename(self):
+        """
+        Keys that are renamed to required fields raise KeyErrors if they are
+        missing.
+        """
+
+        @m.versioned(1, {0: [m.rename("a", "b"), m.transform("b", int)]})
+        @attr.s
+        class C(object):
+            b = attr.ib()
+
+        assert C(1) == m.load(C, {"a": "1"}, 0)
+        assert C(2) == m.load(C, {"b": "2"}, 0)
+        with pytest.raises(KeyError, match="'b'"):
+            m.load(C, {}, 0)
+
+    def test_removed_required(self):
+        """
+        Dropping the key of a required field makes it missing.
+        """
+
+        @m.versioned(1, {0: [m.drop("a"), m.split("a", ["b"], list)]})
+        @attr.s
+        class C(object):
+            a = attr.ib()
+            b = attr.ib(default=None)
+
+        with pytest.raises(KeyError):
+            m.load(C, {"a": 1}, 0)
+        assert C(1) == m.load(C, {"a": 1}, 1)
+
+    def test_cache(self):
+        """
+        The upgrade from each version is compiled once.
+        """
+        m.load(User, {"v": 1, "full_name": "Ada L"})
+        cache = User.__attrs_cache__["migrations"]
+
+        assert 1 in cache
+        assert cache[1] is m._loader(User, 1)
+
+    @pytest.mark.parametrize("version", [-1, 4, "1"])
+    def test_unknown_version(self, version):
+        """
+        Unknown versions raise ValueErrors.
+        """
+        with pytest.raises(ValueError, match="Can't upgrade"):
+            m.load(User, {}, version)
+
+    def test_no_key(self):
+        """
+        Without a version key, the version must be passed.
+        """
+
+        @m.versioned(1)
+        @attr.s
+        class C(object):
+            a = attr.ib()
+
+        assert 1 == m.version(C)
+        assert C(1) == m.load(C, {"a": 1}, 1)
+        with pytest.raises(ValueError, match="no version key"):
+            m.load(C, {"a": 1})
+
+    def test_not_versioned(self):
+        """
+        Unversioned and non-attrs classes raise errors.
+        """
+        with pytest.raises(ValueError, match="no versioned schema"):
+            m.version(Address)
+        with pytest.raises(NotAnAttrsClassError):
+            m.version(object)
+
+
+class TestVersioned(object):
+    """
+    Tests for `versioned`.
+    """
+
+    @pytest.mark.parametrize("v", [-1, 2, 3])
+    def test_invalid_steps(self, v):
+        """
+        Steps must upgrade to versions up to the current one.
+        """
+        with pytest.raises(ValueError, match="Steps of version"):
+            m.versioned(2, {v: []})
+
+    def test_factory_takes_self(self):
+        """
+        Defaults can't take self.
+        """
+        with pytest.raises(ValueError):
+            m.default("a", attr.Factory(list, takes_self=True))
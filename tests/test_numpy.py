@@ -0,0 +1,185 @@
+"""
+Tests for `attr.numpy`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+import attr
+
+from attr.exceptions import NotAnAttrsClassError
+
+
+np = pytest.importorskip("numpy")
+
+from attr.numpy import dtype, from_array, records, to_array  # noqa: E402
+
+
+@attr.s(frozen=True)
+class Point(object):
+    x = attr.ib(type=float)
+    y = attr.ib(type=float)
+
+
+@attr.s(slots=True)
+class Particle(object):
+    name = attr.ib(type=str, metadata={"numpy_dtype": "U8"})
+    pos = attr.ib(type=Point)
+    charge = attr.ib(type=int)
+    stable = attr.ib(type=bool, repr=False)
+
+
+PARTICLES = [
+    Particle(u"e", Point(1.0, 2.0), -1, True),
+    Particle(u"mu", Point(3.0, 4.0), -1, False),
+]
+
+
+class TestDtype(object):
+    """
+    Tests for `dtype`.
+    """
+
+    def test_dtype(self):
+        """
+        Types map to dtypes, attrs classes nest, and metadata overrides.
+        """
+        assert (
+            np.dtype(
+                [
+                    ("name", "U8"),
+                    ("pos", [("x", "<f8"), ("y", "<f8")]),
+                    ("charge", "<i8"),
+                    ("stable", "?"),
+                ]
+            )
+            == dtype(Particle)
+        )
+
+    def test_cached(self):
+        """
+        The dtype is computed once per class.
+        """
+        assert dtype(Particle) is dtype(Particle)
+
+    def test_unsupported(self):
+        """
+        Fields without a fixed size raise a TypeError.
+        """
+
+        @attr.s
+        class C(object):
+            x = attr.ib(type=list)
+
+        with pytest.raises(TypeError) as e:
+            dtype(C)
+
+        assert (
+            "Field 'x' of {!r} has no fixed-size NumPy dtype.".format(C),
+        ) == e.value.args
+
+    def test_self_reference(self):
+        """
+        Classes that contain themselves raise a TypeError.
+        """
+
+        @attr.s
+        class C(object):
+            x = attr.ib()
+
+        object.__setattr__(attr.fields(C).x, "type", C)
+
+        with pytest.raises(TypeError):
+            dtype(C)
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            dtype(object)
+
+
+class TestArrays(object):
+    """
+    Tests for `to_array` and `from_array`.
+    """
+
+    def test_round_trip(self):
+        """
+        Instances become rows and rows become equal instances.
+        """
+        arr = to_array(PARTICLES)
+
+        assert dtype(Particle) == arr.dtype
+        assert [-1, -1] == arr["charge"].tolist()
+        assert [2.0, 4.0] == arr["pos"]["y"].tolist()
+        assert PARTICLES == from_array(Particle, arr)
+
+    def test_iterable(self):
+        """
+        Any iterable works.
+        """
+        assert 2 == len(to_array(iter(PARTICLES)))
+
+    def test_empty(self):
+        """
+        Converting no instances requires the class.
+        """
+        assert 0 == len(to_array([], Particle))
+        with pytest.raises(ValueError):
+            to_array([])
+
+    def test_wrong_dtype(self):
+        """
+        Arrays of other dtypes raise a TypeError.
+        """
+        with pytest.raises(TypeError):
+            from_array(Particle, to_array([Point(1.0, 2.0)]))
+
+
+class TestRecords(object):
+    """
+    Tests for `records`.
+    """
+
+    def test_views(self):
+        """
+        Records read the array, look like instances, and compare equal to
+        them.
+        """
+        arr = to_array(PARTICLES)
+        rs = records(Particle, arr)
+
+        assert 2 == len(rs)
+        assert u"mu" == rs[1].name
+        assert 3.0 == rs[1].pos.x
+        assert "Particle(name='e', pos=Point(x=1.0, y=2.0), charge=-1)" == (
+            repr(rs[0])
+        )
+        assert PARTICLES == list(rs)
+        assert rs[0] == rs[0]
+        assert rs[0] != rs[1]
+        assert rs[0] != 42
+        assert PARTICLES[1:] == list(rs[1:])
+
+    def test_zero_copy(self):
+        """
+        Changes to the array are visible through records.
+        """
+        arr = to_array(PARTICLES)
+        r = records(Particle, arr)[0]
+        arr["charge"][0] = 2
+
+        assert 2 == r.charge
+        assert r.__class__.__slots__ == ()
+
+    def test_read_only(self):
+        """
+        Records can't be changed.
+        """
+        r = records(Particle, to_array(PARTICLES))[0]
+
+        with pytest.raises(AttributeError):
+            r.charge = 1
@@ -0,0 +1,199 @@
+"""
+Tests for `attr.recordfile`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import os
+
+import pytest
+
+import attr
+
+from attr import recordfile
+from attr.binary import pack
+
+
+@attr.s(frozen=True)
+class Point(object):
+    x = attr.ib(type=int)
+    y = attr.ib(type=float)
+
+
+@attr.s(slots=True)
+class Tick(object):
+    at = attr.ib(type=Point)
+    symbol = attr.ib(type=bytes, metadata={"binary_format": "4s"})
+    up = attr.ib(type=bool, repr=False)
+
+
+TICKS = [
+    Tick(Point(i, i / 2), b"AB%02d" % (i,), bool(i % 2)) for i in range(5)
+]
+
+
+@pytest.fixture
+def path(tmpdir):
+    return str(tmpdir.join("ticks.rec"))
+
+
+class TestRecordFile(object):
+    """
+    Tests for `open` and `RecordFile`.
+    """
+
+    def test_roundtrip(self, path):
+        """
+        Appended records can be read back after reopening the file.
+        """
+        with recordfile.open(path, Tick, "w") as rf:
+            rf.append(TICKS[0])
+            rf.extend(TICKS[1:])
+
+            assert 5 == len(rf)
+
+        with recordfile.open(path, Tick) as rf:
+            assert 5 == len(rf)
+            assert TICKS == list(rf)
+            assert TICKS == [rf.read(i) for i in range(5)]
+            assert TICKS[-1] == rf[-1]
+            assert "<attr.recordfile.RecordFile of 5 Tick records>" == repr(rf)
+
+    def test_layout(self, path):
+        """
+        The records follow the header back-to-back in the layout of
+        attr.binary.
+        """
+        with recordfile.open(path, Tick, "w") as rf:
+            rf.extend(TICKS)
+
+        with io.open(path, "rb") as f:
+            data = f.read()
+
+        assert data.endswith(b"".join(pack(t) for t in TICKS))
+
+    def test_views(self, path):
+        """
+        Views are lazy, read-only, nested, and look like instances.
+        """
+        with recordfile.open(path, Tick, "w") as rf:
+            rf.extend(TICKS)
+            v = rf[3]
+
+            assert 3 == v.at.x
+            assert 1.5 == v.at.y
+            assert b"AB03" == v.symbol
+            assert v.up is True
+            assert TICKS[3] == v
+            assert rf[3] == v
+            assert v != rf[2]
+            assert v != TICKS[2]
+            assert "Tick(at=Point(x=3, y=1.5), symbol=%r)" % (
+                b"AB03",
+            ) == repr(v)
+            with pytest.raises(AttributeError):
+                v.up = False
+
+    def test_append_after_read(self, path):
+        """
+        Records appended after the file has been mapped are visible and old
+        views stay valid.
+        """
+        with recordfile.open(path, Tick, "a") as rf:
+            rf.append(TICKS[0])
+            first = rf[0]
+            rf.append(TICKS[1])
+
+            assert TICKS[1] == rf[1]
+            assert TICKS[1] == rf.read(-1)
+            assert TICKS[0] == first
+            assert TICKS[:2] == list(rf)
+
+        with recordfile.open(path, Tick, "a") as rf:
+            rf.append(TICKS[2])
+            rf.flush()
+
+            assert TICKS[:3] == list(rf)
+
+    def test_index_error(self, path):
+        """
+        Indexes out of range raise an IndexError.
+        """
+        with recordfile.open(path, Tick, "w") as rf:
+            rf.append(TICKS[0])
+
+            with pytest.raises(IndexError):
+                rf[1]
+            with pytest.raises(IndexError):
+                rf[-2]
+
+    def test_read_only(self, path):
+        """
+        Files opened for reading can't be appended to.
+        """
+        recordfile.open(path, Tick, "w").close()
+
+        with recordfile.open(path, Tick) as rf:
+            with pytest.raises(io.UnsupportedOperation):
+                rf.append(TICKS[0])
+            with pytest.raises(io.UnsupportedOperation):
+                rf.extend(TICKS)
+
+    def test_wrong_class(self, path):
+        """
+        Only instances of exactly cls can be appended.
+        """
+        with recordfile.open(path, Tick, "w") as rf:
+            with pytest.raises(TypeError):
+                rf.append(Point(1, 2.0))
+            with pytest.raises(TypeError):
+                rf.extend([TICKS[0], Point(1, 2.0)])
+
+            assert 0 == len(rf)
+
+    def test_other_layout(self, path):
+        """
+        Files of other classes or other files raise ValueErrors.
+        """
+        recordfile.open(path, Tick, "w").close()
+
+        with pytest.raises(ValueError, match="doesn't contain records"):
+            recordfile.open(path, Point)
+
+        with io.open(path, "wb") as f:
+            f.write(b"not a record file")
+
+        with pytest.raises(ValueError, match="not a record file"):
+            recordfile.open(path, Tick)
+
+    def test_truncated(self, path):
+        """
+        Files that end with an incomplete record raise a ValueError.
+        """
+        with recordfile.open(path, Point, "w") as rf:
+            rf.append(Point(1, 2.0))
+
+        with io.open(path, "ab") as f:
+            f.write(b"\x00")
+
+        with pytest.raises(ValueError, match="incomplete record"):
+            recordfile.open(path, Point)
+
+    def test_invalid(self, path):
+        """
+        Invalid modes, missing files, and empty classes raise errors.
+        """
+
+        @attr.s
+        class E(object):
+            pass
+
+        with pytest.raises(ValueError, match="Invalid mode"):
+            recordfile.open(path, Point, "x")
+        with pytest.raises(ValueError, match="no space"):
+            recordfile.open(path, E, "w")
+        with pytest.raises(EnvironmentError):
+            recordfile.open(path, Point)
+
+        assert not os.path.exists(path)
@@ -0,0 +1,190 @@
+"""
+Tests for `attr.serializers`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from datetime import date, datetime
+
+import pytest
+
+import attr
+
+from attr.serializers import Registry
+
+
+def iso(inst, field, value):
+    """
+    Serialize dates.
+    """
+    return value.isoformat()
+
+
+@attr.s
+class C(object):
+    x = attr.ib(type=int)
+    y = attr.ib()
+
+
+class TestRegistry(object):
+    """
+    Tests for `Registry`.
+    """
+
+    def test_dispatch_exact(self):
+        """
+        Hooks are found by the exact type.
+        """
+        r = Registry()
+        r.register(date, iso)
+
+        assert iso is r.dispatch(date)
+        assert None is r.dispatch(int)
+
+    def test_dispatch_mro(self):
+        """
+        Hooks for base classes are used for subclasses, the most specific
+        hook wins.
+        """
+        r = Registry()
+
+        def obj(inst, field, value):
+            pass
+
+        r.register(object, obj)
+        r.register(date, iso)
+
+        assert iso is r.dispatch(datetime)
+        assert obj is r.dispatch(int)
+
+    def test_register_clears_cache(self):
+        """
+        Registering invalidates cached lookups.
+        """
+        r = Registry()
+
+        assert None is r.dispatch(datetime)
+
+        r.register(date, iso)
+
+        assert iso is r.dispatch(datetime)
+
+    def test_register_only_classes(self):
+        """
+        Registering for something else than a class raises a TypeError.
+        """
+        r = Registry()
+
+        with pytest.raises(TypeError) as e:
+            r.register("date", iso)
+
+        assert ("Hooks can only be registered for classes.",) == e.value.args
+
+    def test_call(self):
+        """
+        Registries can be called like a value_serializer.
+        """
+        r = Registry()
+        r.register(date, iso)
+
+        assert "2020-07-01" == r(None, None, date(2020, 7, 1))
+        assert 42 == r(None, None, 42)
+
+    def test_unhooked_fields(self):
+        """
+        Fields whose type is a class unrelated to all registered types don't
+        need hooks.  The result is recomputed after registering.
+        """
+        r = Registry()
+        r.register(date, iso)
+
+        assert frozenset(["x"]) == r._unhooked_fields(C)
+        assert r._unhooked_fields(C) is r._unhooked_fields(C)
+
+        r.register(bool, iso)
+
+        assert frozenset() == r._unhooked_fields(C)
+
+    def test_not_cached_on_classes(self):
+        """
+        The class cache of serialized classes doesn't keep the registry
+        alive.
+        """
+        r = Registry()
+        r.register(date, iso)
+        attr.asdict(C(date(2020, 7, 1), 2), value_serializer=r)
+
+        assert r not in C.__dict__["__attrs_cache__"]
+        assert r not in C.__dict__["__attrs_cache__"].values()
+
+    def test_repr(self):
+        """
+        Registries have a useful repr.
+        """
+        r = Registry()
+        r.register(date, iso)
+
+        assert "<attr.serializers.Registry with 1 hooks>" == repr(r)
+
+    def test_default_registry(self):
+        """
+        The module-level functions work on the default registry.
+        """
+        assert attr.serializers.registry.register == attr.serializers.register
+        assert attr.serializers.registry.dispatch == attr.serializers.dispatch
+
+
+class TestAsDict(object):
+    """
+    Tests for registries as value_serializer of `attr.asdict`.
+    """
+
+    def test_hooks(self):
+        """
+        Hooks are applied to fields, collection elements, and dict keys and
+        values.
+        """
+        r = Registry()
+        r.register(date, iso)
+        d = date(2020, 7, 1)
+
+        assert {
+            "x": 1,
+            "y": {
+                "x": 2,
+                "y": [d.isoformat(), {d.isoformat(): d.isoformat()}],
+            },
+        } == attr.asdict(C(1, C(2, [d, {d: d}])), value_serializer=r)
+
+    def test_no_calls_without_hooks(self):
+        """
+        Values without a hook are neither passed to hooks nor to the
+        registry.
+        """
+        calls = []
+
+        class Recording(Registry):
+            def dispatch(self, cls):
+                calls.append(cls)
+                return Registry.dispatch(self, cls)
+
+        r = Recording()
+        r.register(date, iso)
+
+        attr.asdict(C(1, [2, 3, "s"]), value_serializer=r)
+        attr.asdict(C(1, [2, 3, "s"]), value_serializer=r)
+
+        assert [list, int, str] == calls
+
+    def test_unhooked_fields(self):
+        """
+        Fields whose types can't have a hook are not looked at.
+        """
+        r = Registry()
+        r.register(date, iso)
+
+        d = date(2020, 7, 1)
+
+        assert {"x": d, "y": d.isoformat()} == attr.asdict(
+            C(d, d), value_serializer=r
+        )
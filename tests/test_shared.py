@@ -0,0 +1,145 @@
+"""
+Tests for `attr.shared`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import multiprocessing
+import pickle
+
+import pytest
+
+import attr
+
+from attr import shared
+
+
+pytest.importorskip("multiprocessing.shared_memory")
+
+
+@attr.s(frozen=True)
+class Point(object):
+    x = attr.ib(type=int)
+    y = attr.ib(type=float)
+
+
+@attr.s(frozen=True, slots=True)
+class Entry(object):
+    key = attr.ib(type=bytes, metadata={"binary_format": "8s"})
+    at = attr.ib(type=Point)
+
+
+ENTRIES = [Entry(b"key%05d" % (i,), Point(i, i / 4)) for i in range(10)]
+
+
+@pytest.fixture
+def records():
+    rv = shared.create(Entry, iter(ENTRIES))
+    yield rv
+    rv.close()
+    rv.unlink()
+
+
+def sum_x(records):
+    """
+    Sum the x coordinates in a worker.
+    """
+    return sum(e.at.x for e in records)
+
+
+class TestSharedRecords(object):
+    """
+    Tests for `create`, `attach`, and `SharedRecords`.
+    """
+
+    def test_views(self, records):
+        """
+        Records are read-only views that compare equal to the instances.
+        """
+        assert 10 == len(records)
+        assert ENTRIES == list(records)
+        assert ENTRIES[3] == records[3]
+        assert ENTRIES[-1] == records[-1]
+        assert 3 == records[3].at.x
+        assert ENTRIES[4] == records.read(4)
+        assert Entry is records.read(4).__class__
+        with pytest.raises(AttributeError):
+            records[0].key = b"x"
+        with pytest.raises(IndexError):
+            records[10]
+        with pytest.raises(IndexError):
+            records[-11]
+
+    def test_repr(self, records):
+        """
+        The repr contains the length, the class, and the name.
+        """
+        assert "<attr.shared.SharedRecords of 10 Entry records in %r>" % (
+            records.name,
+        ) == repr(records)
+
+    def test_attach(self, records):
+        """
+        Other handles can attach by name or by unpickling.
+        """
+        with shared.attach(records.name, Entry) as other:
+            assert ENTRIES == list(other)
+
+        with pickle.loads(pickle.dumps(records)) as other:
+            assert records.name == other.name
+            assert ENTRIES == list(other)
+
+    def test_workers(self, records):
+        """
+        Spawned workers see the records.
+        """
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(2) as pool:
+            assert [45, 45] == pool.map(sum_x, [records, records])
+
+    def test_other_class(self, records):
+        """
+        Attaching with another class raises a ValueError.
+        """
+        with pytest.raises(ValueError, match="doesn't contain records"):
+            shared.attach(records.name, Point)
+
+    def test_not_records(self):
+        """
+        Attaching to other shared memory raises a ValueError.
+        """
+        from multiprocessing.shared_memory import SharedMemory
+
+        shm = SharedMemory(create=True, size=64)
+        try:
+            with pytest.raises(ValueError, match="doesn't contain shared"):
+                shared.attach(shm.name, Point)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_invalid(self):
+        """
+        Instances of other classes and empty classes raise errors.
+        """
+
+        @attr.s
+        class E(object):
+            pass
+
+        with pytest.raises(TypeError):
+            shared.create(Point, [Point(1, 2.0), ENTRIES[0]])
+        with pytest.raises(ValueError, match="no space"):
+            shared.create(E, [E()])
+
+    def test_empty(self):
+        """
+        Empty records work.
+        """
+        records = shared.create(Point, [])
+        try:
+            assert 0 == len(records)
+            assert [] == list(shared.attach(records.name, Point))
+        finally:
+            records.close()
+            records.unlink()
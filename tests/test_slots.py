@@ -690,6 +690,194 @@ class TestPickle(object):
         assert None is not getattr(cls, "__getstate__", None)
         assert None is not getattr(cls, "__setstate__", None)
 
+    def test_state_is_tuple(self):
+        """
+        The state is a tuple of the field values in definition order.
+        """
+        assert (1, 2) == C1Slots(1, 2).__getstate__()
+        assert () == attr.make_class("E", {}, slots=True)().__getstate__()
+
+    def test_setstate_mismatch(self):
+        """
+        States with a different number of values than there are fields are
+        restored by name as far as possible.
+        """
+        i = C1Slots.__new__(C1Slots)
+        i.__setstate__((42,))
+
+        assert 42 == i.x
+        assert not hasattr(i, "y")
+
+    @pytest.mark.parametrize("frozen", [True, False])
+    def test_setstate_bypasses_setattr(self, frozen):
+        """
+        __setstate__ works with frozen classes and doesn't run on_setattr
+        hooks, and resets the hash cache.
+        """
+        calls = []
+
+        def hook(inst, attribute, value):
+            calls.append(value)
+            return value
+
+        kw = {"frozen": True} if frozen else {"on_setattr": hook}
+
+        @attr.s(slots=True, hash=True, cache_hash=True, **kw)
+        class C(object):
+            x = attr.ib()
+
+        i = C(1)
+        hash(i)
+        i2 = C.__new__(C)
+        i2.__setstate__(i.__getstate__())
+
+        assert i == i2
+        assert None is i2._attrs_cached_hash
+        assert [] == calls
+
+
+@attr.s(slots=True)
+class SlottedBase(object):
+    x = attr.ib()
+
+
+@attr.s(getstate_setstate=True)
+class DictFromSlotted(SlottedBase):
+    y = attr.ib()
+
+
+@attr.s(getstate_setstate=True, hash=True, cache_hash=True)
+class C2Hashed(object):
+    x = attr.ib()
+    y = attr.ib()
+
+
+class TestDictPickle(object):
+    """
+    Tests for the compact state of dict classes.
+    """
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_roundtrip(self, protocol):
+        """
+        Dict classes round-trip with all protocols and reset the hash
+        cache.
+        """
+        i = C2Hashed(1, (2,))
+        h = hash(i)
+        i2 = pickle.loads(pickle.dumps(i, protocol))
+
+        assert i == i2
+        assert None is i2._attrs_cached_hash
+        assert h == hash(i2)
+
+    def test_compact(self):
+        """
+        The state contains neither attribute names nor attributes that aren't
+        fields.
+        """
+        i = C2(1)
+        i.junk = 42
+
+        assert (1,) == i.__getstate__()
+        assert not hasattr(pickle.loads(pickle.dumps(i)), "junk")
+        assert len(pickle.dumps(i)) < len(pickle.dumps(C1(1, 2)))
+
+    def test_writes_dict(self):
+        """
+        The state is written directly into the instance dict, bypassing
+        __setattr__.
+        """
+
+        @attr.s(getstate_setstate=True, frozen=True)
+        class C(object):
+            x = attr.ib()
+
+        i = C.__new__(C)
+        i.__setstate__((42,))
+
+        assert {"x": 42} == i.__dict__
+
+    def test_slotted_base(self):
+        """
+        Fields that are stored in slots of a base class are set properly.
+        """
+        i = DictFromSlotted(1, 2)
+
+        assert i == pickle.loads(pickle.dumps(i))
+
+
+@pytest.mark.skipif(
+    attr._compat.PickleBuffer is None, reason="Needs pickle protocol 5."
+)
+class TestPickleBuffers(object):
+    """
+    Tests for pickling buffer fields out-of-band.
+    """
+
+    @attr.s(slots=True)
+    class Blob(object):
+        name = attr.ib()
+        data = attr.ib(type=bytes)
+        scratch = attr.ib(type=bytearray, default=None)
+        view = attr.ib(type=memoryview, default=None)
+
+    def test_no_reduce_ex_without_buffers(self):
+        """
+        Classes without buffer fields don't get a __reduce_ex__.
+        """
+        assert "__reduce_ex__" not in C1Slots.__dict__
+        assert "__reduce_ex__" in self.Blob.__dict__
+
+    def test_out_of_band(self):
+        """
+        Large buffers travel out-of-band and are restored to their types.
+        """
+        big = b"x" * attr._make._PICKLE_BUFFER_THRESHOLD
+        i = self.Blob("n", big, bytearray(big), memoryview(b"abc"))
+        buffers = []
+
+        data = pickle.dumps(i, 5, buffer_callback=buffers.append)
+        i2 = pickle.loads(data, buffers=buffers)
+
+        assert 3 == len(buffers)
+        assert len(data) < len(big)
+        assert "n" == i2.name
+        assert big == i2.data
+        assert bytes is type(i2.data)
+        assert bytearray(big) == i2.scratch
+        assert bytearray is type(i2.scratch)
+        assert b"abc" == i2.view.tobytes()
+
+    def test_in_band(self):
+        """
+        Small buffers and values of other types stay in-band and all
+        protocols work.
+        """
+        i = self.Blob("n", b"small", None, None)
+
+        buffers = []
+        data = pickle.dumps(i, 5, buffer_callback=buffers.append)
+
+        assert i == pickle.loads(data, buffers=buffers)
+        assert [] == buffers
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert i == pickle.loads(pickle.dumps(i, protocol))
+
+    def test_subclass(self):
+        """
+        Subclasses with their own fields use their own state.
+        """
+        i = BlobSub("n", b"x", extra=2)
+
+        assert i == pickle.loads(pickle.dumps(i, 5))
+
+
+@attr.s(slots=True)
+class BlobSub(TestPickleBuffers.Blob):
+    extra = attr.ib(default=1)
+
 
 def test_slots_super_property_get():
     """
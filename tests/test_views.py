@@ -0,0 +1,144 @@
+"""
+Tests for `attr._views`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+import attr
+
+from attr.exceptions import NotAnAttrsClassError
+from attr.validators import instance_of
+
+
+@attr.s
+class Address(object):
+    city = attr.ib()
+    zip_code = attr.ib(
+        default="00000", converter=str, metadata={"alias": "zipCode"}
+    )
+
+
+@attr.s
+class User(object):
+    user_id = attr.ib(
+        converter=int, validator=instance_of(int), metadata={"alias": "id"}
+    )
+    address = attr.ib(type=Address)
+    tags = attr.ib(factory=list)
+
+
+DOC = {"id": "42", "address": {"city": "Berlin", "zipCode": 10115}}
+
+
+class TestView(object):
+    """
+    Tests for `view`.
+    """
+
+    def test_lookup(self):
+        """
+        Values are looked up by alias or name, nested dicts become views,
+        and missing keys use the defaults.
+        """
+        v = attr.view(User, DOC)
+
+        assert "42" == v.user_id
+        assert "Berlin" == v.address.city
+        assert 10115 == v.address.zip_code
+        assert [] == v.tags
+        assert v.tags is v.tags
+        assert "00000" == attr.view(Address, {"city": "x"}).zip_code
+
+    def test_lazy(self):
+        """
+        Nothing is looked up before the first access and values are cached
+        afterwards.
+        """
+        d = {}
+        v = attr.view(User, d)
+        d["id"] = 1
+
+        assert 1 == v.user_id
+
+        d["id"] = 2
+
+        assert 1 == v.user_id
+
+    def test_convert_validate(self):
+        """
+        Converters and validators run on first access if asked to.
+        """
+        v = attr.view(User, DOC, convert=True, validate=True)
+
+        assert 42 == v.user_id
+        assert "10115" == v.address.zip_code
+
+        v = attr.view(User, {"id": "x"}, validate=True)
+
+        with pytest.raises(TypeError):
+            v.user_id
+
+    def test_validators_disabled(self):
+        """
+        Globally disabled validators don't run.
+        """
+        attr.set_run_validators(False)
+        try:
+            assert "x" == attr.view(User, {"id": "x"}, validate=True).user_id
+        finally:
+            attr.set_run_validators(True)
+
+    def test_missing(self):
+        """
+        Missing keys without defaults raise an AttributeError.
+        """
+        with pytest.raises(AttributeError) as e:
+            attr.view(User, {}).user_id
+
+        assert ("'id' is missing for the field 'user_id'.",) == e.value.args
+
+    def test_read_only(self):
+        """
+        Views can't be changed.
+        """
+        with pytest.raises(AttributeError):
+            attr.view(User, DOC).user_id = 1
+
+    def test_repr(self):
+        """
+        The repr shows the class and the mapping.
+        """
+        assert "<attr.view of Address on {'city': 'x'}>" == repr(
+            attr.view(Address, {"city": "x"})
+        )
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            attr.view(object, {})
+
+
+class TestImport(object):
+    """
+    Tests for importing `attr._views`.
+    """
+
+    def test_access(self):
+        """
+        attr.view is the function from attr._views.
+        """
+        from attr._views import view
+
+        assert view is attr.view
+        assert "view" in attr.__all__
+
+    def test_unknown(self):
+        """
+        Unknown attributes still raise AttributeErrors.
+        """
+        with pytest.raises(AttributeError, match="no attribute 'nope'"):
+            attr.nope
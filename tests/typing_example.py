@@ -249,3 +249,26 @@ class NGFrozen:
 @attr.s(collect_by_mro=True)
 class MRO:
     pass
+
+
+# Serialization
+@attr.s(auto_attribs=True)
+class Node:
+    value: int = 0
+
+
+nd: Dict[str, Any] = attr.asdict(Node(), memoize=True)
+
+registry = attr.serializers.Registry()
+registry.register(re.Pattern, lambda inst, a, v: v.pattern)
+attr.serializers.register(set, lambda inst, a, v: sorted(v))
+nd = attr.asdict(Node(), value_serializer=registry)
+
+changes: Dict[str, Any] = attr.diff(Node(), Node(1), recurse=True)
+n: Node = attr.patch(Node(), changes)
+n = attr.from_dict(Node, {"value": 1})
+
+nd = attr.asdict(Node(), omit_defaults=True)
+nt: Tuple[Any, ...] = attr.astuple(Node(), omit_defaults=True)
+
+Picklable = attr.make_class("Picklable", ["x"], picklable=True)